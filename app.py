@@ -36,19 +36,53 @@ r"""
 """
 
 import tkinter as tk
-import docker, sys
+import sys, threading, time
 from tkinter import messagebox
 from pathlib import Path
-import sv_ttk
 
 # Import our modules
 import core.config_manager as config_manager
-from core import docker_ops, system_ops
+from core import system_ops
 from utils.lock_manager import OperationLock
+from utils.task_pool import TaskPool
+from utils.instrumentation import INSTRUMENTATION
 from gui import assets
-from gui.main_window import MainWindow
-from gui.node_window import NodeWindow
 from gui.startup_window import choose_project_popup
+from gui.compose_window import ComposeProgressWindow
+
+# Modules depending on docker-py or asyncio (~0.5 s to import), bound by import_backend()
+docker = docker_ops = ContainerEventWatcher = QdiscPoller = ExecSessionPool = None
+AsyncDockerBackend = socket_path_from_env = StatsMonitor = MainWindow = NodeWindow = None
+
+def import_backend():
+    r"""
+    \brief Import the docker-py and asyncio dependent modules, run in background while the project picker is shown
+
+    Calling it again once the modules are loaded costs nothing.
+    """
+    global docker, docker_ops, ContainerEventWatcher, QdiscPoller, ExecSessionPool
+    global AsyncDockerBackend, socket_path_from_env, StatsMonitor, MainWindow, NodeWindow
+    import docker as _docker
+    from core import docker_ops as _docker_ops
+    from core.event_watcher import ContainerEventWatcher as _ContainerEventWatcher
+    from core.qdisc_poller import QdiscPoller as _QdiscPoller
+    from core.exec_session import ExecSessionPool as _ExecSessionPool
+    from core.async_docker import AsyncDockerBackend as _AsyncDockerBackend, socket_path_from_env as _socket_path_from_env
+    from core.stats_monitor import StatsMonitor as _StatsMonitor
+    from gui.main_window import MainWindow as _MainWindow
+    from gui.node_window import NodeWindow as _NodeWindow
+    docker, docker_ops, ContainerEventWatcher = _docker, _docker_ops, _ContainerEventWatcher
+    QdiscPoller, ExecSessionPool = _QdiscPoller, _ExecSessionPool
+    AsyncDockerBackend, socket_path_from_env, StatsMonitor = _AsyncDockerBackend, _socket_path_from_env, _StatsMonitor
+    MainWindow, NodeWindow = _MainWindow, _NodeWindow
+
+def _warm_up():
+    # Startup work that does not need the user's answer
+    try:
+        import_backend()
+        system_ops.compose_binary()
+    except Exception:
+        pass  # raised again, and reported, by _run_startup
 
 
 class DTGApp:
@@ -64,6 +98,10 @@ class DTGApp:
     - Active docker-compose file.
     - List of open windows.
     - Lock for asynchronous operations.
+    - Bounded worker pool running every blocking Docker operation.
+    - Docker events watcher that keeps the container list up to date.
+    - Stats monitor following the resource usage of running containers.
+    - Poller of the netem qdisc counters.
     """
     
     def __init__(self, root):
@@ -74,20 +112,30 @@ class DTGApp:
         self.open_windows = {}
         self.open_terminals = {}
         self.lock_manager = OperationLock()
+        self.settings = config_manager.load_settings()
+        INSTRUMENTATION.enabled = self.settings["instrumentation"]
+
+        # Heavy imports and the compose probe overlap with the project picker
+        threading.Thread(target=_warm_up, name="dtg-warm-up", daemon=True).start()
+
+        self.task_pool = TaskPool(max_workers=max(1, self.settings["max_workers"]))
         self.project_name = None
         self.compose_file = None
         self.client = None
-
-        # Icons
-        self.running_icon = assets.load_image(assets.IMAGE_DIR / "running.png")
-        self.exited_icon = assets.load_image(assets.IMAGE_DIR / "exited.png")
-        self.other_icon = assets.load_image(assets.IMAGE_DIR / "other.png")
-        self.refresh_icon = assets.load_image(assets.IMAGE_DIR / "refresh.png")
-        self.start_icon = assets.load_image(assets.IMAGE_DIR / "start.png")
-        self.stop_icon = assets.load_image(assets.IMAGE_DIR / "stop.png")
-        self.folder_icon = assets.load_image(assets.IMAGE_DIR / "folder.png")
-        self.open_icon = assets.load_image(assets.IMAGE_DIR / "open.png")
-        self.exit_icon = assets.load_image(assets.IMAGE_DIR / "exit.png")
+        self.event_watcher = None
+        self.async_docker = None
+        self.stats_monitor = None
+        self.qdisc_poller = None
+        self.exec_sessions = None
+        self.compose_future = None
+        self.compose_pool = None
+        self.compose_process = None
+        self.compose_cancelled = False
+        self.compose_window = None
+        self.events_since = None
+
+        # Icons, decoded when first shown
+        self.icons = assets.Icons()
         
         # Main Widget UI
         self.main_window = None
@@ -102,6 +150,7 @@ class DTGApp:
 
         # If all good, start UI
         if self.compose_file:
+            import sv_ttk
             sv_ttk.set_theme("dark")
             self.root.title("DTN & Emulator Control GUI")
 
@@ -111,8 +160,12 @@ class DTGApp:
             self.root.protocol("WM_DELETE_WINDOW", self.on_main_window_close)
             self.root.deiconify()
 
-            # Update window
+            # Update window, then follow state changes through the events stream:
+            # containers created by the running 'compose up' appear as they come up
             self.main_window.refresh_containers()
+            self._start_event_watcher(self.events_since)
+            self.qdisc_poller.start()
+            self.compose_window.lift()
 
     # Invoked by app.py
     def run(self):
@@ -121,9 +174,9 @@ class DTGApp:
     def _run_startup(self):
         # Load icons needed for popup
         icons = {
-            'open': self.open_icon,
-            'folder': self.folder_icon,
-            'exit': self.exit_icon
+            'open': self.icons.open,
+            'folder': self.icons.folder,
+            'exit': self.icons.exit
         }
 
         self.compose_file = choose_project_popup(self.root, icons)
@@ -132,22 +185,145 @@ class DTGApp:
             return
             
         self.compose_file = Path(self.compose_file)
+        import_backend()
+
+        # Latency of every docker_ops/system_ops call, see the Diagnostics window
+        if INSTRUMENTATION.enabled:
+            # functions that only build commands, submit futures or open a stream are not
+            # recorded: their latency is not the one of the operation
+            INSTRUMENTATION.instrument_module(docker_ops, "docker_ops", extra=("_exec_sh",),
+                exclude=("tc_command", "ping_command", "use_exec_sessions", "forget_container",
+                         "submit_tc_bulk", "stream_container_ping"))
+            INSTRUMENTATION.instrument_module(system_ops, "system_ops", exclude=("parse_compose_progress",))
 
-        # Execute Docker-Compose via system_ops
-        system_ops.exec_compose(self.compose_file)
-        
         # Save recent project via config_manager
         config_manager.save_recent_project(self.compose_file)
         self.project_name = self.compose_file.parent.name.lower()
-        self.client = docker.from_env()
+        # Saved configs are read once per project, off the Tk thread
+        self.task_pool.submit(config_manager.get_config_store, self.project_name)
+
+        # Execute Docker-Compose via system_ops in background, its output is
+        # streamed into a progress window while the main window is built
+        self.events_since = int(time.time())
+        self._start_compose_up()
+
+        # The client handshake (API version negotiation) overlaps with 'compose up'
+        self.client = self.task_pool.submit(docker.from_env).result()
+        if INSTRUMENTATION.enabled:
+            INSTRUMENTATION.instrument_client(self.client)
+
+        # Optional asyncio backend for fan-out operations, only over a Unix socket
+        socket_path = socket_path_from_env()
+        if self.settings["async_backend"] and socket_path:
+            self.async_docker = AsyncDockerBackend(socket_path, pool_size=self.task_pool.max_workers)
+
+        # Short commands (interfaces, tc, qdisc stats) through one shell per container
+        if self.settings["exec_sessions"]:
+            self.exec_sessions = ExecSessionPool(self.client, idle_timeout=self.settings["exec_session_idle_s"])
+            docker_ops.use_exec_sessions(self.exec_sessions)
+
+        # Counters of the containers with an open NodeWindow are polled faster
+        self.qdisc_poller = QdiscPoller(
+            self.client, self.task_pool,
+            on_update=lambda name, rates: self.root.after(0, self._on_qdisc_update, name, rates),
+            fast_interval=self.settings["qdisc_poll_fast_ms"] / 1000,
+            slow_interval=self.settings["qdisc_poll_slow_ms"] / 1000
+        )
+
+        # Stats streams live on an event loop, reusing the async backend when enabled
+        if self.settings["stats_enabled"] and socket_path:
+            capacity = max(2, self.settings["stats_history"])
+            if self.async_docker:
+                self.stats_monitor = StatsMonitor(self.async_docker, capacity)
+            else:
+                self.stats_monitor = StatsMonitor(AsyncDockerBackend(socket_path, pool_size=1),
+                                                  capacity, owns_backend=True)
+
+    def _start_compose_up(self):
+        from core.compose_graph import load_service_graph  # loaded by import_backend()
+        try:
+            total = len(load_service_graph(self.compose_file).order)
+        except Exception:
+            total = 0  # invalid file, compose itself reports the error
+
+        self.compose_window = ComposeProgressWindow(self.root, self.project_name, total,
+                                                    on_cancel=self.cancel_compose_up)
+        # Compose can run for minutes (image pulls): it gets its own worker,
+        # so it never holds one of the shared pool
+        self.compose_pool = TaskPool(max_workers=1)
+        self.compose_future = self.compose_pool.submit(
+            system_ops.exec_compose, self.compose_file,
+            on_line=lambda line: self.root.after(0, self._on_compose_line, line),
+            on_start=self._on_compose_started)
+        self.compose_future.add_done_callback(
+            lambda future: self.root.after(0, self._on_compose_done, future))
+
+    def _on_compose_started(self, process):
+        # Runs on the compose worker
+        self.compose_process = process
+        if self.compose_cancelled:
+            system_ops.terminate_compose(process)
+
+    def cancel_compose_up(self):
+        r"""
+        \brief Terminate the running 'docker compose up', returns immediately
+
+        Containers already created by Compose are left as they are.
+        """
+        if self.compose_future is None or self.compose_future.done() or self.compose_cancelled:
+            return
+        self.compose_cancelled = True
+        process = self.compose_process
+        if process is not None:
+            # terminate_compose waits for Compose to exit, keep Tk responsive
+            threading.Thread(target=system_ops.terminate_compose, args=(process,),
+                             name="dtg-compose-cancel", daemon=True).start()
+
+    def _on_compose_line(self, line):
+        if self.compose_window.winfo_exists():
+            self.compose_window.add_line(line)
+
+    def _on_compose_done(self, future):
+        error = future.exception()
+        self.compose_process = None
+        self.compose_pool.shutdown(timeout=0)
+        if self.compose_cancelled:
+            print("compose up cancelled")
+            if self.compose_window.winfo_exists():
+                self.compose_window.finish(cancelled=True)
+        elif self.compose_window.winfo_exists():
+            self.compose_window.finish(error)
+        elif error is not None:
+            messagebox.showerror("Docker Compose error", str(error), parent=self.root)
+        if error is not None and not self.compose_cancelled:
+            print(f"compose up failed: {error}")
+        # Catch up with anything the events stream could not describe (e.g. failed creations)
+        if self.main_window:
+            self.main_window.refresh_containers()
+
+    def _start_event_watcher(self, since):
+        # Watcher callbacks run on its own thread, hand them over to Tk
+        self.event_watcher = ContainerEventWatcher(
+            self.client, self.project_name,
+            on_event=lambda event: self.root.after(0, self.main_window.apply_container_event, event),
+            on_resync=lambda: self.root.after(0, self.main_window.refresh_containers)
+        )
+        self.event_watcher.start(since=since)
+
+    def _on_qdisc_update(self, name, rates):
+        window = self.open_windows.get(name)
+        if window is not None:
+            window.show_qdisc_stats(rates)
+        if self.main_window:
+            self.main_window.schedule_qdisc_summary()
 
     def open_container_window(self, container_name):
         r"""
         \brief Open a new window for the given container.
 
-        This method checks if the container is running, if a window
-        for the container is already open, and if the container is locked.
-        If all checks pass, it creates a new NodeWindow for the container
+        This method checks if the container is running and if a window
+        for the container is already open. A busy container gets its window
+        once its operations are done. If all checks pass, it creates a new NodeWindow for the container
         and tracks it in the open_windows dictionary.
 
         \param container_name The name of the container to open the window for.
@@ -170,13 +346,15 @@ class DTGApp:
             self.open_windows[container_name].focus_force()
             return
 
-        # Check if its locked
+        # Check if its locked: opened once the operations on the container are done
         if self.lock_manager.is_locked(container.id):
-            messagebox.showwarning("Busy", "You can't do that right now!", parent=self.root)
+            self.lock_manager.idle_future(container.id).add_done_callback(
+                lambda f: self.root.after(0, self.open_container_window, container_name))
             return
 
         # Create new window
-        new_window = NodeWindow(self.root, self, container_name)
+        with INSTRUMENTATION.span("gui.open_node_window", container_name):
+            new_window = NodeWindow(self.root, self, container_name)
 
         # Add window to tracker
         self.open_windows[container_name] = new_window
@@ -187,19 +365,91 @@ class DTGApp:
         popup.geometry("250x80")
         popup.resizable(False, False)
         popup.grab_set()
-        tk.Label(popup, text="Stopping containers...\nPlease wait", padx=20, pady=20).pack()
+        popup.status = tk.StringVar(value="Stopping containers...\nPlease wait")
+        tk.Label(popup, textvariable=popup.status, padx=20, pady=20).pack()
         return popup
 
+    def _compose_teardown(self, pool, timeout, on_done, on_progress):
+        # One project-wide 'compose stop', falling back to per-container stops on failure
+        for name in list(self.open_windows):
+            try: self.open_windows[name].force_close()
+            except (tk.TclError, KeyError): pass
+
+        def worker():
+            try:
+                system_ops.compose_stop(self.compose_file, timeout)
+                self.root.after(0, on_done)
+            except Exception as e:
+                print(f"compose stop failed, stopping containers one by one: {e}")
+                self.root.after(0, lambda: self.main_window.stop_all_containers(
+                    on_done=on_done, timeout=timeout, on_progress=on_progress, pool=pool))
+
+        pool.submit(worker)
+
     def on_main_window_close(self):
-        if self.lock_manager.has_active_locks():
+        if self.compose_future and not self.compose_future.done():
+            if self.compose_cancelled:
+                return # already cancelled, exiting as soon as Compose terminates
+            if messagebox.askyesno("Project starting",
+                                   "'docker compose up' is still running.\nCancel it and exit?", parent=self.root):
+                self.cancel_compose_up()
+                self.compose_future.add_done_callback(lambda _: self.root.after(0, self._exit_when_idle))
+        elif self.lock_manager.has_active_locks():
             if self.root.winfo_exists():
                 messagebox.showwarning("Operation running", "Wait for the operations to finish...", parent=self.root)
         else:
             if messagebox.askokcancel("Quit", "Are you sure you want to exit?", parent=self.root):
-                popup = self.show_exiting_popup()
-                def finish_close():
-                    if popup.winfo_exists():
-                        popup.destroy()
-                    self.root.destroy()
-                
-                self.main_window.stop_all_containers(on_done=finish_close)
\ No newline at end of file
+                self._exit()
+
+    def _exit_when_idle(self):
+        # The containers started so far are stopped as in a regular exit
+        if self.lock_manager.has_active_locks():
+            self.root.after(200, self._exit_when_idle)
+        else:
+            self._exit()
+
+    def _exit(self):
+        popup = self.show_exiting_popup()
+        timeout = max(0, self.settings["stop_timeout"])
+        teardown_pool = TaskPool(max_workers=max(1, self.settings["teardown_workers"]))
+
+        def on_progress(stopped, total):
+            if popup.winfo_exists():
+                popup.status.set(f"Stopping containers...\n{stopped}/{total}")
+
+        def destroy_root():
+            if popup.winfo_exists():
+                popup.destroy()
+            self.root.destroy()
+
+        def drain_and_close():
+            # Runs on its own thread: waiting for the pools must not freeze the popup
+            teardown_pool.shutdown(timeout=5)
+            self.task_pool.shutdown(timeout=5)
+            if self.stats_monitor:
+                self.stats_monitor.close()
+            if self.exec_sessions:
+                self.exec_sessions.close()
+            if self.async_docker:
+                self.async_docker.close()
+            config_manager.close_config_stores(timeout=5)
+            if self.settings["instrumentation_export"]:
+                try:
+                    INSTRUMENTATION.export(self.settings["instrumentation_export"])
+                except OSError as e:
+                    print(f"Diagnostics export failed: {e}")
+            self.root.after(0, destroy_root)
+
+        def finish_close():
+            if self.event_watcher:
+                self.event_watcher.stop()
+            self.qdisc_poller.stop()
+            popup.status.set("Closing...\nPlease wait")
+            threading.Thread(target=drain_and_close, name="dtg-close", daemon=True).start()
+        
+        if self.settings["teardown_mode"] == "compose":
+            popup.status.set("Stopping project...\nPlease wait")
+            self._compose_teardown(teardown_pool, timeout, finish_close, on_progress)
+        else:
+            self.main_window.stop_all_containers(on_done=finish_close, timeout=timeout,
+                                                 on_progress=on_progress, pool=teardown_pool)
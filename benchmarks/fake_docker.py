@@ -0,0 +1,342 @@
+r"""
+\file benchmarks/fake_docker.py
+
+\brief In-process fake Docker daemon serving the Engine API on a Unix socket
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+"""
+
+import json, os, re, socketserver, struct, subprocess, threading, time
+from http.server import BaseHTTPRequestHandler
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+class FakeDockerDaemon:
+    r"""
+    \brief Fake Docker daemon simulating a compose project of N containers
+
+    Serves the subset of the Docker Engine API used by DTG (docker-py and
+    core.async_docker) over a Unix socket, so benchmarks need neither Docker nor
+    a network. Every API call sleeps `api_latency` seconds and every exec
+    `exec_latency` seconds, to model a loaded daemon.
+
+    Execs answer the commands run by docker_ops with canned output: interface
+    discovery (`ip -j addr` + `tc -j qdisc`), tc, qdisc statistics and ping.
+    Execs attached to stdin (persistent sessions) run a real local `sh`.
+
+    \param socket_path (str) Path of the Unix socket to listen on
+    \param n_containers (int) Number of containers of the project, all running
+    \param project (str) Compose project name
+    \param api_latency (float) Seconds added to every API call
+    \param exec_latency (float) Seconds added to every exec
+    \param interfaces (int) Number of `eth*` interfaces per container
+    """
+
+    def __init__(self, socket_path: str, n_containers: int = 10, project: str = "bench",
+                 api_latency: float = 0.0, exec_latency: float = 0.0, interfaces: int = 2):
+        self.socket_path = socket_path
+        self.project = project
+        self.api_latency = api_latency
+        self.exec_latency = exec_latency
+        self.interfaces = interfaces
+        self.stats_interval = 1.0
+        self.requests = 0
+        self.lock = threading.Lock()
+        self.execs = {}
+        self.containers = {}
+        for i in range(n_containers):
+            container_id = f"{i + 1:064x}"
+            self.containers[container_id] = {
+                "Id": container_id, "Name": f"/{project}-node{i}-1", "State": "running",
+                "service": f"node{i}", "index": i, "shells": [], "polls": 0,
+            }
+
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        handler = type("Handler", (_Handler,), {"daemon": self})
+        server_class = type("Server", (socketserver.ThreadingUnixStreamServer,),
+                            {"request_queue_size": 256, "daemon_threads": True})
+        self.server = server_class(socket_path, handler)
+        self._thread = threading.Thread(target=self.server.serve_forever, name="fake-dockerd", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"unix://{self.socket_path}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        for container in self.containers.values():
+            self._kill_shells(container)
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def set_state(self, state: str):
+        r"""
+        \brief Force the state of every container, e.g. "exited" before a Start All benchmark
+        """
+        for container in self.containers.values():
+            container["State"] = state
+            if state != "running":
+                self._kill_shells(container)
+
+    def names(self) -> List[str]:
+        return sorted(c["Name"].lstrip("/") for c in self.containers.values())
+
+    def compose_yaml(self) -> str:
+        r"""
+        \brief Compose file of the simulated project, without dependencies
+        """
+        return "services:\n" + "".join(f"  {c['service']}:\n    image: fake\n" for c in self.containers.values())
+
+    # -- model --
+
+    def find(self, ref: str) -> Optional[dict]:
+        for container in self.containers.values():
+            if container["Id"].startswith(ref) or container["Name"].lstrip("/") == ref:
+                return container
+        return None
+
+    def _labels(self, container: dict) -> Dict[str, str]:
+        return {"com.docker.compose.project": self.project,
+                "com.docker.compose.service": container["service"]}
+
+    def _networks(self, container: dict) -> List[str]:
+        # every node is on the default network and on one LAN shared by 10 nodes
+        return [f"{self.project}_default", f"{self.project}_lan{container['index'] // 10}"]
+
+    def summary(self, container: dict) -> dict:
+        running = container["State"] == "running"
+        return {"Id": container["Id"], "Names": [container["Name"]], "State": container["State"],
+                "Status": "Up 1 minute" if running else "Exited (0) 1 minute ago",
+                "Labels": self._labels(container),
+                "NetworkSettings": {"Networks": {name: {} for name in self._networks(container)}}}
+
+    def inspect(self, container: dict) -> dict:
+        running = container["State"] == "running"
+        return {"Id": container["Id"], "Name": container["Name"],
+                "State": {"Status": container["State"], "Running": running, "ExitCode": 0},
+                "Config": {"Labels": self._labels(container)}}
+
+    def _kill_shells(self, container: dict):
+        for proc in container["shells"]:
+            proc.kill()
+        container["shells"] = []
+
+    def exec_output(self, container: dict, cmd: List[str]) -> str:
+        script = " ".join(cmd)
+        i = container["index"]
+        netem = {"kind": "netem", "root": True,
+                 "options": {"limit": 10, "delay": {"delay": 0.02}, "loss-random": {"loss": 0.0}}}
+
+        if "ip -j addr" in script:
+            links = [{"ifname": "lo", "mtu": 65536,
+                      "addr_info": [{"family": "inet", "local": "127.0.0.1", "prefixlen": 8}]}]
+            for n in range(self.interfaces):
+                links.append({"ifname": f"eth{n}", "mtu": 1500, "addr_info": [
+                    {"family": "inet", "local": f"10.{n}.{i // 250}.{i % 250 + 2}", "prefixlen": 16}]})
+            qdiscs = [{"kind": "noqueue", "dev": f"eth{n}", "root": True} for n in range(self.interfaces)]
+            return json.dumps(links) + "\n__DTG_SECTION__\n" + json.dumps(qdiscs)
+        if "tc -s -j qdisc show" in script:
+            container["polls"] += 1
+            k = container["polls"]
+            return json.dumps([dict(netem, dev=f"eth{n}", bytes=k * 15000, packets=k * 10, drops=k,
+                                    overlimits=0, requeues=0, backlog=300, qlen=2)
+                               for n in range(self.interfaces)])
+        if "qdisc show" in script:
+            return json.dumps([{"kind": "noqueue", "dev": f"eth{n}", "root": True} for n in range(self.interfaces)])
+        if "ping" in script:
+            return ("PING 10.0.0.2 (10.0.0.2) 56(84) bytes of data.\n"
+                    "--- 10.0.0.2 ping statistics ---\n"
+                    "3 packets transmitted, 3 received, 0% packet loss, time 400ms\n"
+                    "rtt min/avg/max/mdev = 0.100/0.200/0.300/0.050 ms\n")
+        return ""
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    daemon: FakeDockerDaemon = None
+
+    def log_message(self, *args):
+        pass
+
+    def address_string(self):
+        return "fake"
+
+    def _send(self, status: int, body=None, content_type: str = "application/json"):
+        data = b"" if body is None else (body if isinstance(body, bytes) else json.dumps(body).encode())
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self._route()
+
+    def do_POST(self):
+        self._route()
+
+    def do_DELETE(self):
+        self._route()
+
+    def _route(self):
+        daemon = self.daemon
+        with daemon.lock:
+            daemon.requests += 1
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"null") if length else None
+        path = re.sub(r"^/v[\d.]+", "", self.path.split("?")[0])
+        if daemon.api_latency:
+            time.sleep(daemon.api_latency)
+
+        if path == "/_ping":
+            return self._send(200, b"OK", "text/plain")
+        if path == "/version":
+            return self._send(200, {"ApiVersion": "1.41", "Version": "fake"})
+        if path == "/containers/json":
+            containers = sorted(daemon.containers.values(), key=lambda c: c["Name"])
+            filters = json.loads(parse_qs(urlsplit(self.path).query).get("filters", ["{}"])[0])
+            if filters.get("id"):
+                containers = [c for c in containers if any(c["Id"].startswith(i) for i in filters["id"])]
+            return self._send(200, [daemon.summary(c) for c in containers])
+
+        match = re.match(r"^/containers/([^/]+)/(json|start|stop|restart|kill|exec|stats)$", path)
+        if match:
+            container = daemon.find(match.group(1))
+            if container is None:
+                return self._send(404, {"message": "No such container"})
+            return self._container(container, match.group(2), body or {})
+
+        match = re.match(r"^/exec/([^/]+)/(start|json)$", path)
+        if match:
+            if match.group(1) not in daemon.execs:
+                return self._send(404, {"message": "No such exec"})
+            if match.group(2) == "json":
+                daemon.execs.pop(match.group(1), None)
+                return self._send(200, {"ExitCode": 0, "Running": False})
+            return self._exec_start(*daemon.execs[match.group(1)])
+
+        return self._send(404, {"message": f"page not found: {path}"})
+
+    def _container(self, container: dict, operation: str, body: dict):
+        daemon = self.daemon
+        if operation == "json":
+            return self._send(200, daemon.inspect(container))
+        if operation == "stats":
+            return self._stats(container)
+        if operation == "exec":
+            if container["State"] != "running":
+                return self._send(409, {"message": "Container is not running"})
+            exec_id = os.urandom(16).hex()
+            daemon.execs[exec_id] = (container, body.get("Cmd", []), bool(body.get("AttachStdin")))
+            return self._send(201, {"Id": exec_id})
+        if operation in ("stop", "restart", "kill"):
+            daemon._kill_shells(container)
+        container["State"] = {"start": "running", "restart": "running", "stop": "exited", "kill": "exited"}[operation]
+        return self._send(204)
+
+    def _exec_start(self, container: dict, cmd: List[str], attach_stdin: bool):
+        if attach_stdin:
+            return self._interactive_exec(container, cmd)
+        output = self.daemon.exec_output(container, cmd).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/vnd.docker.raw-stream")
+        self.end_headers()
+        # headers and frames are sent apart, as the daemon does
+        self.wfile.flush()
+        time.sleep(max(self.daemon.exec_latency, 0.002))
+        if output:
+            self.wfile.write(struct.pack(">BxxxL", 1, len(output)) + output)
+        self.close_connection = True
+
+    def _interactive_exec(self, container: dict, cmd: List[str]):
+        # Hijacked connection: a real local shell, stdin from the socket and output as frames
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        container["shells"].append(proc)
+        self.send_response(101)
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Upgrade", "tcp")
+        self.end_headers()
+        self.wfile.flush()
+
+        def pump_stdin():
+            try:
+                while True:
+                    data = self.rfile.read1(65536)
+                    if not data:
+                        break
+                    proc.stdin.write(data)
+                    proc.stdin.flush()
+            except (OSError, ValueError):
+                pass
+            try: proc.stdin.close()
+            except OSError: pass
+
+        threading.Thread(target=pump_stdin, daemon=True).start()
+        while True:
+            output = proc.stdout.read1(65536)
+            if not output:
+                break
+            self.wfile.write(struct.pack(">BxxxL", 1, len(output)) + output)
+            self.wfile.flush()
+        self.close_connection = True
+
+    def _stats(self, container: dict):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        n = 0
+        try:
+            while container["State"] == "running":
+                n += 1
+                sample = {
+                    "cpu_stats": {"cpu_usage": {"total_usage": n * 5_000_000},
+                                  "system_cpu_usage": n * 100_000_000, "online_cpus": 2},
+                    "precpu_stats": {"cpu_usage": {"total_usage": (n - 1) * 5_000_000},
+                                     "system_cpu_usage": (n - 1) * 100_000_000},
+                    "memory_stats": {"usage": 50_000_000 + n * 1000, "limit": 2_000_000_000,
+                                     "stats": {"inactive_file": 1000}},
+                    "networks": {"eth0": {"rx_bytes": n * 10_000, "tx_bytes": n * 5_000}},
+                }
+                data = json.dumps(sample).encode() + b"\n"
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+                self.wfile.flush()
+                time.sleep(self.daemon.stats_interval)
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        self.close_connection = True
@@ -0,0 +1,288 @@
+r"""
+\file benchmarks/run_benchmarks.py
+
+\brief Scale benchmarks of the Docker operations against a fake daemon
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+
+Usage (from the repository root):
+
+    python benchmarks/run_benchmarks.py --sizes 10 100 500 --output results.json
+    python benchmarks/run_benchmarks.py --baseline results.json   # exit code 1 on regressions
+
+No Docker daemon nor network is needed, see benchmarks/fake_docker.py.
+"""
+
+import argparse, json, os, platform, statistics, sys, tempfile, threading, time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import docker
+
+from benchmarks.fake_docker import FakeDockerDaemon
+from core import compose_graph, docker_ops
+from core.container_index import ContainerIndex, GROUP_MODES
+from utils.lock_manager import OperationLock
+from utils.task_pool import TaskPool
+
+def summarize(samples):
+    r"""
+    \brief Latency statistics in milliseconds of a list of durations in seconds
+    """
+    ms = sorted(s * 1000 for s in samples)
+    return {
+        "n": len(ms),
+        "mean_ms": round(statistics.fmean(ms), 3),
+        "median_ms": round(statistics.median(ms), 3),
+        "p95_ms": round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 3),
+        "min_ms": round(ms[0], 3),
+        "max_ms": round(ms[-1], 3),
+    }
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+def wait_futures(futures):
+    for future in futures:
+        future.result()
+
+def bench_refresh_containers(daemon, client, workers, repeat):
+    # MainWindow needs a Tk display, a minimal controller is enough to drive it
+    if platform.system() == "Linux" and not os.environ.get("DISPLAY"):
+        return {"skipped": "no display"}
+    try:
+        import tkinter as tk
+        from gui.main_window import MainWindow
+        from utils.lock_manager import OperationLock
+        root = tk.Tk()
+    except Exception as e:
+        return {"skipped": str(e)}
+
+    icon = tk.PhotoImage(width=1, height=1)
+    controller = SimpleNamespace(
+        client=client, project_name=daemon.project, lock_manager=OperationLock(),
+        task_pool=TaskPool(workers), event_watcher=None, stats_monitor=None,
+        qdisc_poller=SimpleNamespace(sync=lambda running: None, all_latest=dict),
+        open_windows={}, open_terminals={}, async_docker=None, settings={},
+        icons=SimpleNamespace(**{name: icon for name in ("running", "exited", "other", "refresh", "start", "stop")})
+    )
+    try:
+        window = MainWindow(root, controller)
+
+        def refresh_and_wait():
+            # the query runs in the pool, the rows are applied by the Tk loop
+            window.refresh_containers()
+            while window.refresher.busy:
+                root.update()
+                time.sleep(0.001)
+        result = timed(refresh_and_wait, repeat)
+    finally:
+        controller.task_pool.shutdown(timeout=1)
+        root.destroy()
+    return result
+
+def bench_filter_containers(daemon, client, repeat):
+    # Index behind the container list: build it, type a filter, then try every grouping
+    containers = docker_ops.list_project_containers(client, daemon.project)
+
+    def type_and_group():
+        index = ContainerIndex()
+        for container in containers:
+            index.update(container)
+        for end in range(1, len("node1") + 1):
+            index.set_filter("node1"[:end])
+            index.rows()
+        index.set_filter("")
+        for mode in GROUP_MODES:
+            index.set_grouping(mode)
+            index.rows()
+    return timed(type_and_group, repeat)
+
+def bench_start_all(daemon, client, workers, repeat):
+    compose_file = Path(tempfile.mkdtemp()) / "docker-compose.yml"
+    compose_file.write_text(daemon.compose_yaml())
+    pool = TaskPool(workers)
+    samples = []
+    try:
+        for _ in range(repeat):
+            daemon.set_state("exited")
+            start = time.perf_counter()
+            graph = compose_graph.load_service_graph(compose_file)
+            containers = docker_ops.list_project_containers(client, daemon.project)
+            done = []
+            finished = threading.Event()
+            starter = compose_graph.DependencyStarter(client, graph, pool)
+            starter.run(containers, [c.name for c in containers],
+                        on_result=lambda name, error: done.append(error),
+                        on_done=lambda results: finished.set())
+            finished.wait()
+            samples.append(time.perf_counter() - start)
+            if any(done):
+                raise RuntimeError(f"Start All failed: {next(e for e in done if e)}")
+    finally:
+        pool.shutdown(timeout=1)
+        daemon.set_state("running")
+    return summarize(samples)
+
+def bench_stop_all(daemon, client, workers, repeat):
+    pool = TaskPool(workers)
+    samples = []
+    try:
+        for _ in range(repeat):
+            daemon.set_state("running")
+            start = time.perf_counter()
+            containers = docker_ops.list_project_containers(client, daemon.project)
+            # queued through the OperationLock, as MainWindow.stop_all_containers does
+            lock = OperationLock()
+            wait_futures([lock.run(c.id, "stop", lambda c=c: pool.submit(
+                              docker_ops.stop_container_by_id, client, c.name, timeout=0))
+                          for c in containers if c.state == "running"])
+            samples.append(time.perf_counter() - start)
+    finally:
+        pool.shutdown(timeout=1)
+        daemon.set_state("running")
+    return summarize(samples)
+
+def run_size(size, args):
+    socket_path = os.path.join(tempfile.mkdtemp(), "docker.sock")
+    daemon = FakeDockerDaemon(socket_path, n_containers=size, api_latency=args.api_latency,
+                              exec_latency=args.exec_latency, interfaces=args.interfaces).start()
+    client = docker.DockerClient(base_url=daemon.base_url)
+    names = daemon.names()
+    sample = names[:min(len(names), args.per_container_sample)]
+    rules = {f"eth{n}": {"delay": "20", "loss": "0", "band": "1.0", "limit": "10"} for n in range(args.interfaces)}
+    results = {}
+
+    try:
+        results["get_project_containers"] = timed(
+            lambda: docker_ops.get_project_containers(client, daemon.project), args.repeat)
+        results["list_project_containers"] = timed(
+            lambda: docker_ops.list_project_containers(client, daemon.project), args.repeat)
+        results["refresh_containers"] = bench_refresh_containers(daemon, client, args.workers, args.repeat)
+        results["filter_containers"] = bench_filter_containers(daemon, client, args.repeat)
+
+        samples = []
+        for name in sample:
+            start = time.perf_counter()
+            docker_ops.get_container_interfaces(client, name)
+            samples.append(time.perf_counter() - start)
+        results["get_container_interfaces"] = summarize(samples)
+
+        samples = []
+        for name in sample:
+            docker_ops.TC_STATE.invalidate(name)
+            start = time.perf_counter()
+            docker_ops.apply_tc_rules(client, name, "eth0", "20", "0", "1.0", "10")
+            samples.append(time.perf_counter() - start)
+        results["apply_tc_rules"] = summarize(samples)
+
+        def apply_everywhere():
+            for name in names:
+                docker_ops.TC_STATE.invalidate(name)
+            docker_ops.apply_tc_bulk(client, {name: rules for name in names}, max_workers=args.workers)
+        results["apply_tc_bulk"] = timed(apply_everywhere, args.repeat)
+
+        results["start_all"] = bench_start_all(daemon, client, args.workers, args.repeat)
+        results["stop_all"] = bench_stop_all(daemon, client, args.workers, args.repeat)
+        results["api_requests"] = daemon.requests
+    finally:
+        client.close()
+        daemon.stop()
+    return results
+
+def compare(baseline, current, threshold):
+    r"""
+    \brief Print the median changes against a previous run
+
+    \return (bool) True if some median got slower than `threshold` (fraction)
+    """
+    regressed = False
+    for size, benches in current["results"].items():
+        for name, stats in benches.items():
+            old = baseline.get("results", {}).get(size, {}).get(name)
+            if not isinstance(stats, dict) or not isinstance(old, dict) or "median_ms" not in stats or "median_ms" not in old:
+                continue
+            change = (stats["median_ms"] - old["median_ms"]) / old["median_ms"] if old["median_ms"] else 0.0
+            flag = ""
+            if change > threshold:
+                flag = "  <-- REGRESSION"
+                regressed = True
+            print(f"{size:>5} {name:<26} {old['median_ms']:>10.2f} -> {stats['median_ms']:>10.2f} ms ({change:+.0%}){flag}")
+    return regressed
+
+def main():
+    parser = argparse.ArgumentParser(description="DTG scale benchmarks against a fake Docker daemon")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500], help="numbers of containers")
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions of each whole-project benchmark")
+    parser.add_argument("--per-container-sample", type=int, default=20,
+                        help="containers used by the per-container benchmarks")
+    parser.add_argument("--workers", type=int, default=8, help="task pool size, as the max_workers setting")
+    parser.add_argument("--interfaces", type=int, default=2, help="eth* interfaces per container")
+    parser.add_argument("--api-latency", type=float, default=0.001, help="seconds added to every API call")
+    parser.add_argument("--exec-latency", type=float, default=0.005, help="seconds added to every exec")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON file to write")
+    parser.add_argument("--baseline", help="previous JSON results to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2, help="median slowdown reported as regression")
+    args = parser.parse_args()
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {k: v for k, v in vars(args).items() if k not in ("output", "baseline")},
+        },
+        "results": {},
+    }
+    for size in args.sizes:
+        print(f"Running benchmarks with {size} containers...")
+        report["results"][str(size)] = run_size(size, args)
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        if compare(baseline, report, args.threshold):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
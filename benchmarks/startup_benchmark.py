@@ -0,0 +1,162 @@
+r"""
+\file benchmarks/startup_benchmark.py
+
+\brief Cold start benchmark, every phase measured in a fresh interpreter
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+
+Usage (from the repository root):
+
+    python benchmarks/startup_benchmark.py --output startup.json
+    python benchmarks/startup_benchmark.py --baseline startup.json   # exit code 1 on regressions
+
+Phases:
+- `import_app`: importing app.py, i.e. what runs before the project picker can be built.
+- `picker_ready`: process start to the project picker (only with a display).
+- `import_backend`: the docker-py dependent modules, loaded while the picker is shown.
+- `compose_probe`: detection of the Docker Compose command (skipped if Compose is missing).
+- `docker_client`: `docker.from_env()` against the fake daemon, overlapped with 'compose up'.
+"""
+
+import argparse, json, os, platform, subprocess, sys, tempfile, time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+PHASES = ("import_app", "picker_ready", "import_backend", "compose_probe", "docker_client")
+
+def child(phase):
+    r"""
+    \brief Run one phase in this (fresh) process and print its duration in seconds, or "skip"
+
+    Nothing but the standard library is imported before the phase starts.
+    """
+    start = time.perf_counter()
+    if phase == "import_app":
+        import app
+    elif phase == "picker_ready":
+        import tkinter as tk
+        try:
+            root = tk.Tk()
+        except tk.TclError:
+            print("skip")
+            return
+        import app
+        reached = []
+        def fake_picker(parent, icons):
+            reached.append(time.perf_counter())
+            return None  # "Exit": DTGApp returns without starting a project
+        app.choose_project_popup = fake_picker
+        app.DTGApp(root)
+        root.destroy()
+        print(reached[0] - start)
+        return
+    elif phase == "import_backend":
+        import app
+        start = time.perf_counter()
+        app.import_backend()
+    elif phase == "compose_probe":
+        from core import system_ops
+        start = time.perf_counter()
+        try:
+            system_ops.compose_binary()
+        except system_ops.ComposeNotFoundError:
+            print("skip")
+            return
+    elif phase == "docker_client":
+        import docker
+        start = time.perf_counter()
+        docker.from_env().close()
+    print(time.perf_counter() - start)
+
+def run_phase(phase, repeat, env):
+    from benchmarks.run_benchmarks import summarize
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, __file__, "--child", phase], cwd=ROOT, env=env,
+                             check=True, capture_output=True, text=True).stdout.split()
+        if not out or out[-1] == "skip":
+            return None
+        samples.append(float(out[-1]))
+    return summarize(samples)
+
+def main():
+    parser = argparse.ArgumentParser(description="DTG cold start benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh processes per phase")
+    parser.add_argument("--api-latency", type=float, default=0.001, help="seconds added to every API call")
+    parser.add_argument("--output", default="startup_results.json", help="JSON file to write")
+    parser.add_argument("--baseline", help="previous JSON results to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2, help="median slowdown reported as regression")
+    parser.add_argument("--child", choices=PHASES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child)
+        return
+
+    from benchmarks.fake_docker import FakeDockerDaemon
+    from benchmarks.run_benchmarks import compare
+    daemon = FakeDockerDaemon(os.path.join(tempfile.mkdtemp(), "docker.sock"), n_containers=1,
+                              api_latency=args.api_latency).start()
+    # No settings nor recent projects of the user are read
+    env = dict(os.environ, DOCKER_HOST=daemon.base_url, HOME=tempfile.mkdtemp(), APPDATA="")
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {k: v for k, v in vars(args).items() if k not in ("output", "baseline", "child")},
+        },
+        "results": {"startup": {}},
+    }
+    try:
+        for phase in PHASES:
+            print(f"Measuring {phase}...")
+            stats = run_phase(phase, args.repeat, env)
+            report["results"]["startup"][phase] = stats if stats else "skipped"
+    finally:
+        daemon.stop()
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        if compare(baseline, report, args.threshold):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+r"""
+\file core/async_docker.py
+
+\brief Asyncio Docker Engine API client over the daemon's Unix socket
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+"""
+import asyncio, json, os, struct, threading
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, urlencode
+
+DEFAULT_SOCKET = "/var/run/docker.sock"
+
+class DockerAPIError(Exception):
+    r"""
+    \brief Error response (status >= 400) returned by the Docker daemon
+    """
+    def __init__(self, status: int, message: str):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+        self.message = message
+
+def socket_path_from_env() -> Optional[str]:
+    r"""
+    \brief Utility function to get the daemon Unix socket path from DOCKER_HOST
+
+    \return (str) The socket path, or None if the daemon is not reachable through a Unix socket
+    """
+    host = os.environ.get("DOCKER_HOST", f"unix://{DEFAULT_SOCKET}")
+    if host.startswith("unix://"):
+        return host[len("unix://"):]
+    return None
+
+class _Connection:
+    # One persistent HTTP/1.1 connection to the daemon
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.reused = False
+
+    def close(self):
+        try: self.writer.close()
+        except Exception: pass
+
+class AsyncDockerClient:
+    r"""
+    \brief Minimal asyncio client of the Docker Engine API
+
+    Requests are sent over a small pool of persistent (keep-alive) HTTP/1.1
+    connections to the daemon Unix socket: at most `pool_size` requests are in
+    flight at the same time, the others wait for a free connection. Only the
+    endpoints used by DTG are implemented. Exec output is read on a dedicated
+    connection, since the daemon hijacks it for the raw stream: at most
+    `exec_limit` of them are open at the same time.
+
+    All the coroutines must run on the same event loop (see AsyncLoopThread).
+
+    \param socket_path (str) Path of the daemon Unix socket
+    \param pool_size (int) Maximum number of concurrent connections
+    \param exec_limit (int) Maximum number of exec commands running at the same time
+    """
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET, pool_size: int = 8, exec_limit: int = 32):
+        self.socket_path = socket_path
+        self.pool_size = pool_size
+        self.exec_limit = exec_limit
+        self._idle: List[_Connection] = []
+        self._slots = None # created lazily, it must belong to the running loop
+        self._exec_slots = None
+
+    # -- connection pool --
+
+    async def _acquire(self) -> _Connection:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.pool_size)
+        await self._slots.acquire()
+        if self._idle:
+            conn = self._idle.pop()
+            conn.reused = True
+            return conn
+        try:
+            return _Connection(*await asyncio.open_unix_connection(self.socket_path))
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _release(self, conn: _Connection, keep_alive: bool):
+        if keep_alive:
+            self._idle.append(conn)
+        else:
+            conn.close()
+        self._slots.release()
+
+    async def close(self):
+        r"""
+        \brief Close every idle connection
+        """
+        while self._idle:
+            self._idle.pop().close()
+
+    # -- HTTP --
+
+    @staticmethod
+    def _encode_request(method: str, path: str, params: Optional[dict], body) -> bytes:
+        if params:
+            path += "?" + urlencode({k: v for k, v in params.items() if v is not None})
+        payload = b"" if body is None else json.dumps(body).encode()
+        head = (f"{method} {path} HTTP/1.1\r\n"
+                "Host: docker\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(payload)}\r\n\r\n")
+        return head.encode() + payload
+
+    @staticmethod
+    async def _read_head(reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str]]:
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Connection closed by the Docker daemon")
+        status = int(status_line.split(b" ", 2)[1])
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+        return status, headers
+
+    @staticmethod
+    async def _iter_body(reader: asyncio.StreamReader, status: int, headers: Dict[str, str]):
+        # Yields the body chunks as they arrive
+        if status in (204, 304) or status < 200:
+            return
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass # trailers
+                    return
+                yield await reader.readexactly(size)
+                await reader.readexactly(2)
+        elif "content-length" in headers:
+            length = int(headers["content-length"])
+            if length:
+                yield await reader.readexactly(length)
+        else:
+            while True:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    return
+                yield chunk
+
+    @staticmethod
+    def _keep_alive(headers: Dict[str, str]) -> bool:
+        if headers.get("connection", "").lower() == "close":
+            return False
+        return "content-length" in headers or headers.get("transfer-encoding", "").lower() == "chunked"
+
+    async def request(self, method: str, path: str, params: Optional[dict] = None, body=None) -> Tuple[int, bytes]:
+        r"""
+        \brief Send a request and read the whole response
+
+        A request sent over a reused connection that the daemon has closed in the
+        meantime is retried once on a new connection.
+
+        \return (tuple) (status, body)
+
+        \throws DockerAPIError If the daemon answers with an error status
+        """
+        data = self._encode_request(method, path, params, body)
+        for attempt in range(2):
+            conn = await self._acquire()
+            keep_alive = False
+            try:
+                conn.writer.write(data)
+                await conn.writer.drain()
+                status, headers = await self._read_head(conn.reader)
+                payload = b"".join([chunk async for chunk in self._iter_body(conn.reader, status, headers)])
+                keep_alive = self._keep_alive(headers)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                if conn.reused and attempt == 0:
+                    continue # stale keep-alive connection
+                raise
+            finally:
+                self._release(conn, keep_alive)
+            break
+
+        if status >= 400:
+            try:
+                message = json.loads(payload).get("message", "")
+            except ValueError:
+                message = payload.decode(errors="replace")
+            raise DockerAPIError(status, message)
+        return status, payload
+
+    async def request_json(self, method: str, path: str, params: Optional[dict] = None, body=None):
+        _, payload = await self.request(method, path, params, body)
+        return json.loads(payload) if payload else None
+
+    async def stream(self, path: str, params: Optional[dict] = None):
+        r"""
+        \brief Async generator of decoded JSON objects of a streaming endpoint (e.g. stats)
+
+        The stream uses its own connection, outside of the pool.
+        """
+        reader, writer = await asyncio.open_unix_connection(self.socket_path)
+        try:
+            writer.write(self._encode_request("GET", path, params, None))
+            await writer.drain()
+            status, headers = await self._read_head(reader)
+            if status >= 400:
+                raise DockerAPIError(status, path)
+            buffer = b""
+            async for chunk in self._iter_body(reader, status, headers):
+                buffer += chunk
+                *lines, buffer = buffer.split(b"\n")
+                for line in lines:
+                    if line.strip():
+                        yield json.loads(line)
+        finally:
+            writer.close()
+
+    # -- containers --
+
+    async def start(self, container_id: str):
+        # 304: already started
+        await self.request("POST", f"/containers/{quote(container_id)}/start")
+
+    async def stop(self, container_id: str, timeout: Optional[int] = None):
+        # 304: already stopped
+        await self.request("POST", f"/containers/{quote(container_id)}/stop", {"t": timeout})
+
+    async def exec(self, container_id: str, cmd: List[str]) -> Tuple[int, bytes]:
+        r"""
+        \brief Run a command inside a container and wait for it
+
+        \return (tuple) (exit code, output): stdout and stderr are merged as in `exec_run`
+        """
+        if self._exec_slots is None:
+            self._exec_slots = asyncio.Semaphore(self.exec_limit)
+        async with self._exec_slots:
+            created = await self.request_json("POST", f"/containers/{quote(container_id)}/exec",
+                                              body={"Cmd": cmd, "AttachStdout": True, "AttachStderr": True})
+            exec_id = created["Id"]
+
+            # The daemon hijacks the connection for the raw stream: never reuse it
+            reader, writer = await asyncio.open_unix_connection(self.socket_path)
+            try:
+                writer.write(self._encode_request("POST", f"/exec/{exec_id}/start", None, {"Detach": False, "Tty": False}))
+                await writer.drain()
+                status, _ = await self._read_head(reader)
+                if status >= 400:
+                    raise DockerAPIError(status, f"exec start failed for {container_id}")
+                output = await _read_multiplexed(reader)
+            finally:
+                writer.close()
+
+        inspect = await self.request_json("GET", f"/exec/{exec_id}/json")
+        return inspect.get("ExitCode"), output
+
+async def _read_multiplexed(reader: asyncio.StreamReader) -> bytes:
+    # Raw stream frames: 8 bytes header (stream type, 3 zero bytes, big endian size) + payload
+    output = bytearray()
+    while True:
+        try:
+            header = await reader.readexactly(8)
+        except asyncio.IncompleteReadError:
+            return bytes(output)
+        _, size = struct.unpack(">BxxxL", header)
+        output += await reader.readexactly(size)
+
+class AsyncLoopThread:
+    r"""
+    \brief Event loop running on a dedicated daemon thread
+
+    Coroutines are submitted from any thread (e.g. the Tk one) and their results are
+    returned as `concurrent.futures.Future`, so they can be combined with TaskPool
+    futures and handed back to Tk through `after`, exactly as worker results.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="dtg-asyncio", daemon=True)
+        self._thread.start()
+
+    def submit(self, coro) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+class AsyncDockerBackend:
+    r"""
+    \brief AsyncDockerClient running on its own AsyncLoopThread
+
+    Coroutines of the client are submitted from any thread and return Futures:
+    fan-out operations (Stop All, bulk tc, connectivity pings) on hundreds of
+    containers are handled by one OS thread, with at most `pool_size` requests in flight.
+
+    \param socket_path (str) Path of the daemon Unix socket
+    \param pool_size (int) Maximum number of concurrent connections
+    """
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET, pool_size: int = 8):
+        self.loop_thread = AsyncLoopThread()
+        self.client = AsyncDockerClient(socket_path, pool_size)
+
+    def submit(self, coro) -> Future:
+        return self.loop_thread.submit(coro)
+
+    def close(self):
+        try:
+            self.submit(self.client.close()).result(timeout=2)
+        except Exception:
+            pass
+        self.loop_thread.stop()
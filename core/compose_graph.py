@@ -0,0 +1,283 @@
+r"""
+\file core/compose_graph.py
+
+\brief Service dependency graph of a compose project and dependency-aware start
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+"""
+
+import threading, time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+import yaml
+from docker.client import DockerClient
+
+from core import docker_ops
+from core.docker_ops import ContainerSummary
+from utils.task_pool import TaskPool, when_all
+
+# Strictness of the compose depends_on conditions, the strictest requested one wins
+CONDITIONS = ("service_started", "service_healthy", "service_completed_successfully")
+
+class ComposeGraphError(Exception):
+    pass
+
+class ServiceGraph:
+    r"""
+    \brief Directed acyclic graph of the `depends_on` relations between compose services
+
+    \param dependencies (dict) service -> {dependency service: condition}
+
+    \throws ComposeGraphError If the dependencies contain a cycle
+    """
+
+    def __init__(self, dependencies: Dict[str, Dict[str, str]]):
+        self.dependencies = dependencies
+        self.dependents = {service: [] for service in dependencies}
+        for service, deps in dependencies.items():
+            for dep in deps:
+                if dep in self.dependents:
+                    self.dependents[dep].append(service)
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        # Kahn's algorithm, whatever is left over is part of a cycle
+        missing = {s: sum(1 for d in deps if d in self.dependencies) for s, deps in self.dependencies.items()}
+        ready = [s for s, n in missing.items() if n == 0]
+        order = []
+        while ready:
+            service = ready.pop()
+            order.append(service)
+            for dependent in self.dependents[service]:
+                missing[dependent] -= 1
+                if missing[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(self.dependencies):
+            cycle = sorted(s for s, n in missing.items() if n > 0)
+            raise ComposeGraphError(f"Circular depends_on between services: {', '.join(cycle)}")
+        return order
+
+    def required_condition(self, service: str) -> Optional[str]:
+        r"""
+        \brief Strictest condition any dependent requires of `service`, None if nobody depends on it
+        """
+        conditions = [self.dependencies[d][service] for d in self.dependents.get(service, [])]
+        if not conditions:
+            return None
+        return max(conditions, key=lambda c: CONDITIONS.index(c) if c in CONDITIONS else 0)
+
+def load_service_graph(compose_file) -> ServiceGraph:
+    r"""
+    \brief Parse the `depends_on` relations of a compose file
+
+    Both the short (list) and the long (mapping with `condition`) syntax are supported.
+
+    \param compose_file (Path or str) Absolute path to .yml/.yaml file.
+
+    \return (ServiceGraph) Dependency graph of the project services
+
+    \throws ComposeGraphError If the file cannot be parsed or the dependencies contain a cycle
+    """
+    try:
+        with open(compose_file, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError) as e:
+        raise ComposeGraphError(f"Can't read {compose_file}:\n{e}")
+
+    services = data.get("services") or {}
+    if not isinstance(services, dict):
+        raise ComposeGraphError(f"{compose_file} has no valid 'services' section")
+
+    dependencies = {}
+    for name, spec in services.items():
+        depends_on = (spec or {}).get("depends_on") or {}
+        if isinstance(depends_on, list):
+            dependencies[name] = {dep: "service_started" for dep in depends_on}
+        elif isinstance(depends_on, dict):
+            dependencies[name] = {dep: (opts or {}).get("condition", "service_started")
+                                  for dep, opts in depends_on.items()}
+        else:
+            raise ComposeGraphError(f"Invalid depends_on for service '{name}'")
+    return ServiceGraph(dependencies)
+
+class DependencyStarter:
+    r"""
+    \brief Start the containers of a project as soon as the services they depend on are ready
+
+    There are no global waves: every service is launched the moment its own dependencies
+    satisfy their condition, so a cold start lasts as long as the critical path of the graph.
+    Services nobody depends on are never waited for. No pool worker sleeps while a
+    dependency gets ready: each readiness check is one inspect request in the pool,
+    and a timer schedules the next one.
+
+    \param client (DockerClient) Docker Client instance
+    \param graph (ServiceGraph) Dependency graph of the project
+    \param pool (TaskPool) Pool running the starts and the readiness checks
+    \param ready_timeout (float) Maximum number of seconds to wait for a dependency condition
+    \param ready_interval (float) Seconds between two readiness checks of a container
+    """
+
+    def __init__(self, client: DockerClient, graph: ServiceGraph, pool: TaskPool,
+                 ready_timeout: float = 120.0, ready_interval: float = 0.5):
+        self.client = client
+        self.graph = graph
+        self.pool = pool
+        self.ready_timeout = ready_timeout
+        self.ready_interval = ready_interval
+        self._lock = threading.Lock()
+
+    def run(self, containers: List[ContainerSummary], to_start: List[str],
+            on_result: Callable[[str, Optional[Exception]], None],
+            on_done: Callable[[Dict[str, Optional[Exception]]], None]):
+        r"""
+        \brief Start `to_start` in dependency order without blocking the caller
+
+        Callbacks run in worker threads, so they must not touch Tk widgets directly.
+
+        \param containers (list) Every container of the project, running ones satisfy dependencies too
+        \param to_start (list) Names of the containers to start
+        \param on_result Called as on_result(name, error) once per container of `to_start`
+        \param on_done Called with {name: error or None} after the last container
+        """
+        self._to_start = set(to_start)
+        self._on_result = on_result
+        self._on_done = on_done
+        self._results = {}
+
+        self._members = {}
+        for container in containers:
+            service = container.service if container.service in self.graph.dependencies else None
+            # Containers outside the compose file have no dependencies, keyed by their own name
+            self._members.setdefault(service or f"container:{container.name}", []).append(container)
+
+        self._waiting = {}
+        for service in self._members:
+            deps = self.graph.dependencies.get(service, {})
+            self._waiting[service] = {d for d in deps if d in self._members}
+
+        if not self._to_start:
+            on_done({})
+            return
+
+        for service, deps in list(self._waiting.items()):
+            if not deps:
+                self._launch(service)
+
+    def _launch(self, service: str):
+        # One future per container, resolved once it is started and ready
+        condition = self.graph.required_condition(service)
+        futures = []
+        for container in self._members[service]:
+            future = Future()
+            futures.append(future)
+            self._submit(self._start_one, container, future, condition)
+        when_all(futures, lambda done: self._service_done(service, done))
+
+    def _submit(self, fn, container: ContainerSummary, future: Future, *args):
+        try:
+            self.pool.submit(fn, container, future, *args)
+        except RuntimeError as e:  # pool shut down
+            self._finish(container, future, e)
+
+    def _start_one(self, container: ContainerSummary, future: Future, condition: Optional[str]):
+        try:
+            if container.name in self._to_start:
+                docker_ops.start_container_by_id(self.client, container.id)
+        except Exception as e:
+            self._finish(container, future, e)
+            return
+        if condition:
+            self._check_ready(container, future, condition, time.monotonic() + self.ready_timeout)
+        else:
+            self._finish(container, future, None)
+
+    def _check_ready(self, container: ContainerSummary, future: Future, condition: str, deadline: float):
+        try:
+            if docker_ops.check_container_ready(self.client, container.id, condition):
+                self._finish(container, future, None)
+                return
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"{container.name} did not reach {condition} within {self.ready_timeout:g} s")
+        except Exception as e:
+            self._finish(container, future, e)
+            return
+        timer = threading.Timer(self.ready_interval, self._submit,
+                                (self._check_ready, container, future, condition, deadline))
+        timer.daemon = True
+        timer.start()
+
+    def _finish(self, container: ContainerSummary, future: Future, error: Optional[Exception]):
+        self._report(container.name, error)
+        if error:
+            future.set_exception(error)
+        else:
+            future.set_result(None)
+
+    def _service_done(self, service: str, futures):
+        failed = any(f.exception() for f in futures)
+        if failed:
+            self._fail_dependents(service, RuntimeError(f"dependency '{service}' failed to start"))
+            return
+
+        launch = []
+        with self._lock:
+            for dependent in self.graph.dependents.get(service, []):
+                waiting = self._waiting.get(dependent)
+                if waiting is not None and service in waiting:
+                    waiting.discard(service)
+                    if not waiting:
+                        launch.append(dependent)
+        for dependent in launch:
+            self._launch(dependent)
+
+    def _fail_dependents(self, service: str, error: Exception):
+        for dependent in self.graph.dependents.get(service, []):
+            with self._lock:
+                if self._waiting.pop(dependent, None) is None:
+                    continue
+            for container in self._members.get(dependent, []):
+                self._report(container.name, error)
+            self._fail_dependents(dependent, error)
+
+    def _report(self, name: str, error: Optional[Exception]):
+        if name not in self._to_start:
+            return
+        with self._lock:
+            if name in self._results:
+                return
+            self._results[name] = error
+            finished = len(self._results) == len(self._to_start)
+        self._on_result(name, error)
+        if finished:
+            self._on_done(dict(self._results))
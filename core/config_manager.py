@@ -34,9 +34,11 @@ r"""
 | ---------- | --------------- | -----------------------------------------------
 | 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
 """
-import sys, json
+import sys, json, threading
 from pathlib import Path
 
+from core.config_store import ConfigStore, config_from_params, params_from_config
+
 APP_NAME = "DTG"
 
 def get_config_dir():
@@ -47,11 +49,55 @@ def get_config_dir():
     else:
         config_path = Path.home() / ".config" / APP_NAME
     
-    config_path.mkdir(parents=True, exist_ok=True)
+    # Created by the first write, so that importing this module touches no disk
     return config_path
 
 CONFIG_DIR = get_config_dir()
 RECENT_PROJECTS_FILE = CONFIG_DIR / "recent_projects.json"
+SETTINGS_FILE = CONFIG_DIR / "settings.json"
+
+# Defaults for every user setting, overridden by SETTINGS_FILE
+DEFAULT_SETTINGS = {
+    "max_workers": 8,   # concurrent Docker operations
+    "ping_matrix_workers": 32,  # concurrent pings of the connectivity matrix
+    "async_backend": False,     # fan-out operations through core.async_docker (Unix socket only)
+    "stop_timeout": 2,          # grace period in seconds before SIGKILL when the app exits
+    "stop_all_timeout": 10,     # grace period in seconds before SIGKILL for the Stop All button
+    "teardown_mode": "parallel",  # "parallel" stops per container, "compose" issues one compose stop
+    "teardown_workers": 32,     # concurrent stops while tearing down the project
+    "stats_enabled": True,      # follow CPU/memory/network stats of running containers
+    "stats_history": 60,        # samples kept per container and series
+    "stats_refresh_ms": 2000,   # refresh period of the stats columns
+    "qdisc_poll_fast_ms": 1000,   # qdisc counters polling period of containers with an open window
+    "qdisc_poll_slow_ms": 15000,  # polling period of every other container, 0 pauses them
+    "exec_sessions": False,     # run short commands through one persistent shell per container
+    "exec_session_idle_s": 60,  # close a shell session after this many idle seconds
+    "instrumentation": True,    # record the latency of every Docker operation (Diagnostics window)
+    "instrumentation_export": "",  # .json or .csv file written at exit, empty to disable
+    "group_by": "none",         # initial grouping of the container list: "none", "service" or "network"
+}
+
+# Settings
+
+def load_settings():
+    r"""
+    \brief Utility function to load user settings, falling back to defaults
+
+    Unknown keys are ignored, missing or invalid ones keep their default value.
+
+    \return (dict) Dictionary of settings
+    """
+    settings = dict(DEFAULT_SETTINGS)
+    if SETTINGS_FILE.exists():
+        try:
+            with open(SETTINGS_FILE, "r") as f:
+                data = json.load(f)
+            for key, default in DEFAULT_SETTINGS.items():
+                if key in data and isinstance(data[key], type(default)):
+                    settings[key] = data[key]
+        except Exception:
+            pass
+    return settings
 
 # Recent projects
 
@@ -81,7 +127,7 @@ def save_recent_project(path):
 
     \return (void)
     """
-    CONFIG_DIR.mkdir(exist_ok=True)
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     projects = load_recent_projects()
 
     # normalize path and add to top of list
@@ -93,9 +139,40 @@ def save_recent_project(path):
         json.dump({"recent_projects": projects[:10]}, f, indent=2)
 
 
+# Saved tc configs, one ConfigStore per project
+
+_STORES = {}
+_STORES_LOCK = threading.Lock()
+
+def get_config_store(project_name):
+    r"""
+    \brief Utility function to get the config store of a project, opened (and cached) on first use
+
+    \param project_name (str) The name of the project
+
+    \return (ConfigStore) The store of CONFIG_DIR/project_name
+    """
+    with _STORES_LOCK:
+        store = _STORES.get(project_name)
+        if store is None:
+            store = _STORES[project_name] = ConfigStore(CONFIG_DIR / project_name)
+        return store
+
+def close_config_stores(timeout=None):
+    r"""
+    \brief Utility function to commit the pending saves of every project, called at exit
+
+    \return (void)
+    """
+    with _STORES_LOCK:
+        stores = list(_STORES.values())
+        _STORES.clear()
+    for store in stores:
+        store.close(timeout)
+
 def load_configs(project_name, container_name):
     r"""
-    \brief Utility function to laod configs for a specific container from file
+    \brief Utility function to laod configs for a specific container from the project store
 
     \param project_name (str) The name of the project
 
@@ -103,55 +180,53 @@ def load_configs(project_name, container_name):
 
     \return (dict) Dictionary of configurations or empty dict
     """
-    project_config_dir = CONFIG_DIR / project_name
-    config_file = project_config_dir / f"{container_name}_config.json"
+    return get_config_store(project_name).get(container_name)
 
-    if config_file.exists():
-        try:
-            with open(config_file, "r") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            pass
-    return {}
 
+def load_project_configs(project_name):
+    r"""
+    \brief Utility function to load the configs of every container of a project
+
+    \param project_name (str) The name of the project
 
-def save_configs(project_name, container_name, interface, delay_spinbox, loss_spinbox, band_spinbox, limit_spinbox, win, config_status, save_btn, all_container_configs):
+    \return (dict) Dictionary {container name: configurations}
+    """
+    return get_config_store(project_name).all()
+
+def load_link_params(project_name, container_name):
     r"""
-    \brief Utility function to laod configs for a specific container to file
+    \brief Utility function to load the saved configs of a container as typed parameters
 
-    It requires project name, container name and the the current spinbox values.
+    \param project_name (str) The name of the project
 
-    \return (dict) Dictionary of configurations or empty dict
+    \param container_name (str) The name of the container
+
+    \return (dict) Dictionary {interface: NetemParams}, invalid configs are skipped
+    """
+    configs = {}
+    for interface, config in load_configs(project_name, container_name).items():
+        params = params_from_config(config)
+        if params is not None:
+            configs[interface] = params
+    return configs
+
+def save_link_config(project_name, container_name, interface, params):
+    r"""
+    \brief Utility function to save the config of one link of a container
+
+    No Tk widget nor thread is involved: the project cache is updated at once and
+    the disk write is committed in background, saves in quick succession being
+    coalesced into one transaction. Safe to call from any thread.
+
+    \param project_name (str) The name of the project
+
+    \param container_name (str) The name of the container
+
+    \param interface (str) The interface name (e.g. eth0)
+
+    \param params (NetemParams) The parameters to save, None deletes the saved config
+
+    \return (Future) Resolved once the config is on disk, holds the exception if the write failed
     """
-    iface_name = interface.split(" - ")[0]
-
-    all_container_configs[iface_name] = {
-        "delay": delay_spinbox.get(),
-        "loss": loss_spinbox.get(),
-        "band": band_spinbox.get(),
-        "limit": limit_spinbox.get()
-    }
-
-    project_config_dir = CONFIG_DIR / project_name
-    project_config_dir.mkdir(parents=True, exist_ok=True)
-    config_file = project_config_dir / f"{container_name}_config.json"
-
-    try:
-        with open(config_file, "w") as f:
-            json.dump(all_container_configs, f, indent=2)
-        
-        config_status[0] = True
-        save_btn.config(text="Saved")
-
-        def revert_save_text():
-            try:
-                if save_btn.winfo_exists():
-                    if config_status[0] == True: 
-                        save_btn.config(text="Save configs")
-            except Exception:
-                pass
-
-        win.after(2000, revert_save_text)
-
-    except Exception:
-        print(f"Error: Failed to save configs for {container_name}")
\ No newline at end of file
+    config = config_from_params(params) if params is not None else None
+    return get_config_store(project_name).put(container_name, interface, config)
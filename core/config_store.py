@@ -0,0 +1,278 @@
+r"""
+\file core/config_store.py
+
+\brief Per-project store of the saved channel emulator configs
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+"""
+
+import json, sqlite3, threading, time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from core.tc_state import NetemParams, normalize_params
+
+# Fields of a saved link config, as produced by the NodeWindow spinboxes
+CONFIG_FIELDS = ("delay", "loss", "band", "limit")
+
+SCHEMA_VERSION = 1
+
+def _format_number(value: float) -> str:
+    # Shortest plain form ("20", "1500.125"), repr only for the rare float needing 16-17 digits
+    text = format(value, ".15g")
+    return text if float(text) == value else repr(value)
+
+def config_from_params(params: NetemParams) -> dict:
+    r"""
+    \brief Utility function to convert typed netem parameters into a stored config
+
+    The conversion is lossless: `params_from_config(config_from_params(p)) == p`
+    for every p returned by normalize_params.
+
+    \return (dict) {"delay", "loss", "band", "limit"} as strings, as applied by docker_ops
+
+    \throws ValueError If the parameters cannot be stored (e.g. NaN)
+    """
+    config = {"delay": _format_number(params.delay), "loss": _format_number(params.loss),
+              "band": _format_number(params.rate), "limit": str(params.limit)}
+    if params_from_config(config) != normalize_params(*params):
+        raise ValueError(f"Netem parameters cannot be stored: {params}")
+    return config
+
+def params_from_config(config: dict) -> Optional[NetemParams]:
+    r"""
+    \brief Utility function to convert a stored config into typed netem parameters
+
+    \return (NetemParams) The parameters, or None if the config holds an invalid value
+    """
+    return normalize_params(*(config.get(field) for field in CONFIG_FIELDS))
+
+class ConfigStore:
+    r"""
+    \brief Saved tc configs of every container of a project, in a single SQLite file
+
+    The whole project is read once into an in-memory cache, every read is then
+    served from memory. Writes update the cache immediately and are committed
+    by a background writer thread (write-behind): a batch is committed once no
+    write arrived for `flush_delay` seconds (or `max_delay` after its first
+    write), in a single transaction, so a link written several times in a row
+    (repeated clicks, auto-save while a value changes) is written once. A transaction is
+    atomic, a crash during a save leaves the previous configs intact.
+
+    Legacy `<container>_config.json` files of the project folder are imported
+    the first time the store is opened, and left untouched.
+
+    \param project_dir (Path) Folder of the project, created on the first write
+    \param flush_delay (float) Quiet seconds after the last write before committing
+    \param max_delay (float) Seconds after the first write of a batch it is committed anyway
+    """
+
+    FILE_NAME = "configs.sqlite3"
+
+    def __init__(self, project_dir, flush_delay: float = 0.3, max_delay: float = 2.0):
+        self.project_dir = Path(project_dir)
+        self.path = self.project_dir / self.FILE_NAME
+        self.flush_delay = flush_delay
+        self.max_delay = max_delay
+
+        self._cache: Dict[str, Dict[str, dict]] = {}
+        self._dirty: Dict[Tuple[str, str], Optional[dict]] = {}  # None deletes the link
+        self._waiters: List[Future] = []
+        self._cond = threading.Condition()
+        self._committing = False
+        self._hurry = False  # set by flush(), skips the batching delay
+        self._last_write = 0.0
+        self._closed = False
+        self._thread = None
+
+        if self.path.exists() or any(self.project_dir.glob("*_config.json")):
+            with self._connect() as conn:
+                self._load(conn)
+            conn.close()
+
+    # Disk side, only used by __init__ and the writer thread
+
+    def _connect(self):
+        self.project_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        # WAL: readers never see a half-committed batch, a crash rolls it back
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS link_configs ("
+            " container TEXT NOT NULL, interface TEXT NOT NULL,"
+            " delay TEXT, loss TEXT, band TEXT, \"limit\" TEXT,"
+            " PRIMARY KEY (container, interface))")
+        return conn
+
+    def _load(self, conn):
+        if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            self._migrate_json(conn)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        for container, interface, *values in conn.execute(
+                "SELECT container, interface, delay, loss, band, \"limit\" FROM link_configs"):
+            self._cache.setdefault(container, {})[interface] = dict(zip(CONFIG_FIELDS, values))
+
+    def _migrate_json(self, conn):
+        for config_file in sorted(self.project_dir.glob("*_config.json")):
+            try:
+                with open(config_file, "r") as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                print(f"Skipping unreadable config file {config_file}")
+                continue
+            container = config_file.name[:-len("_config.json")]
+            conn.executemany(
+                "INSERT OR REPLACE INTO link_configs VALUES (?, ?, ?, ?, ?, ?)",
+                [(container, interface, *(str(config.get(field, "")) for field in CONFIG_FIELDS))
+                 for interface, config in data.items() if isinstance(config, dict)])
+
+    def _writer(self):
+        conn = None
+        while True:
+            with self._cond:
+                while not self._dirty and not self._closed:
+                    self._cond.wait()
+                if not self._dirty:
+                    break
+                # let close-by writes join the batch
+                latest = time.monotonic() + self.max_delay
+                while not (self._closed or self._hurry):
+                    deadline = min(self._last_write + self.flush_delay, latest)
+                    if time.monotonic() >= deadline:
+                        break
+                    self._cond.wait(deadline - time.monotonic())
+                batch, self._dirty = self._dirty, {}
+                waiters, self._waiters = self._waiters, []
+                self._committing, self._hurry = True, False
+
+            try:
+                if conn is None:
+                    conn = self._connect()
+                with conn:  # one transaction for the whole batch
+                    for (container, interface), config in batch.items():
+                        if config is None:
+                            conn.execute("DELETE FROM link_configs WHERE container = ? AND interface = ?",
+                                         (container, interface))
+                        else:
+                            conn.execute("INSERT OR REPLACE INTO link_configs VALUES (?, ?, ?, ?, ?, ?)",
+                                         (container, interface, *(config[field] for field in CONFIG_FIELDS)))
+                for waiter in waiters:
+                    waiter.set_result(len(batch))
+            except Exception as e:
+                print(f"Error: failed to save configs in {self.path}: {e}")
+                for waiter in waiters:
+                    waiter.set_exception(e)
+
+            with self._cond:
+                self._committing = False
+                self._cond.notify_all()
+
+        if conn is not None:
+            conn.close()
+
+    # Cache side, safe from any thread
+
+    def get(self, container: str) -> Dict[str, dict]:
+        r"""
+        \brief Saved configs of one container
+
+        \return (dict) {interface: {"delay", "loss", "band", "limit"}}, empty if none
+        """
+        with self._cond:
+            return {interface: dict(config) for interface, config in self._cache.get(container, {}).items()}
+
+    def all(self) -> Dict[str, Dict[str, dict]]:
+        r"""
+        \brief Saved configs of every container of the project
+
+        \return (dict) {container: {interface: config}}, containers without configs are omitted
+        """
+        with self._cond:
+            return {container: {interface: dict(config) for interface, config in configs.items()}
+                    for container, configs in self._cache.items() if configs}
+
+    def put(self, container: str, interface: str, config: Optional[dict]) -> Future:
+        r"""
+        \brief Save (or, with None, delete) the config of one link
+
+        The cache is updated at once, the disk write is batched in background.
+
+        \param config (dict) Values of CONFIG_FIELDS, stored as strings
+
+        \return (Future) Resolved with the size of the batch once committed,
+        or with the exception if the commit failed
+
+        \throws RuntimeError If the store is closed
+        """
+        if config is not None:
+            config = {field: str(config.get(field, "")) for field in CONFIG_FIELDS}
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("config store is closed")
+            if config is None:
+                self._cache.get(container, {}).pop(interface, None)
+            else:
+                self._cache.setdefault(container, {})[interface] = dict(config)
+            self._dirty[(container, interface)] = config
+            self._last_write = time.monotonic()
+            self._waiters.append(future)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._writer, name="config-store-writer", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+        return future
+
+    def flush(self, timeout: float = None) -> bool:
+        r"""
+        \brief Commit every write made so far without waiting for the batching delay
+
+        \return (bool) False on timeout
+        """
+        with self._cond:
+            self._hurry = bool(self._dirty)
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: not self._dirty and not self._committing, timeout)
+
+    def close(self, timeout: float = None):
+        r"""
+        \brief Commit the pending writes and stop the writer thread
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
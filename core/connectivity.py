@@ -0,0 +1,252 @@
+r"""
+\file core/connectivity.py
+
+\brief All-pairs connectivity tests between the containers of a project
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+"""
+import asyncio, ipaddress, math, re, shlex, threading
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from docker.client import DockerClient
+
+from core import docker_ops
+from core.tc_state import params_from_qdisc
+from utils.task_pool import when_all
+
+# iputils: "4 packets transmitted, 4 received, 0% packet loss, time 3004ms"
+# busybox: "4 packets transmitted, 4 packets received, 0% packet loss"
+_SUMMARY_RE = re.compile(r"(\d+) packets transmitted, (\d+) (?:packets )?received.*?([\d.]+)% packet loss")
+# iputils: "rtt min/avg/max/mdev = 0.045/0.061/0.079/0.012 ms"
+# busybox: "round-trip min/avg/max = 0.045/0.061/0.079 ms"
+_RTT_RE = re.compile(r"min/avg/max(?:/mdev)? = ([\d.]+)/([\d.]+)/([\d.]+)")
+
+class PingStats(NamedTuple):
+    r"""
+    \brief Structured result of a ping
+
+    RTTs are in ms and are None if no reply was received,
+    loss is in % (100 if ping could not run at all).
+    """
+    target: str
+    transmitted: int
+    received: int
+    loss: float
+    rtt_min: Optional[float]
+    rtt_avg: Optional[float]
+    rtt_max: Optional[float]
+    error: Optional[str] = None
+
+def parse_ping_output(target: str, text: str) -> PingStats:
+    r"""
+    \brief Utility function to parse the summary printed by ping (iputils or busybox)
+
+    \param target (str) The pinged address
+
+    \param text (str) Output of the ping command
+
+    \return (PingStats) The parsed result, with an error if no summary is found
+    """
+    summary = _SUMMARY_RE.search(text)
+    if not summary:
+        lines = text.strip().splitlines()
+        return PingStats(target, 0, 0, 100.0, None, None, None, lines[-1] if lines else "no output")
+
+    rtt = _RTT_RE.search(text)
+    rtt_min, rtt_avg, rtt_max = (float(v) for v in rtt.groups()) if rtt else (None, None, None)
+    return PingStats(target, int(summary.group(1)), int(summary.group(2)), float(summary.group(3)),
+                     rtt_min, rtt_avg, rtt_max)
+
+def ping_stats(client: DockerClient, container_id: str, ipaddr: str, count: int = 3, interval: float = 0.2) -> PingStats:
+    r"""
+    \brief Utility function to ping an address from a container and parse the result
+
+    The ping is bounded by a deadline, so an unreachable target costs
+    about `count * interval` seconds instead of ping's default linger time.
+
+    \return (PingStats) The parsed result, errors are reported in `error`
+    """
+    deadline = math.ceil(count * interval) + 1
+    try:
+        result = docker_ops.run_container_ping(client, container_id, ipaddr, count, interval, deadline)
+    except Exception as e:
+        return PingStats(ipaddr, 0, 0, 100.0, None, None, None, str(e))
+    return parse_ping_output(ipaddr, result.output.decode('utf-8', errors='replace'))
+
+async def ping_stats_async(aclient, container_id: str, ipaddr: str, count: int = 3, interval: float = 0.2) -> PingStats:
+    r"""
+    \brief Coroutine version of ping_stats, for the event loop of an AsyncDockerBackend
+
+    \param aclient (AsyncDockerClient) Client of the backend
+
+    \return (PingStats) The parsed result, errors are reported in `error`
+    """
+    deadline = math.ceil(count * interval) + 1
+    try:
+        _, output = await aclient.exec(container_id, shlex.split(docker_ops.ping_command(ipaddr, count, interval, deadline)))
+    except Exception as e:
+        return PingStats(ipaddr, 0, 0, 100.0, None, None, None, str(e))
+    return parse_ping_output(ipaddr, output.decode('utf-8', errors='replace'))
+
+def choose_target(src: List[docker_ops.NetInterface], dst: List[docker_ops.NetInterface]) -> Optional[str]:
+    r"""
+    \brief Utility function to choose which IPv4 address of `dst` to ping from `src`
+
+    Addresses in a subnet shared with `src` are preferred (direct links),
+    otherwise the first address of `dst` is used (routed path).
+
+    \return (str) The address to ping, None if `dst` has no IPv4 address
+    """
+    src_networks = [ipaddress.ip_interface(cidr).network for iface in src for cidr in iface.ipv4]
+    candidates = [ipaddress.ip_interface(cidr) for iface in dst for cidr in iface.ipv4]
+    for candidate in candidates:
+        if candidate.network in src_networks:
+            return str(candidate.ip)
+    return str(candidates[0].ip) if candidates else None
+
+class ConnectivityMatrix:
+    r"""
+    \brief Results of the ping tests between every ordered pair of nodes
+
+    A run discovers the addresses of every node (one exec per node), then pings
+    every peer from every node through the given executor, whose size bounds the
+    number of pings running at the same time. With an AsyncDockerBackend the pings
+    run as coroutines on its event loop instead, still at most `executor.max_workers`
+    at a time. Nothing blocks while waiting: progress is reported through callbacks,
+    invoked from the worker (or event loop) threads.
+
+    Results are kept between runs together with a fingerprint of the netem
+    parameters installed on both ends, so that a run with `only_changed=True`
+    only re-tests the pairs whose link parameters (or addresses) have changed.
+
+    \param client (DockerClient) Docker Client instance
+    \param executor Executor (e.g. TaskPool) running the discovery and the pings
+    \param count (int) Echo requests per pair
+    \param interval (float) Seconds between echo requests
+    \param backend (AsyncDockerBackend) Backend running the pings, None to run them in the executor
+    """
+
+    def __init__(self, client: DockerClient, executor, count: int = 3, interval: float = 0.2, backend=None):
+        self.client = client
+        self.executor = executor
+        self.count = count
+        self.interval = interval
+        self.backend = backend
+
+        self.nodes = []
+        self.results: Dict[Tuple[str, str], PingStats] = {}
+        self._fingerprints = {}
+        self._lock = threading.Lock()
+        self._ping_slots = None # created lazily on the event loop of the backend
+        self._pending = []
+
+    def run(self, nodes: List[str],
+            on_result: Callable[[str, str, PingStats], None],
+            on_done: Callable[[int], None],
+            only_changed: bool = False):
+        r"""
+        \brief Start a test run, returns immediately
+
+        \param nodes (list) Names of the (running) containers to test
+        \param on_result (callable) Called with (src, dst, PingStats) for every tested pair
+        \param on_done (callable) Called with the number of tested pairs at the end of the run
+        \param only_changed (bool) Skip pairs whose fingerprint did not change since the last run
+        """
+        self.nodes = list(nodes)
+        discovery = {node: self.executor.submit(docker_ops.get_container_interfaces, self.client, node)
+                     for node in self.nodes}
+
+        def on_discovered(_):
+            interfaces = {}
+            for node, future in discovery.items():
+                try:
+                    interfaces[node] = future.result()
+                except Exception:
+                    interfaces[node] = []
+            self._run_pings(interfaces, on_result, on_done, only_changed)
+
+        when_all(discovery.values(), on_discovered)
+
+    def _run_pings(self, interfaces, on_result, on_done, only_changed):
+        node_state = {
+            node: tuple(sorted((iface.name, iface.ipv4, params_from_qdisc(iface.qdisc)) for iface in ifaces))
+            for node, ifaces in interfaces.items()
+        }
+
+        futures = []
+        for src in self.nodes:
+            for dst in self.nodes:
+                if src == dst:
+                    continue
+                target = choose_target(interfaces[src], interfaces[dst])
+                fingerprint = (node_state[src], node_state[dst], target)
+                with self._lock:
+                    unchanged = self._fingerprints.get((src, dst)) == fingerprint and (src, dst) in self.results
+                if only_changed and unchanged:
+                    continue
+
+                if target is None:
+                    self._store(src, dst, fingerprint, PingStats("", 0, 0, 100.0, None, None, None, "no IPv4 address"), on_result)
+                    continue
+                if self.backend is not None:
+                    future = self.backend.submit(self._ping_async(src, target))
+                else:
+                    future = self.executor.submit(ping_stats, self.client, src, target, self.count, self.interval)
+                future.add_done_callback(
+                    lambda f, src=src, dst=dst, fingerprint=fingerprint:
+                        f.cancelled() or self._store(src, dst, fingerprint, f.result(), on_result))
+                futures.append(future)
+
+        with self._lock:
+            self._pending = futures
+        when_all(futures, lambda done: on_done(len(done)))
+
+    async def _ping_async(self, src, target):
+        if self._ping_slots is None:
+            self._ping_slots = asyncio.Semaphore(getattr(self.executor, "max_workers", 8))
+        async with self._ping_slots:
+            return await ping_stats_async(self.backend.client, src, target, self.count, self.interval)
+
+    def cancel(self):
+        r"""
+        \brief Cancel the pings of the current run that have not completed yet
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            future.cancel()
+
+    def _store(self, src, dst, fingerprint, stats, on_result):
+        with self._lock:
+            self.results[(src, dst)] = stats
+            self._fingerprints[(src, dst)] = fingerprint
+        on_result(src, dst, stats)
@@ -0,0 +1,303 @@
+r"""
+\file core/container_index.py
+
+\brief In-memory index of the project containers: incremental filtering and grouping for the container list
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+"""
+
+import bisect
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Filter prefixes, e.g. "relay status:exited net:lan1 label:role=gw"
+FILTER_FIELDS = {"name": "name", "status": "status", "state": "status", "service": "service",
+                 "net": "network", "network": "network", "label": "label"}
+
+# Groupings of the container list
+GROUP_MODES = ("none", "service", "network")
+
+class FilterTerm(NamedTuple):
+    r"""
+    \brief One term of a filter: `value` must be a substring of the container `field`
+    """
+    field: str
+    value: str
+
+class GroupSummary(NamedTuple):
+    r"""
+    \brief Aggregate status of one group of the container list
+
+    `members` is the number of matching containers of the group, `states` counts them
+    by state (unhealthy containers are counted as "unhealthy").
+    """
+    key: str
+    members: int
+    states: Dict[str, int]
+    collapsed: bool
+
+class ViewRow(NamedTuple):
+    r"""
+    \brief One line of the flattened container list
+
+    `iid` is unique in the list: the container name when the list is not grouped,
+    "<group>/<name>" for group members (a container can belong to several networks)
+    and "<group>/" for group headers. `name` is None for group headers,
+    `group` is None when the list is not grouped.
+    """
+    iid: str
+    name: Optional[str]
+    group: Optional[str]
+
+def parse_filter(text: str) -> List[FilterTerm]:
+    r"""
+    \brief Utility function to split a filter string into terms
+
+    Every term must match (case insensitive substrings): bare words match the
+    container name, `status:`, `service:`, `net:` and `label:` prefixes match
+    the other fields, e.g. "relay status:exited label:role=gw".
+
+    \param text (str) The filter as typed by the user
+
+    \return (list) List of FilterTerm, empty to match every container
+    """
+    terms = []
+    for word in text.lower().split():
+        field, sep, value = word.partition(":")
+        if sep and field in FILTER_FIELDS:
+            terms.append(FilterTerm(FILTER_FIELDS[field], value))
+        else:
+            terms.append(FilterTerm("name", word))
+    return terms
+
+def is_refinement(old: List[FilterTerm], new: List[FilterTerm]) -> bool:
+    r"""
+    \brief True if every container matching `new` also matches `old`
+
+    Holds when terms are only extended or appended, as while typing:
+    the new filter only has to scan the matches of the old one.
+    """
+    return len(new) >= len(old) and all(o.field == n.field and o.value in n.value
+                                        for o, n in zip(old, new))
+
+def row_container(iid: str) -> Optional[str]:
+    r"""
+    \brief Container name of a ViewRow iid, None for group headers
+    """
+    return iid.rpartition("/")[2] or None
+
+def _search_keys(container) -> dict:
+    status = container.state + (f" ({container.health})" if container.health else "")
+    return {
+        "name": container.name.lower(),
+        "status": status.lower(),
+        "service": (container.service or "").lower(),
+        "network": tuple(n.lower() for n in container.networks),
+        "label": tuple(f"{k}={v}".lower() for k, v in (container.labels or {}).items()),
+    }
+
+class ContainerIndex:
+    r"""
+    \brief Containers of the project with their search keys, the active filter and grouping
+
+    The matches of the filter are kept as a sorted list of names and maintained
+    incrementally: a container update only re-evaluates that container and typing
+    one more character only rescans the previous matches.
+    The flattened list (group headers followed by their members) is rebuilt
+    lazily, once per batch of changes.
+
+    \param group_by (str) Initial grouping, one of GROUP_MODES
+    """
+
+    def __init__(self, group_by: str = "none"):
+        self._containers = {}   # name -> ContainerSummary
+        self._keys = {}         # name -> lowercase search keys
+        self._terms = []
+        self._matches = []      # sorted names matching the filter
+        self._group_by = group_by if group_by in GROUP_MODES else "none"
+        self._collapsed = set()
+        self._rows = None       # flattened list, None when it must be rebuilt
+        self._groups = {}
+
+    def __len__(self):
+        return len(self._containers)
+
+    def __contains__(self, name):
+        return name in self._containers
+
+    def get(self, name: str):
+        return self._containers.get(name)
+
+    def names(self) -> List[str]:
+        return list(self._containers)
+
+    @property
+    def match_count(self) -> int:
+        return len(self._matches)
+
+    @property
+    def group_by(self) -> str:
+        return self._group_by
+
+    def _match(self, name: str, terms: List[FilterTerm]) -> bool:
+        keys = self._keys[name]
+        for field, value in terms:
+            if field in ("network", "label"):
+                if not any(value in key for key in keys[field]):
+                    return False
+            elif value not in keys[field]:
+                return False
+        return True
+
+    def _is_match(self, name: str) -> bool:
+        i = bisect.bisect_left(self._matches, name)
+        return i < len(self._matches) and self._matches[i] == name
+
+    def update(self, container) -> bool:
+        r"""
+        \brief Add or replace a container (ContainerSummary)
+
+        \return (bool) True if the flattened list changed (membership, grouping or aggregate status)
+        """
+        name = container.name
+        old = self._containers.get(name)
+        self._containers[name] = container
+        self._keys[name] = _search_keys(container)
+
+        was = old is not None and self._is_match(name)
+        now = self._match(name, self._terms)
+        if now and not was:
+            bisect.insort(self._matches, name)
+        elif was and not now:
+            self._matches.remove(name)
+        elif not now or (old.state, old.health, old.service, old.networks) == \
+                (container.state, container.health, container.service, container.networks):
+            return False
+        self._rows = None
+        return True
+
+    def remove(self, name: str) -> bool:
+        r"""
+        \brief Forget a container
+
+        \return (bool) True if the flattened list changed
+        """
+        if self._containers.pop(name, None) is None:
+            return False
+        matched = self._is_match(name)
+        del self._keys[name]
+        if matched:
+            self._matches.remove(name)
+            self._rows = None
+        return matched
+
+    def set_filter(self, text: str) -> bool:
+        r"""
+        \brief Apply a filter string (see parse_filter)
+
+        \return (bool) True if the filter changed
+        """
+        terms = parse_filter(text)
+        if terms == self._terms:
+            return False
+        candidates = self._matches if is_refinement(self._terms, terms) else sorted(self._containers)
+        self._matches = [name for name in candidates if self._match(name, terms)]
+        self._terms = terms
+        self._rows = None
+        return True
+
+    def set_grouping(self, mode: str):
+        r"""
+        \brief Group the list by "service", "network" or not at all ("none")
+
+        \throws ValueError If the mode is not one of GROUP_MODES
+        """
+        if mode not in GROUP_MODES:
+            raise ValueError(f"Unknown grouping '{mode}', expected one of {', '.join(GROUP_MODES)}")
+        if mode != self._group_by:
+            self._group_by = mode
+            self._collapsed.clear()
+            self._rows = None
+
+    def toggle_group(self, key: str):
+        r"""
+        \brief Collapse an expanded group, or expand a collapsed one
+        """
+        self._collapsed ^= {key}
+        self._rows = None
+
+    def group_keys(self, container) -> Tuple[str, ...]:
+        r"""
+        \brief Groups a container belongs to with the current grouping
+        """
+        if self._group_by == "service":
+            return (container.service or "(no service)",)
+        if self._group_by == "network":
+            return container.networks or ("(no network)",)
+        return ()
+
+    def group(self, key: str) -> Optional[GroupSummary]:
+        self.rows()
+        return self._groups.get(key)
+
+    def rows(self) -> List[ViewRow]:
+        r"""
+        \brief The flattened list: matching containers, under their group headers when grouped
+        """
+        if self._rows is None:
+            self._rebuild()
+        return self._rows
+
+    def _rebuild(self):
+        if self._group_by == "none":
+            self._rows = [ViewRow(name, name, None) for name in self._matches]
+            self._groups = {}
+            return
+
+        members = {}
+        for name in self._matches:
+            for key in self.group_keys(self._containers[name]):
+                members.setdefault(key, []).append(name)
+
+        rows, groups = [], {}
+        for key in sorted(members):
+            names = members[key]
+            states = {}
+            for name in names:
+                container = self._containers[name]
+                state = "unhealthy" if container.health == "unhealthy" else container.state
+                states[state] = states.get(state, 0) + 1
+            collapsed = key in self._collapsed
+            groups[key] = GroupSummary(key, len(names), states, collapsed)
+            rows.append(ViewRow(f"{key}/", None, key))
+            if not collapsed:
+                rows.extend(ViewRow(f"{key}/{name}", name, key) for name in names)
+        self._rows, self._groups = rows, groups
@@ -34,12 +34,164 @@ r"""
 | ---------- | --------------- | -----------------------------------------------
 | 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
 """
-import docker
-from typing import List
+import docker, json, shlex, time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from docker.client import DockerClient
 from docker.models.containers import Container
 
+from core.tc_state import NetemParams, TcStateCache, normalize_params, params_from_qdisc
+from core.exec_session import ExecSessionError, ExecSessionPool
+
+# Last known netem parameters per (container name, interface), see apply_tc_rules
+TC_STATE = TcStateCache()
+
+# Optional persistent shell sessions for short commands, see use_exec_sessions
+EXEC_SESSIONS: Optional[ExecSessionPool] = None
+
+# Single exec used by get_container_interfaces, sections are split on _SECTION_MARKER
+_SECTION_MARKER = "__DTG_SECTION__"
+_INTERFACE_DISCOVERY_SCRIPT = (
+    "ip -j addr show 2>/dev/null || { ip -o link show; ip -o addr show; }; "
+    f"echo {_SECTION_MARKER}; "
+    "tc -j qdisc show 2>/dev/null || true"
+)
+
+class ContainerSummary(NamedTuple):
+    r"""
+    \brief Compact description of a container, as returned by list_project_containers
+
+    `state` is the Docker state (running, exited, ...), `health` the health status
+    (None if the container has no healthcheck), `service` the compose service name,
+    `networks` the sorted names of the attached networks and `labels` the container labels.
+    """
+    name: str
+    id: str
+    state: str
+    health: Optional[str]
+    service: Optional[str]
+    networks: Tuple[str, ...] = ()
+    labels: Optional[Dict[str, str]] = None
+
+class TcResult(NamedTuple):
+    r"""
+    \brief Outcome of applying netem rules to one interface
+
+    `status` is "applied", "unchanged" (already installed, nothing executed) or "failed",
+    `output` holds the tc output or error message (if any).
+    """
+    interface: str
+    status: str
+    output: str
+
+class StreamingExec:
+    r"""
+    \brief Command executed inside a container whose output is read line by line while it runs
+
+    The command is wrapped as `sh -c 'echo $$; exec <cmd>'`: the first output line is the
+    PID of the command inside the container, used by stop() to interrupt it with SIGINT
+    (Docker has no API to kill an exec). SIGINT lets commands like ping print their summary.
+
+    \param client (DockerClient) Docker Client instance
+    \param container (Container) The container to run the command in
+    \param cmd (str) The command line to execute
+    """
+
+    def __init__(self, client: DockerClient, container: Container, cmd: str):
+        self.client = client
+        self.container = container
+        self.cmd = cmd
+        self._pid = None
+        self._stop_requested = False
+        self._exec_id = client.api.exec_create(container.id, ["sh", "-c", f"echo $$; exec {cmd}"])["Id"]
+
+    def lines(self):
+        r"""
+        \brief Generator of output lines (stdout and stderr), ends when the command exits
+        """
+        buffer = ""
+        for chunk in self.client.api.exec_start(self._exec_id, stream=True):
+            buffer += chunk.decode('utf-8', errors='replace')
+            *complete, buffer = buffer.split("\n")
+            for line in complete:
+                if self._pid is None:
+                    self._pid = line.strip()
+                    if self._stop_requested:
+                        self.stop()
+                    continue
+                yield line
+        if buffer:
+            yield buffer
+
+    def exit_code(self) -> Optional[int]:
+        r"""
+        \brief Exit code of the command, None while it is still running
+        """
+        return self.client.api.exec_inspect(self._exec_id).get("ExitCode")
+
+    def stop(self):
+        r"""
+        \brief Interrupt the command (SIGINT)
+
+        If the PID is not known yet, the command is interrupted as soon as it is read.
+        """
+        self._stop_requested = True
+        if self._pid and self._pid.isdigit():
+            self.container.exec_run(["kill", "-INT", self._pid])
+
+class NetInterface(NamedTuple):
+    r"""
+    \brief Network interface of a container, as returned by get_container_interfaces
+
+    Addresses are in CIDR notation (e.g. `10.0.0.2/24`), qdisc is the root qdisc
+    of the interface as reported by `tc -j qdisc show` (None if not available).
+    """
+    name: str
+    ipv4: Tuple[str, ...]
+    ipv6: Tuple[str, ...]
+    mtu: Optional[int]
+    qdisc: Optional[dict]
+
+    @property
+    def label(self) -> str:
+        r"""
+        \brief Text shown to the user, e.g. `eth0 - 10.0.0.2/24`
+        """
+        addresses = self.ipv4 or self.ipv6
+        return f"{self.name} - {addresses[0]}" if addresses else self.name
+
+def use_exec_sessions(sessions: Optional[ExecSessionPool]):
+    r"""
+    \brief Route the short commands of docker_ops (interfaces, tc, qdisc stats) through persistent sessions
+
+    \param sessions (ExecSessionPool) Sessions to use, None to go back to one exec per command
+    """
+    global EXEC_SESSIONS
+    EXEC_SESSIONS = sessions
+
+def _exec_sh(client: DockerClient, container_id: str, script: str) -> Tuple[int, bytes]:
+    # Short command: one write on the container session if enabled,
+    # otherwise (or if the session cannot be used) a regular exec
+    if EXEC_SESSIONS is not None:
+        try:
+            return EXEC_SESSIONS.run(container_id, script)
+        except ExecSessionError as e:
+            print(f"Shell session of {container_id} unavailable, falling back to exec: {e}")
+    container = get_container(client, container_id)
+    result = container.exec_run(["sh", "-c", script])
+    return result.exit_code, result.output
+
+def forget_container(container_name: str):
+    r"""
+    \brief Drop the cached netem state and the shell session of a container
+
+    Neither survives a container start, stop or restart.
+    """
+    TC_STATE.invalidate(container_name)
+    if EXEC_SESSIONS is not None:
+        EXEC_SESSIONS.invalidate(container_name)
+
 def get_container(client: DockerClient, container_id: str) -> Container:
     try:
         return client.containers.get(container_id)
@@ -66,45 +218,147 @@ def get_project_containers(client: DockerClient, project_name: str) -> List[Cont
     except Exception as e:
         raise Exception(f"Can't get project containers: {e}")
     
-def get_container_interfaces(client: DockerClient, container_id: str) -> List[str]:
+def list_project_containers(client: DockerClient, project_name: str,
+                            container_ids: Optional[List[str]] = None) -> List[ContainerSummary]:
     r"""
-    \brief Utility function to get interfaces names and associated ips of the specified container
+    \brief Utility function to list the containers of the specified project with a single request
 
-    This function executes commands inside the container 
-    to list network interfaces and retrieve their IP addresses.
+    Unlike get_project_containers, no Container object (and therefore no inspect request
+    per container) is created: everything is read from one `/containers/json` response.
+    
+    \param client (DockerClient) Docker Client instance
+
+    \param project_name (str) The name of the project
+
+    \param container_ids (list) Only list these containers (removed ones are simply missing), None for all
+
+    \return (list) List of ContainerSummary records sorted by name
+
+    \throws Exception If containers cannot be listed
+    """
+    filters = {"label": f"com.docker.compose.project={project_name}"}
+    if container_ids is not None:
+        if not container_ids:
+            return []
+        filters["id"] = list(container_ids)
+    try:
+        entries = client.api.containers(all=True, filters=filters)
+    except Exception as e:
+        raise Exception(f"Can't get project containers: {e}")
+
+    containers = []
+    for entry in entries:
+        names = entry.get("Names") or [entry["Id"]]
+        labels = entry.get("Labels") or {}
+        networks = (entry.get("NetworkSettings") or {}).get("Networks") or {}
+        containers.append(ContainerSummary(
+            names[0].lstrip("/"),
+            entry["Id"],
+            entry.get("State", ""),
+            _parse_health(entry.get("Status", "")),
+            labels.get("com.docker.compose.service"),
+            tuple(sorted(networks)),
+            labels
+        ))
+    return sorted(containers, key=lambda c: c.name)
+
+def _parse_health(status: str) -> Optional[str]:
+    # Health is only reported inside the human readable status,
+    # e.g. "Up 5 minutes (healthy)" or "Up 3 seconds (health: starting)"
+    if "(health: starting)" in status:
+        return "starting"
+    if "(unhealthy)" in status:
+        return "unhealthy"
+    if "(healthy)" in status:
+        return "healthy"
+    return None
+
+def get_container_interfaces(client: DockerClient, container_id: str) -> List[NetInterface]:
+    r"""
+    \brief Utility function to discover the network interfaces of the specified container
+
+    This function runs a single exec inside the container that dumps addresses, MTU
+    and root qdiscs of every interface (`ip -j addr` + `tc -j qdisc`), so the cost
+    of opening a node window does not grow with the number of interfaces.
+    Containers whose `ip` does not support JSON output (e.g. busybox) are handled
+    by falling back to the one-line text format within the same exec.
     
     \param client (DockerClient) Docker Client instance
 
     \param container_id (str) The id of the container
 
-    \return (list) List of {interface_name - ip} entries
+    \return (list) List of NetInterface records, one per `eth*` interface
     """
 
-    container = client.containers.get(container_id)
-    result = container.exec_run("ls /sys/class/net")
+    generation = TC_STATE.generation(container_id)
+    exit_code, output = _exec_sh(client, container_id, _INTERFACE_DISCOVERY_SCRIPT)
     
-    if result.exit_code != 0:
+    if exit_code != 0:
         return []
-    
-    interfaces = result.output.decode('utf-8').strip().split('\n')
-    interfaces =  [eth for eth in interfaces if eth and eth.startswith("eth")]
-    
-    for eth in interfaces:
-
-        # sh -c because of the pipe | that is not supported directly by exec_run
-        cmd = f"sh -c \"ip a show {eth} | awk '/inet / {{print $2}}'\""
-        result = container.exec_run(cmd)
-        if result.exit_code == 0:
-            ip = result.output.decode('utf-8').strip()
-            if ip:
-                i = interfaces.index(eth)
-                eth += f" - {ip}"
-                interfaces[i] = eth
-        else:
-            interfaces.remove(eth)
-        
+
+    sections = output.decode('utf-8', errors='replace').split(_SECTION_MARKER)
+    addr_section = sections[0]
+    qdisc_section = sections[1] if len(sections) > 1 else ""
+
+    try:
+        links = _parse_ip_json(addr_section)
+    except ValueError:
+        links = _parse_ip_oneline(addr_section)
+
+    qdiscs = _parse_tc_json(qdisc_section)
+    TC_STATE.update_from_qdiscs(container_id, {name: qdiscs.get(name) for name in links if name.startswith("eth")},
+                                generation)
+
+    interfaces = []
+    for name in sorted(links):
+        if not name.startswith("eth"):
+            continue
+        ipv4, ipv6, mtu = links[name]
+        interfaces.append(NetInterface(name, tuple(ipv4), tuple(ipv6), mtu, qdiscs.get(name)))
     return interfaces
 
+def _parse_ip_json(text: str) -> Dict[str, tuple]:
+    # `ip -j addr show` output: list of links, each with its addr_info list
+    links = {}
+    for link in json.loads(text):
+        name = link.get("ifname", "").split("@")[0]
+        ipv4, ipv6 = [], []
+        for addr in link.get("addr_info", []):
+            cidr = f"{addr.get('local')}/{addr.get('prefixlen')}"
+            if addr.get("family") == "inet":
+                ipv4.append(cidr)
+            elif addr.get("family") == "inet6":
+                ipv6.append(cidr)
+        links[name] = (ipv4, ipv6, link.get("mtu"))
+    return links
+
+def _parse_ip_oneline(text: str) -> Dict[str, tuple]:
+    # `ip -o link show` + `ip -o addr show` output, e.g.
+    # "2: eth0@if5: <BROADCAST,UP> mtu 1500 qdisc noqueue ..."
+    # "2: eth0    inet 10.0.0.2/24 brd 10.0.0.255 scope global eth0 ..."
+    links = {}
+    for line in text.splitlines():
+        fields = line.split()
+        if len(fields) < 4 or not fields[0].endswith(":"):
+            continue
+        name = fields[1].rstrip(":").split("@")[0]
+        ipv4, ipv6, mtu = links.setdefault(name, ([], [], None))
+        if fields[2] == "inet":
+            ipv4.append(fields[3])
+        elif fields[2] == "inet6":
+            ipv6.append(fields[3])
+        elif "mtu" in fields:
+            links[name] = (ipv4, ipv6, int(fields[fields.index("mtu") + 1]))
+    return links
+
+def _parse_tc_json(text: str) -> Dict[str, dict]:
+    # `tc -j qdisc show` output, only root qdiscs are kept
+    try:
+        qdiscs = json.loads(text)
+    except ValueError:
+        return {}
+    return {q["dev"]: q for q in qdiscs if q.get("root") and "dev" in q}
+
 def start_container_by_id(client: DockerClient, container_id: str):
     r"""
     \brief Utility function to start a container by its id
@@ -122,26 +376,97 @@ def start_container_by_id(client: DockerClient, container_id: str):
     container = get_container(client, container_id)
 
     if container.status != "running":
+        forget_container(container.name)
         container.start()
         container.reload()
 
-def stop_container_by_id(client: DockerClient, container_id: str):
+def check_container_ready(client: DockerClient, container_id: str, condition: str = "service_started") -> bool:
+    r"""
+    \brief Utility function to check once whether a container satisfies a compose `depends_on` condition
+
+    Conditions are the compose ones: "service_started" (running), "service_healthy"
+    (healthy, or running when the image has no healthcheck) and
+    "service_completed_successfully" (exited with code 0).
+    A single inspect request is issued, callers schedule the next check themselves.
+    
+    \param client (DockerClient) Docker Client instance
+
+    \param container_id (str) The id of the container to check
+
+    \param condition (str) Compose depends_on condition
+
+    \return (bool) True if the condition is met, False if it may still be
+
+    \throws RuntimeError If the container can no longer satisfy the condition
+    """
+    container = get_container(client, container_id)
+    state = container.attrs.get("State", {})
+    status = state.get("Status")
+    health = (state.get("Health") or {}).get("Status")
+
+    if condition == "service_completed_successfully":
+        if status == "exited":
+            if state.get("ExitCode") == 0:
+                return True
+            raise RuntimeError(f"{container.name} exited with code {state.get('ExitCode')}")
+    elif status == "running":
+        if condition != "service_healthy" or health in (None, "healthy"):
+            return True
+        if health == "unhealthy":
+            raise RuntimeError(f"{container.name} is unhealthy")
+    elif status in ("exited", "dead"):
+        raise RuntimeError(f"{container.name} is {status}")
+    return False
+
+def wait_container_ready(client: DockerClient, container_id: str, condition: str = "service_started",
+                         timeout: float = 120.0, interval: float = 0.5):
+    r"""
+    \brief Utility function to wait until a container satisfies a compose `depends_on` condition
+
+    Blocks the calling thread, see check_container_ready for the conditions.
+    
+    \param client (DockerClient) Docker Client instance
+
+    \param container_id (str) The id of the container to wait for
+
+    \param condition (str) Compose depends_on condition
+
+    \param timeout (float) Maximum number of seconds to wait
+
+    \param interval (float) Seconds between two inspections
+
+    \return (None)
+
+    \throws RuntimeError If the container can no longer satisfy the condition
+    \throws TimeoutError If the condition is not met within timeout
+    """
+    deadline = time.monotonic() + timeout
+    while not check_container_ready(client, container_id, condition):
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"{container_id[:12]} did not reach {condition} within {timeout:g} s")
+        time.sleep(interval)
+
+def stop_container_by_id(client: DockerClient, container_id: str, timeout: Optional[int] = None):
     r"""
     \brief Utility function to stop a container by its id
 
     This fuction uses the Docker SDK for Python to interact with the Docker daemon
     and stop a certain container. It is invoked by the GUI when the user requests a container stop.
+    The daemon sends SIGTERM and escalates to SIGKILL once the grace period expires.
     
     \param client (DockerClient) Docker Client instance
 
     \param container_id (str) The id of the container to stop
 
+    \param timeout (int) Seconds to wait before SIGKILL, None for the container default (10 s)
+
     \return (None)
     """
   
     container = get_container(client, container_id)
     if container.status != "exited":
-        container.stop()
+        forget_container(container.name)
+        container.stop(timeout=timeout)
         container.reload()
 
 def restart_container_by_id(client: DockerClient, container_id: str):
@@ -159,20 +484,23 @@ def restart_container_by_id(client: DockerClient, container_id: str):
     """
 
     container = get_container(client, container_id)
+    forget_container(container.name)
     container.restart()
     container.reload()
 
-def apply_tc_rules(client: DockerClient, container_id: str, eth: str, delay: str, loss: str, band: str, limit: str):
+def apply_tc_rules(client: DockerClient, container_id: str, eth: str, delay: str, loss: str, band: str, limit: str) -> TcResult:
     r"""
     \brief Utility function to execute tc command inside a container to apply network emulation rules
 
     This fuction uses the Docker SDK for Python to interact with the Docker daemon
     and apply tc command to a certain container. 
-    It is invoked by the GUI when the user requests a container restart.
+    It is invoked by the GUI when the user applies the parameters of an interface.
+    If TC_STATE says the same parameters are already installed, nothing is executed:
+    `tc qdisc replace` would reset the netem queue and drop in-flight packets.
 
     \param client (DockerClient) Docker Client instance
 
-    \param container_id_ (str) The id of the container
+    \param container_id (str) The name of the container
 
     \param eth (str) The network interface name
 
@@ -184,28 +512,265 @@ def apply_tc_rules(client: DockerClient, container_id: str, eth: str, delay: str
 
     \param limit (str) The queue limit in packets
 
-    \return (Docker.models.exec.ExecResult) The result of the command execution
+    \return (TcResult) "applied", "unchanged" or "failed" with the command output
     """
-    container = get_container(client, container_id)
-    cmd = f"tc qdisc replace dev {eth} root netem delay {delay}ms loss {loss}% rate {band}Mbit limit {limit}"
-    return container.exec_run(cmd)
+    wanted = normalize_params(delay, loss, band, limit)
+    if wanted is not None and TC_STATE.known(container_id, eth) and TC_STATE.get(container_id, eth) == wanted:
+        return TcResult(eth, "unchanged", "")
+
+    cmd = tc_command(eth, delay, loss, band, limit)
+    exit_code, output = _exec_sh(client, container_id, cmd)
+    output = output.decode('utf-8', errors='replace')
+
+    if exit_code != 0:
+        TC_STATE.invalidate(container_id, eth)
+        return TcResult(eth, "failed", output)
+    TC_STATE.set(container_id, eth, wanted)
+    return TcResult(eth, "applied", output)
+
+_TC_SHOW_SCRIPT = "tc -j qdisc show 2>/dev/null || true"
+
+def read_tc_state(client: DockerClient, container_id: str) -> Dict[str, Optional[NetemParams]]:
+    r"""
+    \brief Utility function to read back the netem parameters installed in a container
+
+    Runs `tc -j qdisc show` and stores the result in TC_STATE.
+
+    \param client (DockerClient) Docker Client instance
+
+    \param container_id (str) The name of the container
+
+    \return (dict) `{interface: NetemParams or None}` for every interface with a root qdisc
+    """
+    generation = TC_STATE.generation(container_id)
+    _, output = _exec_sh(client, container_id, _TC_SHOW_SCRIPT)
+    qdiscs = _parse_tc_json(output.decode('utf-8', errors='replace'))
+    TC_STATE.update_from_qdiscs(container_id, qdiscs, generation)
+    return {eth: params_from_qdisc(qdisc) for eth, qdisc in qdiscs.items()}
+
+def read_qdisc_stats(client: DockerClient, container_id: str) -> Dict[str, dict]:
+    r"""
+    \brief Utility function to read the root qdiscs of a container together with their counters
+
+    Runs `tc -s -j qdisc show` once for all the interfaces; the installed netem
+    parameters are stored in TC_STATE as a side effect, unless rules were applied
+    or invalidated while the command was running. Meant to be polled, so it
+    uses the container session if enabled, or goes straight to the exec API
+    without inspecting the container first.
+
+    \param client (DockerClient) Docker Client instance
+
+    \param container_id (str) The name of the container
+
+    \return (dict) `{interface: qdisc}` as reported by tc, counters included (bytes, packets, drops, ...)
+    """
+    script = "tc -s -j qdisc show 2>/dev/null || true"
+    generation = TC_STATE.generation(container_id)
+    if EXEC_SESSIONS is not None:
+        _, output = _exec_sh(client, container_id, script)
+    else:
+        exec_id = client.api.exec_create(container_id, ["sh", "-c", script])["Id"]
+        output = client.api.exec_start(exec_id)
+    qdiscs = _parse_tc_json(output.decode('utf-8', errors='replace'))
+    TC_STATE.update_from_qdiscs(container_id, qdiscs, generation)
+    return qdiscs
+
+def tc_command(eth: str, delay, loss, band, limit) -> str:
+    r"""
+    \brief Utility function to build the tc command that installs a netem qdisc on an interface
+
+    \return (str) e.g. `tc qdisc replace dev eth0 root netem delay 20ms loss 0% rate 1.0Mbit limit 10`
+    """
+    return f"tc qdisc replace dev {eth} root netem delay {delay}ms loss {loss}% rate {band}Mbit limit {limit}"
+
+def apply_tc_batch(client: DockerClient, container_id: str, rules: Dict[str, dict]) -> Dict[str, TcResult]:
+    r"""
+    \brief Utility function to apply netem rules to several interfaces of a container with one exec
+
+    All the rules are written into a single `tc -force -batch` script, so the cost does not
+    grow with the number of interfaces. Interfaces whose parameters are already installed
+    (according to TC_STATE) are reported as "unchanged" and left untouched. `-force` keeps tc going after a failing line,
+    errors are mapped back to the interface of the failing line.
+
+    \param client (DockerClient) Docker Client instance
+
+    \param container_id (str) The name of the container
+
+    \param rules (dict) `{interface: {"delay", "loss", "band", "limit"}}`, as saved by config_manager
+
+    \return (dict) `{interface: TcResult}`
+    """
+    if not rules:
+        return {}
+
+    # Read back the installed state once if part of it is unknown: skipping unchanged
+    # interfaces is worth one exec, since a replace drops in-flight packets
+    if not all(TC_STATE.known(container_id, eth) for eth in rules):
+        read_tc_state(client, container_id)
+
+    results, interfaces, script = _tc_batch_script(container_id, rules)
+    if not interfaces:
+        return results
+    exit_code, output = _exec_sh(client, container_id, script)
+    return _tc_batch_results(container_id, rules, interfaces, exit_code, output, results)
+
+async def _apply_tc_batch_async(aclient, container_id: str, rules: Dict[str, dict]) -> Dict[str, TcResult]:
+    # apply_tc_batch on the event loop of an AsyncDockerBackend (aclient is its AsyncDockerClient)
+    if not rules:
+        return {}
+
+    if not all(TC_STATE.known(container_id, eth) for eth in rules):
+        generation = TC_STATE.generation(container_id)
+        _, output = await aclient.exec(container_id, ["sh", "-c", _TC_SHOW_SCRIPT])
+        TC_STATE.update_from_qdiscs(container_id, _parse_tc_json(output.decode('utf-8', errors='replace')), generation)
+
+    results, interfaces, script = _tc_batch_script(container_id, rules)
+    if not interfaces:
+        return results
+    exit_code, output = await aclient.exec(container_id, ["sh", "-c", script])
+    return _tc_batch_results(container_id, rules, interfaces, exit_code, output, results)
+
+def _tc_batch_script(container_id: str, rules: Dict[str, dict]) -> Tuple[Dict[str, TcResult], List[str], str]:
+    # Interfaces already in the wanted state are reported as "unchanged",
+    # the others are returned together with the batch script configuring them
+    results = {}
+    for eth, params in rules.items():
+        wanted = normalize_params(**params)
+        if wanted is not None and TC_STATE.known(container_id, eth) and TC_STATE.get(container_id, eth) == wanted:
+            results[eth] = TcResult(eth, "unchanged", "")
+
+    interfaces = [eth for eth in rules if eth not in results]
+    # "tc qdisc replace ..." -> "qdisc replace ...", one batch line per interface
+    lines = [tc_command(eth, **rules[eth])[len("tc "):] for eth in interfaces]
+    script = "printf '%s\\n' " + " ".join(shlex.quote(line) for line in lines) + " | tc -force -batch - 2>&1"
+    return results, interfaces, script
+
+def _tc_batch_results(container_id: str, rules: Dict[str, dict], interfaces: List[str],
+                      exit_code: int, output: bytes, results: Dict[str, TcResult]) -> Dict[str, TcResult]:
+    output = output.decode('utf-8', errors='replace')
+
+    # tc reports each failure as "<error message>\nCommand failed -:<line number>"
+    errors, message = {}, []
+    for out_line in output.splitlines():
+        if out_line.startswith("Command failed"):
+            line_number = int(out_line.rsplit(":", 1)[-1])
+            errors[line_number] = "\n".join(message)
+            message = []
+        elif out_line.strip():
+            message.append(out_line)
+
+    if exit_code != 0 and not errors:
+        # tc itself could not run (e.g. not installed)
+        errors = {i: output.strip() for i in range(1, len(interfaces) + 1)}
+
+    for i, eth in enumerate(interfaces, start=1):
+        if i in errors:
+            TC_STATE.invalidate(container_id, eth)
+            results[eth] = TcResult(eth, "failed", errors[i])
+        else:
+            TC_STATE.set(container_id, eth, normalize_params(**rules[eth]))
+            results[eth] = TcResult(eth, "applied", "")
+    return results
+
+def submit_tc_bulk(client: DockerClient, plan: Dict[str, Dict[str, dict]], executor, backend=None) -> Dict[str, Future]:
+    r"""
+    \brief Utility function to push netem rules to many containers in parallel
 
-def run_container_ping(client: DockerClient, container_id: str, ipaddr: str):
+    One apply_tc_batch is submitted per container, so the whole topology is configured
+    in roughly the time of the slowest container. With an AsyncDockerBackend the batches
+    run as coroutines on its event loop instead, and no worker of the executor is held
+    while the execs are running (shell sessions are not used in that case).
+
+    \param client (DockerClient) Docker Client instance
+
+    \param plan (dict) `{container: {interface: {"delay", "loss", "band", "limit"}}}`
+
+    \param executor Executor (e.g. TaskPool) running the per-container batches
+
+    \param backend (AsyncDockerBackend) Backend running the batches instead of the executor, None to use the executor
+
+    \return (dict) `{container: Future}`, each future resolves to `{interface: TcResult}`
+    and never raises: errors are reported as failed results
+    """
+    if backend is not None:
+        async def apply_one_async(container, rules):
+            try:
+                return await _apply_tc_batch_async(backend.client, container, rules)
+            except Exception as e:
+                return {eth: TcResult(eth, "failed", str(e)) for eth in rules}
+
+        return {container: backend.submit(apply_one_async(container, rules)) for container, rules in plan.items()}
+
+    def apply_one(container, rules):
+        try:
+            return apply_tc_batch(client, container, rules)
+        except Exception as e:
+            return {eth: TcResult(eth, "failed", str(e)) for eth in rules}
+
+    return {container: executor.submit(apply_one, container, rules) for container, rules in plan.items()}
+
+def apply_tc_bulk(client: DockerClient, plan: Dict[str, Dict[str, dict]], max_workers: int = 8) -> Dict[str, Dict[str, TcResult]]:
+    r"""
+    \brief Blocking version of submit_tc_bulk, using its own thread pool
+
+    \return (dict) `{container: {interface: TcResult}}`
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = submit_tc_bulk(client, plan, executor)
+        return {container: future.result() for container, future in futures.items()}
+
+def ping_command(ipaddr: str, count: int = 4, interval: float = 1.0, deadline: Optional[int] = None) -> str:
+    r"""
+    \brief Utility function to build the ping command run inside the containers
+
+    \param deadline (int) If set, ping exits after this many seconds even if replies are missing
+
+    \return (str) e.g. `ping -c 4 -i 1.0 10.0.0.2`
+    """
+    deadline_opt = f" -w {int(deadline)}" if deadline else ""
+    return f"ping -c {int(count)} -i {float(interval)}{deadline_opt} {shlex.quote(ipaddr)}"
+
+def run_container_ping(client: DockerClient, container_id: str, ipaddr: str, count: int = 4, interval: float = 1.0, deadline: Optional[int] = None):
     r"""
     \brief Utility function to execute ping command inside a container to a specified IP address
 
     This fuction uses the Docker SDK for Python to interact with the Docker daemon
-    and apply tc command to a certain container. 
-    It is invoked by the GUI when the user requests a container restart.
+    and run ping inside a certain container, waiting for it to complete.
+    See stream_container_ping to follow the output while ping is running.
 
     \param client (DockerClient) Docker Client instance
 
-    \param container_id_ (str) The id of the container 
+    \param container_id (str) The id of the container 
 
     \param ipaddr (str) The target IP address to ping
 
+    \param count (int) Number of echo requests to send
+
+    \param interval (float) Seconds between echo requests
+
+    \param deadline (int) Maximum duration of the ping in seconds, None to wait for every reply
+
     \return (Docker.models.exec.ExecResult) The result of the command execution
     """
     container = get_container(client, container_id)
-    cmd = f"ping -c 4 {ipaddr}"
-    return container.exec_run(cmd)
\ No newline at end of file
+    cmd = ping_command(ipaddr, count, interval, deadline)
+    return container.exec_run(cmd)
+
+def stream_container_ping(client: DockerClient, container_id: str, ipaddr: str, count: int = 4, interval: float = 1.0) -> StreamingExec:
+    r"""
+    \brief Utility function to run ping inside a container, streaming its output
+
+    \param client (DockerClient) Docker Client instance
+
+    \param container_id (str) The id of the container 
+
+    \param ipaddr (str) The target IP address to ping
+
+    \param count (int) Number of echo requests to send
+
+    \param interval (float) Seconds between echo requests
+
+    \return (StreamingExec) The running exec: iterate `lines()` to read the replies, `stop()` to interrupt it
+    """
+    container = get_container(client, container_id)
+    return StreamingExec(client, container, ping_command(ipaddr, count, interval))
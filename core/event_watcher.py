@@ -0,0 +1,181 @@
+r"""
+\file core/event_watcher.py
+
+\brief Docker events subscriber that keeps the GUI in sync with container state changes
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+"""
+import threading
+from typing import Callable, NamedTuple, Optional
+
+from docker.client import DockerClient
+
+# Container actions we care about, mapped to the resulting container state
+# (None means the state is unchanged, e.g. health_status)
+ACTION_STATES = {
+    "create": "created",
+    "start": "running",
+    "restart": "running",
+    "unpause": "running",
+    "pause": "paused",
+    "die": "exited",
+    "stop": "exited",
+    "destroy": None,
+    "health_status": None,
+}
+
+class ContainerEvent(NamedTuple):
+    r"""
+    \brief State change of a single container, as pushed by ContainerEventWatcher
+
+    `state` is the new container state (None if unchanged), `health` is the new
+    health status (None if the event does not carry one), `service` is the
+    compose service of the container.
+    """
+    name: str
+    id: str
+    action: str
+    state: Optional[str]
+    health: Optional[str]
+    service: Optional[str]
+
+def parse_event(event: dict) -> Optional[ContainerEvent]:
+    r"""
+    \brief Utility function to convert a raw Docker event into a ContainerEvent
+
+    \param event (dict) Decoded event as returned by DockerClient.events
+
+    \return (ContainerEvent) The parsed event, or None if it is not a watched container action
+    """
+    raw_action = event.get("Action") or event.get("status") or ""
+    # health_status actions carry the new status, e.g. "health_status: healthy"
+    action, _, detail = raw_action.partition(":")
+    if action not in ACTION_STATES:
+        return None
+
+    actor = event.get("Actor", {})
+    attributes = actor.get("Attributes", {})
+    name = attributes.get("name")
+    if not name:
+        return None
+
+    health = detail.strip() if action == "health_status" else None
+    return ContainerEvent(name, actor.get("ID", event.get("id", "")), action, ACTION_STATES[action],
+                          health, attributes.get("com.docker.compose.service"))
+
+class ContainerEventWatcher:
+    r"""
+    \brief Background subscriber to the Docker `/events` stream of a compose project
+
+    The watcher runs a daemon thread that listens to container events filtered
+    by the `com.docker.compose.project` label and forwards every state change
+    to `on_event`. If the stream breaks (e.g. the daemon restarts) it reconnects
+    and calls `on_resync`, since events may have been lost in the meantime.
+
+    Callbacks are invoked from the watcher thread: GUI users must hand them
+    over to the Tk thread (e.g. with `after`).
+
+    \param client (DockerClient) Docker Client instance
+    \param project_name (str) The name of the compose project
+    \param on_event (callable) Called with a ContainerEvent for every state change
+    \param on_resync (callable) Called after a reconnection, a full re-list is needed
+    \param retry_delay (float) Seconds to wait before reconnecting, doubled after
+    each failed attempt in a row
+    \param max_retry_delay (float) Upper bound of the reconnection delay
+    """
+
+    def __init__(self, client: DockerClient, project_name: str,
+                 on_event: Callable[[ContainerEvent], None],
+                 on_resync: Callable[[], None], retry_delay: float = 2.0,
+                 max_retry_delay: float = 60.0):
+        self.client = client
+        self.project_name = project_name
+        self.on_event = on_event
+        self.on_resync = on_resync
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.connected = False
+
+        self._stream = None
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self, since: Optional[int] = None):
+        r"""
+        \brief Start listening for events
+
+        \param since (int) Unix timestamp, events that happened after it are replayed.
+        Used to cover the gap between the initial listing and the subscription.
+        """
+        self._thread = threading.Thread(target=self._run, args=(since,), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        self.connected = False
+        stream = self._stream
+        if stream is not None:
+            try: stream.close()
+            except Exception: pass
+
+    def _run(self, since):
+        filters = {
+            "type": "container",
+            "label": f"com.docker.compose.project={self.project_name}",
+            "event": list(ACTION_STATES),
+        }
+        reconnecting = False
+        failures = 0  # failed attempts in a row, only the first one is reported
+
+        while not self._stop_event.is_set():
+            try:
+                self._stream = self.client.events(since=since, filters=filters, decode=True)
+                self.connected = True
+                if failures:
+                    print("Docker events stream reconnected")
+                failures = 0
+                since = None
+                if reconnecting:
+                    self.on_resync()
+
+                for raw_event in self._stream:
+                    event = parse_event(raw_event)
+                    if event is not None:
+                        self.on_event(event)
+            except Exception as e:
+                if not self._stop_event.is_set() and not failures:
+                    print(f"Docker events stream interrupted: {e}")
+                failures += 1
+
+            self.connected = False
+            reconnecting = True
+            self._stop_event.wait(min(self.max_retry_delay, self.retry_delay * 2 ** max(failures - 1, 0)))
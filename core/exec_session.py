@@ -0,0 +1,228 @@
+r"""
+\file core/exec_session.py
+
+\brief Persistent shell sessions inside containers for short, frequent commands
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+"""
+
+import secrets, struct, threading, time
+from typing import Dict, Tuple
+
+from docker.client import DockerClient
+
+class ExecSessionError(Exception):
+    pass
+
+class ExecSession:
+    r"""
+    \brief One long-lived `sh` exec attached to a socket, running commands one at a time
+
+    Each command costs one socket write instead of an exec create/start/inspect
+    cycle and a new process. Commands are wrapped as
+
+        ( <script>
+        ) </dev/null 2>&1; printf '\n<marker> %d\n' $?
+
+    so the output ends at a marker that is unique to the session and carries the
+    exit code. The subshell keeps `exit`/`cd` from affecting the session and
+    stdin is not inherited, since it carries the protocol itself.
+
+    \param client (DockerClient) Docker Client instance
+    \param container_id (str) The name or id of the container
+
+    \throws ExecSessionError If the session cannot be opened
+    """
+
+    def __init__(self, client: DockerClient, container_id: str):
+        self.container_id = container_id
+        self.marker = f"__DTG_END_{secrets.token_hex(8)}__".encode()
+        self.last_used = time.monotonic()
+        self.reused = False
+        self.lock = threading.Lock()
+        self._buffer = b""
+        try:
+            exec_id = client.api.exec_create(container_id, ["sh"], stdin=True, stdout=True,
+                                             stderr=True, tty=False)["Id"]
+            self._response = client.api.exec_start(exec_id, socket=True)
+        except Exception as e:
+            raise ExecSessionError(f"Can't open a shell in {container_id}: {e}")
+        # docker-py hands back the socket wrapped in a SocketIO
+        self._sock = getattr(self._response, "_sock", self._response)
+
+    def run(self, script: str, timeout: float = 30.0) -> Tuple[int, bytes]:
+        r"""
+        \brief Run a shell script inside the session and wait for it
+
+        \param script (str) Shell script, as passed to `sh -c`
+        \param timeout (float) Maximum number of seconds to wait for the script
+
+        \return (tuple) (exit code, output): stdout and stderr are merged as in `exec_run`
+
+        \throws ExecSessionError If the session is broken, it must then be discarded
+        """
+        with self.lock:
+            request = f"( {script}\n) </dev/null 2>&1; printf '\\n%s %d\\n' {self.marker.decode()} $?\n"
+            try:
+                self._sock.settimeout(timeout)
+                self._sock.sendall(request.encode())
+                output, exit_code = self._read_until_marker()
+            except (OSError, ValueError) as e:
+                self.close()
+                raise ExecSessionError(f"Shell session of {self.container_id} lost: {e}")
+            self.reused = True
+            self.last_used = time.monotonic()
+            return exit_code, output
+
+    def _read_until_marker(self) -> Tuple[bytes, int]:
+        tail = b"\n" + self.marker + b" "
+        while True:
+            start = self._buffer.find(tail)
+            if start >= 0:
+                end = self._buffer.find(b"\n", start + len(tail))
+                if end >= 0:
+                    exit_code = int(self._buffer[start + len(tail):end])
+                    output = self._buffer[:start]
+                    self._buffer = self._buffer[end + 1:]
+                    return output, exit_code
+            self._buffer += self._read_frame()
+
+    def _read_frame(self) -> bytes:
+        # Multiplexed stream: 8 byte header (stream type, 3 pad bytes, big endian size)
+        header = self._recv_exactly(8)
+        _, size = struct.unpack(">BxxxL", header)
+        return self._recv_exactly(size)
+
+    def _recv_exactly(self, size: int) -> bytes:
+        data = b""
+        while len(data) < size:
+            chunk = self._sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionResetError("shell exited")
+            data += chunk
+        return data
+
+    def close(self):
+        for closable in (self._sock, self._response):
+            try: closable.close()
+            except Exception: pass
+
+class ExecSessionPool:
+    r"""
+    \brief One ExecSession per container, opened on demand and closed when idle
+
+    A session that breaks (e.g. because its container was restarted) is discarded;
+    if it had already been used the command is retried once on a fresh session,
+    exactly as a stale keep-alive connection would be.
+
+    \param client (DockerClient) Docker Client instance
+    \param idle_timeout (float) Seconds after which an unused session is closed
+    """
+
+    def __init__(self, client: DockerClient, idle_timeout: float = 60.0):
+        self.client = client
+        self.idle_timeout = idle_timeout
+        self._sessions: Dict[str, ExecSession] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._reaper = threading.Thread(target=self._reap, name="dtg-exec-reaper", daemon=True)
+        self._reaper.start()
+
+    def run(self, container_id: str, script: str, timeout: float = 30.0) -> Tuple[int, bytes]:
+        r"""
+        \brief Run a shell script in the session of a container
+
+        \return (tuple) (exit code, output)
+
+        \throws ExecSessionError If no working session can be obtained
+        """
+        session = self._session(container_id)
+        try:
+            return session.run(script, timeout)
+        except ExecSessionError:
+            self._discard(container_id, session)
+            if not session.reused:
+                raise
+        return self._session(container_id).run(script, timeout)
+
+    def _session(self, container_id: str) -> ExecSession:
+        with self._lock:
+            session = self._sessions.get(container_id)
+        if session is not None:
+            return session
+
+        # opened outside the lock, bulk operations open many sessions at once
+        session = ExecSession(self.client, container_id)
+        with self._lock:
+            existing = self._sessions.get(container_id)
+            if existing is None:
+                self._sessions[container_id] = session
+                return session
+        session.close()
+        return existing
+
+    def _discard(self, container_id: str, session: ExecSession):
+        with self._lock:
+            if self._sessions.get(container_id) is session:
+                del self._sessions[container_id]
+        session.close()
+
+    def invalidate(self, container_id: str):
+        r"""
+        \brief Close the session of a container, e.g. after it was stopped or restarted
+        """
+        with self._lock:
+            session = self._sessions.pop(container_id, None)
+        if session:
+            session.close()
+
+    def _reap(self):
+        while not self._stop.wait(max(1.0, self.idle_timeout / 2)):
+            now = time.monotonic()
+            with self._lock:
+                idle = [(c, s) for c, s in self._sessions.items() if now - s.last_used > self.idle_timeout]
+            for container_id, session in idle:
+                # a session running a command is not idle
+                if session.lock.acquire(blocking=False):
+                    try:
+                        if time.monotonic() - session.last_used > self.idle_timeout:
+                            self._discard(container_id, session)
+                    finally:
+                        session.lock.release()
+
+    def close(self):
+        self._stop.set()
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
@@ -0,0 +1,241 @@
+r"""
+\file core/qdisc_poller.py
+
+\brief Adaptive poller of the netem qdisc counters of the project containers
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+"""
+
+import random, threading, time
+from typing import Callable, Dict, NamedTuple, Optional
+
+from docker.client import DockerClient
+
+from core import docker_ops
+from utils.task_pool import TaskPool
+
+class QdiscCounters(NamedTuple):
+    r"""
+    \brief Cumulative counters of a root qdisc, as reported by `tc -s -j qdisc show`
+
+    `backlog` (bytes) and `qlen` (packets) are instantaneous queue occupancies.
+    """
+    kind: str
+    bytes: int
+    packets: int
+    drops: int
+    overlimits: int
+    requeues: int
+    backlog: int
+    qlen: int
+
+def counters_from_qdisc(qdisc: dict) -> QdiscCounters:
+    return QdiscCounters(
+        qdisc.get("kind", "?"), qdisc.get("bytes", 0), qdisc.get("packets", 0), qdisc.get("drops", 0),
+        qdisc.get("overlimits", 0), qdisc.get("requeues", 0), qdisc.get("backlog", 0), qdisc.get("qlen", 0)
+    )
+
+class QdiscRates(NamedTuple):
+    r"""
+    \brief Activity of a root qdisc over the last polling interval (per second values)
+    """
+    interface: str
+    kind: str
+    byte_rate: float
+    packet_rate: float
+    drop_rate: float
+    overlimit_rate: float
+    drops: int
+    backlog: int
+    qlen: int
+    interval: float
+
+def compute_rates(interface: str, previous: Optional[QdiscCounters], current: QdiscCounters,
+                  elapsed: float) -> QdiscRates:
+    r"""
+    \brief Per-interval deltas of two readings of the same qdisc
+
+    A counter going backwards means the qdisc was replaced, the new value is then the delta.
+    Without a previous reading (or with a different kind of qdisc) the rates are zero.
+    """
+    if previous is None or previous.kind != current.kind or elapsed <= 0:
+        return QdiscRates(interface, current.kind, 0.0, 0.0, 0.0, 0.0,
+                          current.drops, current.backlog, current.qlen, 0.0)
+
+    def rate(field):
+        now, before = getattr(current, field), getattr(previous, field)
+        return (now - before if now >= before else now) / elapsed
+
+    return QdiscRates(interface, current.kind, rate("bytes"), rate("packets"), rate("drops"),
+                      rate("overlimits"), current.drops, current.backlog, current.qlen, elapsed)
+
+class QdiscPoller:
+    r"""
+    \brief Poll the qdisc counters of the running containers at a rate that follows what is visible
+
+    Containers somebody is looking at (see watch) are polled every `fast_interval`
+    seconds, all the others every `slow_interval` seconds, or never if it is 0.
+    A single scheduler thread collects the due containers at every tick and submits
+    them as one batch to the task pool, each poll being a single exec; at most
+    `max_in_flight` polls are outstanding so user operations are never starved.
+
+    \param client (DockerClient) Docker Client instance
+    \param pool (TaskPool) Pool running the polls
+    \param on_update Called from a worker thread as on_update(container name, {interface: QdiscRates})
+    \param fast_interval (float) Seconds between two polls of a watched container
+    \param slow_interval (float) Seconds between two polls of any other container, 0 pauses them
+    \param max_in_flight (int) Maximum number of outstanding polls, defaults to half the pool
+    """
+
+    TICK = 0.25
+
+    def __init__(self, client: DockerClient, pool: TaskPool,
+                 on_update: Callable[[str, Dict[str, QdiscRates]], None],
+                 fast_interval: float = 1.0, slow_interval: float = 15.0, max_in_flight: int = None):
+        self.client = client
+        self.pool = pool
+        self.on_update = on_update
+        self.fast_interval = fast_interval
+        self.slow_interval = slow_interval
+        self.max_in_flight = max_in_flight or max(1, pool.max_workers // 2)
+
+        self._running: Dict[str, str] = {}
+        self._watchers: Dict[str, int] = {}
+        self._next_due: Dict[str, float] = {}
+        self._in_flight = set()
+        self._readings = {}
+        self._latest: Dict[str, Dict[str, QdiscRates]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="dtg-qdisc-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def sync(self, running: Dict[str, str]):
+        r"""
+        \brief Poll exactly the given containers
+
+        \param running (dict) `{container name: container id}` of the running containers
+        """
+        now = time.monotonic()
+        with self._lock:
+            for name in list(self._running):
+                if running.get(name) != self._running[name]:
+                    # stopped or recreated: counters start over
+                    self._running.pop(name)
+                    self._next_due.pop(name, None)
+                    self._readings.pop(name, None)
+                    self._latest.pop(name, None)
+            for name, container_id in running.items():
+                if name not in self._running:
+                    self._running[name] = container_id
+                    # spread the first polls instead of firing them all at the same tick
+                    self._next_due[name] = now + random.uniform(0, self._interval(name) or self.TICK)
+
+    def watch(self, name: str):
+        r"""
+        \brief Poll a container at the fast rate, e.g. while its NodeWindow is open
+        """
+        with self._lock:
+            self._watchers[name] = self._watchers.get(name, 0) + 1
+            if name in self._running:
+                self._next_due[name] = time.monotonic()
+
+    def unwatch(self, name: str):
+        with self._lock:
+            count = self._watchers.get(name, 0) - 1
+            if count > 0:
+                self._watchers[name] = count
+            else:
+                self._watchers.pop(name, None)
+                if name in self._next_due and self.slow_interval > 0:
+                    self._next_due[name] = time.monotonic() + self.slow_interval
+
+    def latest(self, name: str) -> Dict[str, QdiscRates]:
+        r"""
+        \brief Last computed rates of a container, `{interface: QdiscRates}`
+        """
+        with self._lock:
+            return dict(self._latest.get(name, {}))
+
+    def all_latest(self) -> Dict[str, Dict[str, QdiscRates]]:
+        with self._lock:
+            return {name: dict(rates) for name, rates in self._latest.items()}
+
+    def _interval(self, name: str) -> float:
+        return self.fast_interval if name in self._watchers else self.slow_interval
+
+    def _run(self):
+        while not self._stop.wait(self.TICK):
+            now = time.monotonic()
+            with self._lock:
+                budget = self.max_in_flight - len(self._in_flight)
+                # watched containers first, then the most overdue ones
+                due = sorted((name not in self._watchers, t, name) for name, t in self._next_due.items()
+                             if t <= now and name not in self._in_flight and self._interval(name) > 0)
+                batch = [name for _, _, name in due[:max(0, budget)]]
+                for name in batch:
+                    self._in_flight.add(name)
+                    self._next_due[name] = now + self._interval(name)
+            for name in batch:
+                try:
+                    self.pool.submit(self._poll, name)
+                except RuntimeError:
+                    return  # pool shut down
+
+    def _poll(self, name: str):
+        try:
+            qdiscs = docker_ops.read_qdisc_stats(self.client, name)
+        except Exception as e:
+            print(f"qdisc stats of {name} not available: {e}")
+            with self._lock:
+                self._in_flight.discard(name)
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            self._in_flight.discard(name)
+            if name not in self._running:
+                return
+            previous, read_at = self._readings.get(name, ({}, None))
+            elapsed = now - read_at if read_at is not None else 0.0
+            current = {eth: counters_from_qdisc(q) for eth, q in qdiscs.items()}
+            rates = {eth: compute_rates(eth, previous.get(eth), counters, elapsed)
+                     for eth, counters in current.items()}
+            self._readings[name] = (current, now)
+            self._latest[name] = rates
+        self.on_update(name, rates)
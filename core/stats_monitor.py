@@ -0,0 +1,283 @@
+r"""
+\file core/stats_monitor.py
+
+\brief Live CPU, memory and network statistics of the project containers
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+"""
+
+import asyncio, threading, time
+from array import array
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+from core.async_docker import AsyncDockerBackend
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+class RingBuffer:
+    r"""
+    \brief Fixed-size buffer of the most recent float samples
+
+    Backed by a preallocated `array('d')`: appending never allocates and
+    200 containers x 4 series x 60 samples take less than 400 KiB.
+
+    \param capacity (int) Number of samples kept
+    """
+    __slots__ = ("_data", "_start", "_size")
+
+    def __init__(self, capacity: int):
+        self._data = array("d", bytes(8 * capacity))
+        self._start = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, value: float):
+        capacity = len(self._data)
+        if self._size < capacity:
+            self._data[(self._start + self._size) % capacity] = value
+            self._size += 1
+        else:
+            self._data[self._start] = value
+            self._start = (self._start + 1) % capacity
+
+    def values(self) -> List[float]:
+        r"""
+        \brief Samples from the oldest to the newest
+        """
+        end = self._start + self._size
+        if end <= len(self._data):
+            return self._data[self._start:end].tolist()
+        return (self._data[self._start:] + self._data[:end - len(self._data)]).tolist()
+
+    def last(self) -> Optional[float]:
+        if not self._size:
+            return None
+        return self._data[(self._start + self._size - 1) % len(self._data)]
+
+def cpu_percent(sample: dict) -> float:
+    r"""
+    \brief CPU usage of a stats sample, computed as `docker stats` does (100% = one core)
+    """
+    cpu, precpu = sample.get("cpu_stats") or {}, sample.get("precpu_stats") or {}
+    cpu_delta = cpu.get("cpu_usage", {}).get("total_usage", 0) - precpu.get("cpu_usage", {}).get("total_usage", 0)
+    system_delta = cpu.get("system_cpu_usage", 0) - precpu.get("system_cpu_usage", 0)
+    if cpu_delta <= 0 or system_delta <= 0:
+        return 0.0
+    online = cpu.get("online_cpus") or len(cpu.get("cpu_usage", {}).get("percpu_usage") or []) or 1
+    return cpu_delta / system_delta * online * 100.0
+
+def memory_usage(sample: dict) -> float:
+    r"""
+    \brief Memory usage of a stats sample in bytes, page cache excluded (cgroup v1 and v2)
+    """
+    memory = sample.get("memory_stats") or {}
+    stats = memory.get("stats") or {}
+    cache = stats.get("inactive_file", stats.get("total_inactive_file", stats.get("cache", 0)))
+    return float(max(memory.get("usage", 0) - cache, 0))
+
+def network_totals(sample: dict):
+    r"""
+    \brief Received and transmitted bytes summed over every interface of a stats sample
+    """
+    networks = (sample.get("networks") or {}).values()
+    return (sum(n.get("rx_bytes", 0) for n in networks), sum(n.get("tx_bytes", 0) for n in networks))
+
+def sparkline(values: List[float], top: Optional[float] = None) -> str:
+    r"""
+    \brief Render samples as a line of block characters
+
+    \param values (list) Samples from the oldest to the newest
+    \param top (float) Value drawn as a full block, defaults to the largest sample
+    """
+    if not values:
+        return ""
+    top = top or max(values) or 1.0
+    last = len(SPARK_CHARS) - 1
+    return "".join(SPARK_CHARS[min(last, max(0, int(v / top * last)))] for v in values)
+
+def format_bytes(value: float) -> str:
+    r"""
+    \brief Human readable size, e.g. "12.3M"
+    """
+    for unit in ("", "K", "M", "G"):
+        if abs(value) < 1024:
+            return f"{value:.0f}{unit}" if not unit else f"{value:.1f}{unit}"
+        value /= 1024
+    return f"{value:.1f}T"
+
+class ContainerStats:
+    r"""
+    \brief Recent statistics of a single container
+
+    \param capacity (int) Number of samples kept per series
+    """
+
+    def __init__(self, capacity: int):
+        self.cpu = RingBuffer(capacity)
+        self.memory = RingBuffer(capacity)
+        self.rx_rate = RingBuffer(capacity)
+        self.tx_rate = RingBuffer(capacity)
+        self.memory_limit = 0
+        self.version = 0
+        self._net = None
+
+    def update(self, sample: dict):
+        now = time.monotonic()
+        rx, tx = network_totals(sample)
+        self.cpu.append(cpu_percent(sample))
+        self.memory.append(memory_usage(sample))
+        self.memory_limit = (sample.get("memory_stats") or {}).get("limit", 0)
+        if self._net is not None and now > self._net[2]:
+            elapsed = now - self._net[2]
+            self.rx_rate.append(max(rx - self._net[0], 0) / elapsed)
+            self.tx_rate.append(max(tx - self._net[1], 0) / elapsed)
+        self._net = (rx, tx, now)
+        self.version += 1
+
+class StatsMonitor:
+    r"""
+    \brief Follow the `/containers/{id}/stats` stream of every running container
+
+    All the streams are multiplexed on the event loop of an AsyncDockerBackend,
+    one connection per container and no thread per container. Samples (about one
+    per second, as produced by the daemon) land in ring buffers; readers poll them
+    at their own pace, so the GUI refresh rate does not depend on the sampling rate.
+
+    \param backend (AsyncDockerBackend) Backend whose loop runs the streams
+    \param capacity (int) Number of samples kept per series
+    \param owns_backend (bool) Close the backend together with the monitor
+    """
+
+    MAX_OPENING = 16
+    # Re-open delay of a stream that ended without samples, doubled at each failure
+    RETRY_MIN_S = 2.0
+    RETRY_MAX_S = 60.0
+
+    def __init__(self, backend: AsyncDockerBackend, capacity: int = 60, owns_backend: bool = False):
+        self.backend = backend
+        self.capacity = capacity
+        self.owns_backend = owns_backend
+        self._stats: Dict[str, ContainerStats] = {}
+        self._streams = {}
+        self._retry = {}    # name -> (consecutive failures, monotonic time of the next attempt, ended stream)
+        self._opening = None
+        self._lock = threading.Lock()
+
+    def sync(self, running: Dict[str, str]):
+        r"""
+        \brief Follow exactly the given containers
+
+        Streams of containers no longer running are closed, new or recreated
+        containers get a stream, and streams that ended are re-opened, with an
+        exponential backoff when they keep failing without delivering samples.
+
+        \param running (dict) `{container name: container id}` of the running containers
+        """
+        for name, (container_id, future) in list(self._streams.items()):
+            if running.get(name) != container_id:
+                future.cancel()
+                del self._streams[name]
+                self._retry.pop(name, None)
+                with self._lock:
+                    self._stats.pop(name, None)
+
+        now = time.monotonic()
+        for name, container_id in running.items():
+            current = self._streams.get(name)
+            failures = 0
+            if current is not None:
+                ended = current[1]
+                if not ended.done():
+                    continue
+                failures, not_before, seen = self._retry.get(name, (0, 0.0, None))
+                if seen is not ended:
+                    # first sync since the stream ended: streams that delivered samples
+                    # are re-opened right away, failing ones back off
+                    samples = 0 if ended.cancelled() or ended.exception() else ended.result()
+                    failures = 0 if samples else failures + 1
+                    delay = min(self.RETRY_MAX_S, self.RETRY_MIN_S * 2 ** (failures - 1)) if failures else 0.0
+                    not_before = now + delay
+                    self._retry[name] = (failures, not_before, ended)
+                if now < not_before:
+                    continue
+            with self._lock:
+                stats = self._stats.setdefault(name, ContainerStats(self.capacity))
+            future = self.backend.submit(self._follow(name, container_id, stats, report=not failures))
+            self._streams[name] = (container_id, future)
+
+    async def _follow(self, name: str, container_id: str, stats: ContainerStats, report: bool = True) -> int:
+        # Connections are opened a few at a time, hundreds of simultaneous
+        # connects would overflow the listen backlog of the daemon socket.
+        # Returns the number of samples received, errors are only printed if `report`
+        if self._opening is None:
+            self._opening = asyncio.Semaphore(self.MAX_OPENING)
+        stream = self.backend.client.stream(f"/containers/{quote(container_id)}/stats", {"stream": "1"})
+        samples = 0
+        try:
+            async with self._opening:
+                sample = await stream.__anext__()
+            while True:
+                with self._lock:
+                    stats.update(sample)
+                samples += 1
+                sample = await stream.__anext__()
+        except StopAsyncIteration:
+            pass
+        except Exception as e:
+            if report or samples:
+                print(f"Stats stream of {name} closed: {e}")
+        finally:
+            await stream.aclose()
+        return samples
+
+    def get(self, name: str) -> Optional[ContainerStats]:
+        r"""
+        \brief Statistics of a container, None if it is not followed
+
+        Hold `lock` while reading several series to get a consistent view.
+        """
+        return self._stats.get(name)
+
+    @property
+    def lock(self):
+        return self._lock
+
+    def close(self):
+        for _, future in self._streams.values():
+            future.cancel()
+        self._streams.clear()
+        self._retry.clear()
+        if self.owns_backend:
+            self.backend.close()
@@ -35,72 +35,218 @@ r"""
 | 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
 """
 
-import shutil, subprocess, platform, shlex
+import collections, functools, re, shutil, subprocess, platform, shlex
+from typing import Callable, NamedTuple, Optional
 
 class ComposeNotFoundError(Exception):
     pass
 
 class DockerComposeError(Exception):
-    pass
+    r"""
+    \brief A Docker Compose command failed, `output` keeps the last lines it printed
+    """
+    def __init__(self, message, output=None):
+        super().__init__(message)
+        self.output = output or []
 
 class TerminalError(Exception):
     pass
 
-def exec_compose(compose_file):
+@functools.lru_cache(maxsize=None)
+def compose_binary():
     r"""
-    \brief Execute Docker Compose command to start the environment
+    \brief Probe once which Docker Compose is installed on the system
 
-    This fuction search for the version of Docker Compose installed on your system and
-    execute the precise command with '-d' flag (detatched), containers will run in background.
-    
-    \param compose_file (Path or str) Absolute path to .yml/.yaml file.
+    The standalone 'docker-compose' (v1) is preferred over the 'docker compose' plugin (v2).
+    The result is cached for the whole process, a failed probe is not cached so that
+    installing Compose while the app is running is noticed on the next call.
 
-    \return (list) List of argument of cmd (e.g. `['docker', 'compose', ...]`).
+    \return (tuple) Command that runs Compose (e.g. `('docker', 'compose')`).
 
     \throws ComposeNotFoundError If Docker Compose is not installed.
-    \throws DockerComposeError If errors occurs (e.g. invalid file, docker image not found)
     """
-    cmd = None
-    
     # Check if the standalone 'docker-compose' (v1) is available
     if shutil.which("docker-compose"):
-        cmd = ["docker-compose", "-f", str(compose_file), "up", "-d"]
+        return ("docker-compose",)
+
     # If not, check if 'docker' (which might include the 'compose' plugin, v2) is available
-    elif shutil.which("docker"):
+    if shutil.which("docker"):
         try:
             # Try to run 'docker compose --version' to see if the v2 plugin is installed
             subprocess.run(["docker", "compose", "--version"], check=True, capture_output=True)
-            cmd = ["docker", "compose", "-f", str(compose_file), "up", "-d"]
+            return ("docker", "compose")
         except (subprocess.CalledProcessError, FileNotFoundError):
             # 'docker' executable exists, but the 'compose' plugin is missing
-            pass # cmd remains None
-            
-    if cmd is None:
-        raise ComposeNotFoundError(
-            "Docker Compose not found.\n\n"
-            "This program requires either the standalone 'docker-compose' (v1) "
-            "or the 'docker compose' plugin (v2) to be installed and available in your PATH."
+            pass
+
+    raise ComposeNotFoundError(
+        "Docker Compose not found.\n\n"
+        "This program requires either the standalone 'docker-compose' (v1) "
+        "or the 'docker compose' plugin (v2) to be installed and available in your PATH."
+    )
+
+def compose_command(compose_file):
+    r"""
+    \brief Build the base Docker Compose command for a project
+
+    \param compose_file (Path or str) Absolute path to .yml/.yaml file.
+
+    \return (list) Base command without the subcommand (e.g. `['docker', 'compose', '-f', ...]`).
+
+    \throws ComposeNotFoundError If Docker Compose is not installed.
+    """
+    return list(compose_binary()) + ["-f", str(compose_file)]
+
+class ComposeProgress(NamedTuple):
+    r"""
+    \brief Progress of one object of the project, parsed from a line printed by 'compose up'
+
+    `kind` is "Container", "Network", "Volume" or "Image", `status` is the
+    last word printed by Compose (e.g. "Creating", "Started", "Healthy", "Error").
+    """
+    kind: str
+    name: str
+    status: str
+
+# Compose v2: " ✔ Container proj-web-1  Started   0.4s" (the mark and the time are optional)
+_V2_PROGRESS = re.compile(r"^\s*(?:\W\s+)?(Container|Network|Volume|Image)\s+(\S+)\s+(.+?)(?:\s+[\d.]+s)?\s*$")
+# Compose v2 pulls are reported by service: " web Pulling"
+_V2_PULL = re.compile(r"^\s*(?:\W\s+)?(\S+)\s+(Pulling|Pulled|Waiting|Skipped)\b")
+# Compose v1: "Creating proj_web_1 ... done", "proj_db_1 is up-to-date"
+_V1_PROGRESS = re.compile(r"^(Creating|Starting|Recreating|Pulling)\s+(\S+)\s+\.\.\.\s*(\w*)")
+_V1_UP_TO_DATE = re.compile(r"^(\S+) is up-to-date")
+# v1 'up -d' starts each container as part of its "Creating ... done" step
+_V1_DONE = {"Creating": "Started", "Starting": "Started", "Recreating": "Started", "Pulling": "Pulled"}
+
+def parse_compose_progress(line: str) -> Optional[ComposeProgress]:
+    r"""
+    \brief Utility function to extract the progress of a single object from a 'compose up' output line
+
+    Both the v2 plugin and the standalone v1 formats are understood.
+
+    \param line (str) One line printed by Compose
+
+    \return (ComposeProgress) The parsed progress, None for any other line
+    """
+    match = _V2_PROGRESS.match(line)
+    if match:
+        return ComposeProgress(match.group(1), match.group(2), match.group(3))
+    match = _V2_PULL.match(line)
+    if match:
+        return ComposeProgress("Image", match.group(1), match.group(2))
+    match = _V1_PROGRESS.match(line)
+    if match:
+        verb, name, result = match.groups()
+        kind = "Image" if verb == "Pulling" else "Container"
+        if result == "done":
+            return ComposeProgress(kind, name, _V1_DONE[verb])
+        return ComposeProgress(kind, name, "Error" if result == "error" else verb)
+    match = _V1_UP_TO_DATE.match(line)
+    if match:
+        return ComposeProgress("Container", match.group(1), "Running")
+    return None
+
+def exec_compose(compose_file, on_line: Optional[Callable[[str], None]] = None,
+                 on_start: Optional[Callable[[subprocess.Popen], None]] = None):
+    r"""
+    \brief Execute Docker Compose command to start the environment
+
+    This fuction search for the version of Docker Compose installed on your system and
+    execute the precise command with '-d' flag (detatched), containers will run in background.
+    Stdout and stderr are merged and streamed line by line while the command runs.
+    
+    \param compose_file (Path or str) Absolute path to .yml/.yaml file.
+
+    \param on_line (callable) Called (on the calling thread) with every non-empty output line,
+    see parse_compose_progress.
+
+    \param on_start (callable) Called with the Popen handle as soon as Compose is launched,
+    so that another thread can cancel it with terminate_compose.
+
+    \return (list) List of argument of cmd (e.g. `['docker', 'compose', ...]`).
+
+    \throws ComposeNotFoundError If Docker Compose is not installed.
+    \throws DockerComposeError If errors occurs (e.g. invalid file, docker image not found),
+    with the output printed by Compose
+    """
+    cmd = compose_command(compose_file) + ["up", "-d"]
+    output = collections.deque(maxlen=200)
+
+    # The 'up -d' command is idempotent; running it multiple times will not create 
+    # duplicate containers but will update existing ones if the configuration changed.
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                               text=True, encoding='utf-8', errors='replace', bufsize=1)
+    if on_start:
+        on_start(process)
+    with process:
+        for line in process.stdout:
+            line = line.rstrip()
+            if not line:
+                continue
+            output.append(line)
+            if on_line:
+                on_line(line)
+        returncode = process.wait()
+
+    if returncode != 0:
+        lines = list(output)
+        # the error is usually at the end, progress lines come before it
+        tail = "\n".join(lines[-15:]) or "(no output)"
+        raise DockerComposeError(
+            f"'docker compose up' failed with exit code {returncode}:\n\n{tail}\n\n"
+            "Make sure Docker is running, the compose file is valid and "
+            "every image can be found or pulled.",
+            output=lines
         )
+        
+    return cmd
+
+
+def terminate_compose(process: subprocess.Popen, timeout: float = 5.0):
+    r"""
+    \brief Cancel a running Compose command (see exec_compose)
+
+    Compose is asked to stop with SIGTERM, so that it can abort the pending
+    operations cleanly, and is killed if it is still running after `timeout`.
+    The thread running exec_compose then gets a DockerComposeError.
+
+    \param process (Popen) The handle passed to `on_start`
+
+    \param timeout (float) Seconds to wait before SIGKILL
+    """
+    if process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+def compose_stop(compose_file, timeout=None):
+    r"""
+    \brief Stop every service of the project with a single Docker Compose command
+
+    Compose stops the containers in parallel, honouring the reverse dependency order,
+    and escalates to SIGKILL once the grace period expires.
+    
+    \param compose_file (Path or str) Absolute path to .yml/.yaml file.
+
+    \param timeout (int) Seconds to wait before SIGKILL, None for the compose default (10 s)
+
+    \return (list) List of argument of cmd (e.g. `['docker', 'compose', ...]`).
+
+    \throws ComposeNotFoundError If Docker Compose is not installed.
+    \throws DockerComposeError If the stop command fails
+    """
+    cmd = compose_command(compose_file) + ["stop"]
+    if timeout is not None:
+        cmd += ["-t", str(int(timeout))]
 
     try:
-        # The 'up -d' command is idempotent; running it multiple times will not create 
-        # duplicate containers but will update existing ones if the configuration changed.
         subprocess.run(cmd, check=True, capture_output=True, text=True, encoding='utf-8')
-    
     except subprocess.CalledProcessError as e:
-        error_message = (
-            "An error occurred while running 'docker compose up'.\n\n"
-            "This could be due to one of the following:\n\n"
-            "1. Docker is not currently running, make sure to start it first\n\n"
-            "2. Invalid Compose File: The selected file contains syntax errors, "
-            "references an invalid path, or is unreadable.\n\n"
-            "3. Image Not Found: A base image specified in the file (or its Dockerfile) "
-            "could not be found or pulled.\n\n"
-            "Please check the file's syntax and ensure Docker is running and "
-            "all required images are correct and accessible."
-        )
-        raise DockerComposeError(error_message)
-        
+        raise DockerComposeError(f"'docker compose stop' failed:\n{e.stderr or e.stdout}")
+
     return cmd
 
 
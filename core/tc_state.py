@@ -0,0 +1,163 @@
+r"""
+\file core/tc_state.py
+
+\brief Cache of the netem parameters installed on container interfaces
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+"""
+import threading
+from typing import Dict, NamedTuple, Optional
+
+class NetemParams(NamedTuple):
+    r"""
+    \brief Normalized netem parameters, comparable with what `tc -j qdisc show` reports
+
+    Units: delay in ms, loss in %, rate in Mbit/s, limit in packets.
+    """
+    delay: float
+    loss: float
+    rate: float
+    limit: int
+
+def normalize_params(delay, loss, band, limit) -> Optional[NetemParams]:
+    r"""
+    \brief Utility function to convert user values (as strings or numbers) into NetemParams
+
+    \return (NetemParams) Normalized parameters, or None if a value is not a number
+    """
+    try:
+        return NetemParams(round(float(delay), 3), round(float(loss), 2),
+                           round(float(band), 3), int(float(limit)))
+    except (TypeError, ValueError):
+        return None
+
+def params_from_qdisc(qdisc: Optional[dict]) -> Optional[NetemParams]:
+    r"""
+    \brief Utility function to read NetemParams from a root qdisc reported by `tc -j qdisc show`
+
+    `tc` reports delay in seconds, loss as a fraction and rate in bytes/s.
+
+    \return (NetemParams) The installed parameters, or None if the qdisc is not netem
+    """
+    if not qdisc or qdisc.get("kind") != "netem":
+        return None
+    options = qdisc.get("options", {})
+    delay = options.get("delay", {}).get("delay", 0)
+    loss = options.get("loss-random", {}).get("loss", 0)
+    rate = options.get("rate", {}).get("rate", 0)
+    return normalize_params(delay * 1000, loss * 100, rate * 8 / 1_000_000, options.get("limit", 0))
+
+class TcStateCache:
+    r"""
+    \brief Last known netem parameters of every (container, interface)
+
+    Entries are filled when rules are applied successfully or read back from the
+    container, and dropped when the container (and therefore its network namespace)
+    is started, stopped or restarted. A missing entry means "unknown", an entry set
+    to None means "no netem qdisc installed".
+
+    Every set() and invalidate() bumps the generation of the container. A reader
+    takes generation() before running `tc qdisc show` and passes it to
+    update_from_qdiscs: a snapshot read before a later apply is discarded instead
+    of overwriting the newly applied parameters.
+
+    Containers are identified by name, as done by the GUI.
+    """
+
+    def __init__(self):
+        self._state = {}
+        self._generations = {}
+        self._suspended = set()
+        self._lock = threading.Lock()
+
+    def generation(self, container: str) -> int:
+        with self._lock:
+            return self._generations.get(container, 0)
+
+    def known(self, container: str, eth: str) -> bool:
+        with self._lock:
+            return container not in self._suspended and (container, eth) in self._state
+
+    def get(self, container: str, eth: str) -> Optional[NetemParams]:
+        with self._lock:
+            return self._state.get((container, eth))
+
+    def set(self, container: str, eth: str, params: Optional[NetemParams]):
+        with self._lock:
+            self._state[(container, eth)] = params
+            self._generations[container] = self._generations.get(container, 0) + 1
+
+    def update_from_qdiscs(self, container: str, qdiscs: Dict[str, Optional[dict]],
+                           generation: Optional[int] = None) -> bool:
+        r"""
+        \brief Store the state read back from `tc -j qdisc show`, as `{interface: root qdisc}`
+
+        \param generation (int) generation() taken before the read, None to store unconditionally
+
+        \return (bool) False if the snapshot was discarded because the state changed meanwhile
+        """
+        with self._lock:
+            if generation is not None and generation != self._generations.get(container, 0):
+                return False
+            for eth, qdisc in qdiscs.items():
+                self._state[(container, eth)] = params_from_qdisc(qdisc)
+            return True
+
+    def suspend(self, container: str):
+        r"""
+        \brief Stop trusting the state of a container, e.g. while tc can be changed by hand in its terminal
+
+        Every interface is unknown until resume(), so no apply is skipped as "unchanged".
+        """
+        with self._lock:
+            self._suspended.add(container)
+        self.invalidate(container)
+
+    def resume(self, container: str):
+        r"""
+        \brief Trust the state of a suspended container again, starting from an empty state
+        """
+        with self._lock:
+            self._suspended.discard(container)
+        self.invalidate(container)
+
+    def invalidate(self, container: str, eth: str = None):
+        r"""
+        \brief Forget the state of one interface, or of every interface of the container
+        """
+        with self._lock:
+            if eth is not None:
+                self._state.pop((container, eth), None)
+            else:
+                for key in [k for k in self._state if k[0] == container]:
+                    del self._state[key]
+            self._generations[container] = self._generations.get(container, 0) + 1
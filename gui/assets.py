@@ -34,26 +34,136 @@ r"""
 | ---------- | --------------- | -----------------------------------------------
 | 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
 """
-import sys
+import os, sys
+import tkinter as tk
 from pathlib import Path
-from PIL import Image, ImageTk
+
+from core.config_manager import CONFIG_DIR
 
 # Determine the base directory depending on whether the script is frozen or not
 if getattr(sys, 'frozen', False):
     # if frozen (e.g., PyInstaller) the base dir is the temp folder created by PyInstaller
     BASE_DIR = Path(sys._MEIPASS)
+    # icons are cached next to the executable, or in the config dir if that folder is read-only
+    ICON_CACHE_DIRS = [Path(sys.executable).parent / "icon_cache", CONFIG_DIR / "icon_cache"]
 else:
     # if not frozen, use the script's directory
     BASE_DIR = Path(__file__).parent.parent
+    ICON_CACHE_DIRS = [CONFIG_DIR / "icon_cache"]
 
 # Images directory
 IMAGE_DIR = BASE_DIR / "images"
 
 
+def icon_cache_name(path, size):
+    r"""
+    \brief File name of the pre-resized copy of an image
+
+    The name embeds the requested size and the modification time and byte size
+    of the source, so an edited image never hits a stale entry. Frozen builds
+    extract their images at every launch, the executable's own mtime is used instead.
+
+    \param path (Path) Source image
+    \param size (tuple) (width, height) in pixels
+
+    \return (str) e.g. "start-20x20-18a3f0c2b1d4e000-1f4c.png"
+
+    \throws OSError If the source image does not exist
+    """
+    st = os.stat(path)
+    mtime = os.stat(sys.executable).st_mtime_ns if getattr(sys, 'frozen', False) else st.st_mtime_ns
+    return f"{Path(path).stem}-{size[0]}x{size[1]}-{mtime:x}-{st.st_size:x}.png"
+
+def render_icon(path, size, cache_dir):
+    r"""
+    \brief Resize an image with PIL and store it in the cache as PNG, removing stale sizes of the same entry
+
+    \return (Path) The cached file
+
+    \throws OSError If the source cannot be read or the cache cannot be written
+    """
+    from PIL import Image
+
+    cache_dir = Path(cache_dir)
+    name = icon_cache_name(path, size)
+    prefix = name.rsplit("-", 2)[0] + "-"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    img = Image.open(path)
+    img = img.resize(size)
+    target = cache_dir / name
+    tmp = cache_dir / f".{name}.{os.getpid()}.tmp"
+    img.save(tmp, "PNG")
+    os.replace(tmp, target)  # readers never see a half-written file
+
+    for old in cache_dir.glob(prefix + "*.png"):
+        if old.name != name:
+            try: old.unlink()
+            except OSError: pass
+    return target
+
+def cached_icon(path, size):
+    r"""
+    \brief Find the pre-resized copy of an image, rendering it on a cold cache
+
+    \return (Path) Cached PNG, None if it can be neither found nor written
+    """
+    try:
+        name = icon_cache_name(path, size)
+    except OSError:
+        return None
+    for cache_dir in ICON_CACHE_DIRS:
+        if (cache_dir / name).exists():
+            return cache_dir / name
+    for cache_dir in ICON_CACHE_DIRS:
+        try:
+            return render_icon(path, size, cache_dir)
+        except ImportError:
+            return None
+        except OSError:
+            continue
+    return None
+
 def load_image(path, size=(20, 20)):
+    r"""
+    \brief Load an icon resized to `size`
+
+    Warm cache: the PNG is decoded by Tk itself, PIL is not even imported.
+    Cold cache: PIL resizes the image once and the result is cached for the next launches.
+
+    \return (tk.PhotoImage) The icon, None if it cannot be loaded
+    """
+    cached = cached_icon(path, size)
+    if cached is not None:
+        try:
+            return tk.PhotoImage(file=str(cached))
+        except tk.TclError:
+            pass  # Tk without PNG support (< 8.6) or corrupted entry
+
+    # No usable cache: resize in memory, as before
     try:
+        from PIL import Image, ImageTk
         img = Image.open(path)
         img = img.resize(size)
         return ImageTk.PhotoImage(img)
-    except (FileNotFoundError, OSError):
+    except (ImportError, FileNotFoundError, OSError):
         return None
+
+
+class Icons:
+    r"""
+    \brief Icons of the GUI, decoded the first time each one is used
+
+    `icons.running` loads IMAGE_DIR/running.png, so that the project picker
+    only pays for the three icons it shows.
+    """
+
+    def __init__(self, size=(20, 20)):
+        self.size = size
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        image = load_image(IMAGE_DIR / f"{name}.png", self.size)
+        setattr(self, name, image)  # next lookups skip __getattr__
+        return image
@@ -0,0 +1,180 @@
+r"""
+\file gui/compose_window.py
+
+\brief Progress window of 'docker compose up'
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext
+
+from core.system_ops import parse_compose_progress
+
+class ComposeProgressWindow(tk.Toplevel):
+    r"""
+    \brief Window following 'docker compose up' while it runs in background.
+
+    Every line printed by Compose is appended to the log, lines describing an
+    object of the project (container, network, volume, image) update its row
+    in the table. Containers reaching STARTED_STATES advance the progress bar.
+    On success the window closes itself, on failure it stays open with the
+    whole Compose output.
+
+    \param parent The parent Tkinter window.
+    \param project_name Name of the project, shown in the title.
+    \param total Number of services of the project, 0 if unknown.
+    \param on_cancel Called when the user cancels Compose, None to hide the Cancel button.
+    """
+
+    STARTED_STATES = ("Started", "Running", "Healthy")
+    CLOSE_DELAY_MS = 1500
+
+    def __init__(self, parent, project_name, total=0, on_cancel=None):
+        super().__init__(parent)
+        self.total = total
+        self.on_cancel = on_cancel
+        self.started = set()
+        self.running = True
+
+        self.title(f"Starting {project_name}")
+        self.geometry("700x500")
+        self.protocol("WM_DELETE_WINDOW", self.destroy)  # compose keeps running
+
+        self._build_ui()
+
+    def _build_ui(self):
+        header = tk.Frame(self)
+        header.pack(fill="x", padx=10, pady=5)
+        self.status_var = tk.StringVar(value="docker compose up -d ...")
+        self.status_label = tk.Label(header, textvariable=self.status_var, font=("Arial", 12), anchor="w")
+        self.status_label.pack(fill="x")
+        self.progress = ttk.Progressbar(header, mode="determinate" if self.total else "indeterminate",
+                                        maximum=max(1, self.total))
+        self.progress.pack(fill="x", pady=5)
+        if not self.total:
+            self.progress.start(15)
+
+        ttk.Style().configure("Stats.Treeview", font=("Arial", 12), rowheight=24)
+        self.table = ttk.Treeview(self, columns=("object", "status"), show="headings",
+                                  style="Stats.Treeview", height=8)
+        self.table.heading("object", text="Object")
+        self.table.heading("status", text="Status")
+        self.table.column("object", width=450, anchor="w")
+        self.table.column("status", width=200, anchor="w")
+        self.table.pack(fill="both", expand=True, padx=10, pady=5)
+
+        self.log = scrolledtext.ScrolledText(self, height=10, font=("Courier", 10), state="disabled")
+        self.log.tag_config("error", foreground="red")
+        self.log.pack(fill="both", expand=True, padx=10, pady=5)
+
+        buttons = tk.Frame(self)
+        buttons.pack(pady=5)
+        self.cancel_button = ttk.Button(buttons, text="Cancel", command=self._cancel)
+        if self.on_cancel:
+            self.cancel_button.pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Close", command=self.destroy).pack(side=tk.LEFT, padx=5)
+
+    def _cancel(self):
+        if not self.running:
+            return
+        if messagebox.askyesno("Cancel", "Stop 'docker compose up'?\n"
+                               "Containers already created are kept.", parent=self):
+            self.cancel_button.config(state="disabled")
+            self.status_var.set("Cancelling docker compose up ...")
+            self.on_cancel()
+
+    def add_line(self, line):
+        r"""
+        \brief Utility function to show a line printed by Compose.
+
+        \param line (str) The output line.
+
+        \return None
+        """
+        progress = parse_compose_progress(line)
+        tag = ()
+        if progress is None:
+            if "error" in line.lower():
+                tag = ("error",)
+        else:
+            iid = f"{progress.kind}:{progress.name}"
+            values = (f"{progress.kind} {progress.name}", progress.status)
+            if self.table.exists(iid):
+                self.table.item(iid, values=values)
+            else:
+                self.table.insert("", "end", iid=iid, values=values)
+            self.table.see(iid)
+            if progress.status == "Error":
+                tag = ("error",)
+            if progress.kind == "Container" and progress.status in self.STARTED_STATES:
+                self.started.add(progress.name)
+                self._update_progress()
+
+        self.log.configure(state="normal")
+        self.log.insert(tk.END, line + "\n", tag)
+        self.log.see(tk.END)
+        self.log.configure(state="disabled")
+
+    def _update_progress(self):
+        if not self.total:
+            return
+        # replicas can make the containers outnumber the services
+        self.progress.configure(maximum=max(self.total, len(self.started)), value=len(self.started))
+        self.status_var.set(f"docker compose up -d ... {len(self.started)}/{max(self.total, len(self.started))} started")
+
+    def finish(self, error=None, cancelled=False):
+        r"""
+        \brief Utility function to show the outcome of 'compose up'.
+
+        \param error (Exception) The failure, None on success.
+        \param cancelled (bool) True if the user cancelled Compose, error is then ignored.
+
+        \return None
+        """
+        self.running = False
+        self.progress.stop()
+        self.cancel_button.config(state="disabled")
+        if cancelled:
+            self.progress.configure(mode="determinate", value=0)
+            self.status_var.set("docker compose up cancelled")
+            return
+        if error is None:
+            self.progress.configure(mode="determinate", maximum=1, value=1)
+            self.status_var.set("Project started")
+            self.after(self.CLOSE_DELAY_MS, self.destroy)
+            return
+
+        self.progress.configure(mode="determinate", value=0)
+        self.status_var.set("docker compose up failed, see the output below")
+        self.status_label.config(fg="red")
+        messagebox.showerror("Docker Compose error", str(error), parent=self)
@@ -0,0 +1,212 @@
+r"""
+\file gui/connectivity_window.py
+
+\brief Window showing the connectivity (RTT and loss) matrix between all running nodes
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+"""
+import tkinter as tk
+from tkinter import ttk
+
+from core.connectivity import ConnectivityMatrix
+from utils.task_pool import TaskPool
+
+class ConnectivityWindow(tk.Toplevel):
+    r"""
+    \brief Window with the all-pairs connectivity matrix of the project.
+
+    Every running node pings every other node (see core.connectivity): rows are
+    sources, columns are destinations, each cell shows the average RTT and is
+    colored by packet loss. Pings run in a dedicated bounded pool, sized by the
+    `ping_matrix_workers` setting, so they do not starve the main task pool
+    (with the async backend, the same setting bounds the pings on its event loop).
+
+    \param parent The parent Tkinter window.
+    \param controller The main application controller.
+    """
+
+    CELL = 56
+    HEADER = 150
+
+    COLOR_PENDING = "#555555"
+    COLOR_SELF = "#2b2b2b"
+    COLOR_OK = "#2e7d32"
+    COLOR_PARTIAL = "#f9a825"
+    COLOR_LOST = "#c62828"
+
+    def __init__(self, parent, controller):
+        super().__init__(parent)
+        self.controller = controller
+        self.nodes = []
+        self.labels = {}
+        self.running = False
+
+        self.pool = TaskPool(max_workers=max(1, controller.settings["ping_matrix_workers"]))
+        self.matrix = ConnectivityMatrix(controller.client, self.pool, backend=controller.async_docker)
+
+        self.title("Connectivity matrix")
+        self.geometry("900x700")
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        self._build_ui()
+        self.run()
+
+    def _build_ui(self):
+        toolbar = tk.Frame(self)
+        toolbar.pack(fill="x", padx=10, pady=5)
+        self.run_btn = ttk.Button(toolbar, text="Run all", style="Accent.TButton",
+            command=self.run)
+        self.run_btn.pack(side="left", padx=5)
+        self.rerun_btn = ttk.Button(toolbar, text="Re-run changed links",
+            command=lambda: self.run(only_changed=True))
+        self.rerun_btn.pack(side="left", padx=5)
+        self.status_label = tk.Label(toolbar, text="", font=("Arial", 12))
+        self.status_label.pack(side="left", padx=10)
+
+        canvas_frame = tk.Frame(self)
+        canvas_frame.pack(fill="both", expand=True, padx=10)
+        self.canvas = tk.Canvas(canvas_frame, highlightthickness=0)
+        y_scroll = ttk.Scrollbar(canvas_frame, orient="vertical", command=self.canvas.yview)
+        x_scroll = ttk.Scrollbar(canvas_frame, orient="horizontal", command=self.canvas.xview)
+        self.canvas.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
+        y_scroll.pack(side="right", fill="y")
+        x_scroll.pack(side="bottom", fill="x")
+        self.canvas.pack(fill="both", expand=True)
+        self.canvas.bind("<Button-1>", self._on_cell_click)
+
+        self.detail_label = tk.Label(self, text="Click a cell for details", font=("Courier New", 11), anchor="w")
+        self.detail_label.pack(fill="x", padx=10, pady=5)
+
+    def run(self, only_changed=False):
+        r"""
+        \brief Utility function to start a test run on the currently running nodes.
+
+        \param only_changed If True, only pairs whose link parameters changed are tested again.
+
+        \return None
+        """
+        if self.running:
+            return
+        states = self.controller.main_window.container_states
+        nodes = [name for name, c in sorted(states.items()) if c.state == "running"]
+        self.labels = {name: states[name].service or name for name in nodes}
+        if nodes != self.nodes:
+            only_changed = False # a different set of nodes needs a full run
+        self.nodes = nodes
+
+        self.running = True
+        self.run_btn.config(state="disabled")
+        self.rerun_btn.config(state="disabled")
+        self.status_label.config(text=f"Testing {len(nodes)} nodes...")
+        self._draw_grid(keep_results=only_changed)
+
+        self.matrix.run(nodes,
+            on_result=lambda src, dst, stats: self._post(self._draw_cell, src, dst, stats),
+            on_done=lambda tested: self._post(self._on_done, tested),
+            only_changed=only_changed)
+
+    def _post(self, fn, *args):
+        # Matrix callbacks run in worker threads, hand them over to Tk
+        try:
+            self.after(0, fn, *args)
+        except (tk.TclError, RuntimeError):
+            pass # window already closed
+
+    def _on_done(self, tested):
+        self.running = False
+        self.run_btn.config(state="normal")
+        self.rerun_btn.config(state="normal")
+        self.status_label.config(text=f"Done: {tested} pairs tested")
+
+    def _draw_grid(self, keep_results):
+        self.canvas.delete("all")
+        for i, name in enumerate(self.nodes):
+            offset = self.HEADER + i * self.CELL + self.CELL // 2
+            self.canvas.create_text(self.HEADER - 10, offset, text=self.labels[name],
+                                    anchor="e", fill="white", font=("Arial", 11))
+            self.canvas.create_text(offset, self.HEADER - 10, text=self.labels[name],
+                                    anchor="w", angle=90, fill="white", font=("Arial", 11))
+
+        for i, src in enumerate(self.nodes):
+            for j, dst in enumerate(self.nodes):
+                x = self.HEADER + j * self.CELL
+                y = self.HEADER + i * self.CELL
+                fill = self.COLOR_SELF if src == dst else self.COLOR_PENDING
+                self.canvas.create_rectangle(x, y, x + self.CELL - 2, y + self.CELL - 2,
+                                             fill=fill, outline="", tags=(f"rect:{src}:{dst}",))
+                self.canvas.create_text(x + self.CELL // 2, y + self.CELL // 2, text="",
+                                        fill="white", font=("Arial", 10), tags=(f"text:{src}:{dst}",))
+                if keep_results and (src, dst) in self.matrix.results:
+                    self._draw_cell(src, dst, self.matrix.results[(src, dst)])
+
+        size = self.HEADER + len(self.nodes) * self.CELL
+        self.canvas.configure(scrollregion=(0, 0, size, size))
+
+    def _draw_cell(self, src, dst, stats):
+        if stats.received == 0:
+            fill, text = self.COLOR_LOST, "✗"
+        elif stats.loss > 0:
+            fill, text = self.COLOR_PARTIAL, f"{stats.rtt_avg:.1f}"
+        else:
+            fill, text = self.COLOR_OK, f"{stats.rtt_avg:.1f}"
+        self.canvas.itemconfig(f"rect:{src}:{dst}", fill=fill)
+        self.canvas.itemconfig(f"text:{src}:{dst}", text=text)
+
+    def _on_cell_click(self, event):
+        x = self.canvas.canvasx(event.x) - self.HEADER
+        y = self.canvas.canvasy(event.y) - self.HEADER
+        if x < 0 or y < 0:
+            return
+        i, j = int(y // self.CELL), int(x // self.CELL)
+        if i >= len(self.nodes) or j >= len(self.nodes) or i == j:
+            return
+
+        src, dst = self.nodes[i], self.nodes[j]
+        stats = self.matrix.results.get((src, dst))
+        header = f"{self.labels[src]} -> {self.labels[dst]}"
+        if stats is None:
+            detail = f"{header}: pending"
+        elif stats.error:
+            detail = f"{header} ({stats.target}): {stats.error}"
+        elif stats.received == 0:
+            detail = f"{header} ({stats.target}): 100% loss"
+        else:
+            detail = (f"{header} ({stats.target}): rtt min/avg/max = "
+                      f"{stats.rtt_min:.2f}/{stats.rtt_avg:.2f}/{stats.rtt_max:.2f} ms, "
+                      f"loss {stats.loss:g}%")
+        self.detail_label.config(text=detail)
+
+    def _on_close(self):
+        self.matrix.cancel()
+        self.pool.shutdown(timeout=0)
+        self.controller.main_window.connectivity_window = None
+        self.destroy()
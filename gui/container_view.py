@@ -0,0 +1,337 @@
+r"""
+\file gui/container_view.py
+
+\brief Virtualized, filterable and groupable list of the project containers
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+"""
+
+import platform
+import tkinter as tk
+from tkinter import ttk
+
+from core.container_index import ContainerIndex, GROUP_MODES, row_container
+
+class ContainerView(ttk.Frame):
+    r"""
+    \brief Virtualized container list with a filter box and a grouping selector
+
+    Only the rows fitting in the widget exist in the Treeview: scrolling binds
+    the same few dozen items to other entries of the ContainerIndex, so scrolling,
+    filtering and refreshing 1000 containers costs about the same as 30.
+    The cells of every container are kept here and drawn when their row shows up.
+    Group headers show the aggregate status of their members, a click collapses them.
+
+    \param parent The parent tkinter widget.
+    \param icons Icons with the running, exited and other images.
+    \param columns Value columns of the Treeview, the first one is the status.
+    \param group_by Initial grouping, one of GROUP_MODES.
+    """
+
+    # Rows materialized before the widget is mapped and its height known
+    DEFAULT_PAGE = 20
+    # Rows scrolled by one mouse wheel step
+    WHEEL_ROWS = 3
+
+    def __init__(self, parent, icons, columns, group_by="none"):
+        super().__init__(parent)
+        self.icons = icons
+        self.index = ContainerIndex(group_by)
+
+        self._status = {}   # name -> (status text, icon)
+        self._cells = {}    # name -> other columns (stats)
+        self._drawn = {}    # iid -> (text, values, image, tags) of the materialized rows
+        self._shown = {}    # name -> iids of its materialized rows
+        self._top = 0       # index in index.rows() of the first materialized row
+        self._heading_height = 0
+        self._render_pending = False
+        self._selected = None
+
+        toolbar = ttk.Frame(self)
+        toolbar.pack(fill="x", padx=10, pady=5)
+        ttk.Label(toolbar, text="Filter:", font=("Arial", 13)).pack(side=tk.LEFT)
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add("write", self._on_filter_changed)
+        self.filter_entry = ttk.Entry(toolbar, textvariable=self.filter_var, width=40, font=("Arial", 13))
+        self.filter_entry.pack(side=tk.LEFT, padx=(5, 20))
+        ttk.Label(toolbar, text="Group by:", font=("Arial", 13)).pack(side=tk.LEFT)
+        self.group_var = tk.StringVar(value=self.index.group_by)
+        group_box = ttk.Combobox(toolbar, textvariable=self.group_var, values=GROUP_MODES,
+                                 state="readonly", width=10, font=("Arial", 13))
+        group_box.bind("<<ComboboxSelected>>", self._on_grouping_changed)
+        group_box.pack(side=tk.LEFT, padx=5)
+        self.count_label = ttk.Label(toolbar, text="", font=("Arial", 13))
+        self.count_label.pack(side=tk.RIGHT)
+
+        body = ttk.Frame(self)
+        body.pack(fill="both", expand=True)
+        self.scrollbar = ttk.Scrollbar(body, orient="vertical", command=self._yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill="y")
+        self.tree = ttk.Treeview(body, columns=columns, show="tree headings")
+        self.tree.pack(side=tk.LEFT, fill="both", expand=True)
+        self.tree.tag_configure("group", font=("Arial", 20, "bold"))
+
+        self.tree.bind("<Configure>", lambda e: self._schedule_render())
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<Button-1>", self._on_click)
+        for key in ("<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>"):
+            self.tree.bind(key, self._on_key)
+        if platform.system() == "Linux":
+            self.tree.bind("<Button-4>", self._on_wheel)
+            self.tree.bind("<Button-5>", self._on_wheel)
+        else:
+            self.tree.bind("<MouseWheel>", self._on_wheel)
+
+    # Rows
+
+    def set_container(self, container, status, icon):
+        r"""
+        \brief Add or update the row of a container, clearing its other columns
+
+        \param container (ContainerSummary) The container
+        \param status (str) Text of the status column
+        \param icon (tk.PhotoImage) Icon of the row
+        """
+        self._status[container.name] = (status, icon)
+        self._cells.pop(container.name, None)
+        if self.index.update(container):
+            self._schedule_render()
+        else:
+            self._draw_container(container.name)
+
+    def set_status(self, name, status, icon=None):
+        r"""
+        \brief Show a transient status (e.g. "starting...") on the row of a container, clearing its other columns
+        """
+        if name not in self.index:
+            return
+        self._status[name] = (status, self._status[name][1] if icon is None else icon)
+        self._cells.pop(name, None)
+        self._draw_container(name)
+
+    def set_cells(self, name, values):
+        r"""
+        \brief Set the columns following the status (e.g. the stats) of a container
+        """
+        if name in self.index:
+            self._cells[name] = tuple(values)
+            self._draw_container(name)
+
+    def remove_container(self, name):
+        self._status.pop(name, None)
+        self._cells.pop(name, None)
+        if self.index.remove(name):
+            self._schedule_render()
+
+    def names(self):
+        return self.index.names()
+
+    def is_visible(self, name):
+        r"""
+        \brief True if a row of the container is materialized, i.e. it matches the filter and is scrolled into view
+        """
+        return name in self._shown
+
+    def container_at(self, y):
+        r"""
+        \brief Name of the container of the row at the given y coordinate, None for headers and empty space
+        """
+        iid = self.tree.identify_row(y)
+        return row_container(iid) if iid else None
+
+    def selected_container(self):
+        selected = self.tree.selection()
+        return row_container(selected[0]) if selected else None
+
+    # Rendering
+
+    def _container_item(self, name, group):
+        status, icon = self._status.get(name, ("", None))
+        text = f"      {name}" if group is not None else f"  {name}"
+        return (text, (status,) + self._cells.get(name, ()), icon or "", ())
+
+    def _header_item(self, group):
+        states = group.states
+        if set(states) == {"running"}:
+            icon = self.icons.running
+        elif "running" not in states and "unhealthy" not in states:
+            icon = self.icons.exited
+        else:
+            icon = self.icons.other
+        summary = "  ·  ".join(f"{count} {state}" for state, count in
+                               sorted(states.items(), key=lambda item: (-item[1], item[0])))
+        arrow = "▸" if group.collapsed else "▾"
+        return (f"{arrow} {group.key} ({group.members})", (summary,), icon or "", ("group",))
+
+    def _draw(self, iid, item):
+        if self._drawn.get(iid) != item:
+            text, values, image, tags = item
+            self.tree.item(iid, text=text, values=values, image=image, tags=tags)
+            self._drawn[iid] = item
+
+    def _draw_container(self, name):
+        for iid in self._shown.get(name, ()):
+            self._draw(iid, self._container_item(name, iid.rpartition("/")[0] or None))
+
+    def _page(self):
+        # Rows fully visible below the headings
+        height = self.tree.winfo_height()
+        if height <= 1:
+            return self.DEFAULT_PAGE
+        rowheight = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        return max(1, (height - self._heading_height) // rowheight)
+
+    def _schedule_render(self):
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._render)
+
+    def _render(self):
+        # Materialize rows [top, top + page) of the flattened list, reusing the existing items
+        self._render_pending = False
+        rows = self.index.rows()
+        page = self._page()
+        self._top = max(0, min(self._top, len(rows) - page))
+        window = rows[self._top:self._top + page]
+
+        wanted = {row.iid for row in window}
+        stale = [iid for iid in self.tree.get_children() if iid not in wanted]
+        if stale:
+            self.tree.delete(*stale)
+            for iid in stale:
+                del self._drawn[iid]
+
+        # rows never change their relative order (the list is sorted), except when regrouped
+        kept = list(self.tree.get_children())
+        reorder = kept != [row.iid for row in window if row.iid in self._drawn]
+
+        self._shown = {}
+        for position, row in enumerate(window):
+            if row.name is None:
+                item = self._header_item(self.index.group(row.group))
+            else:
+                item = self._container_item(row.name, row.group)
+                self._shown.setdefault(row.name, []).append(row.iid)
+            if row.iid in self._drawn:
+                self._draw(row.iid, item)
+                if reorder:
+                    self.tree.move(row.iid, "", position)
+            else:
+                text, values, image, tags = item
+                self.tree.insert("", position, iid=row.iid, text=text, values=values, image=image, tags=tags)
+                self._drawn[row.iid] = item
+                if row.iid == self._selected:
+                    self.tree.selection_add(row.iid)
+        self.tree.yview_moveto(0)
+
+        total = len(rows)
+        self.scrollbar.set(self._top / total, (self._top + len(window)) / total) if total else self.scrollbar.set(0, 1)
+        self.count_label.config(text=f"{self.index.match_count} of {len(self.index)} containers")
+
+        # the headings height is only known once the first row is displayed
+        if window:
+            bbox = self.tree.bbox(window[0].iid)
+            if bbox and bbox[1] != self._heading_height:
+                self._heading_height = bbox[1]
+                self._schedule_render()
+
+    def _scroll_to(self, top):
+        top = max(0, min(top, len(self.index.rows()) - self._page()))
+        if top != self._top:
+            self._top = top
+            self._render()
+
+    # Event handlers
+
+    def _yview(self, *args):
+        # Scrollbar command: "moveto fraction" or "scroll n units|pages"
+        if args[0] == "moveto":
+            self._scroll_to(round(float(args[1]) * len(self.index.rows())))
+        elif args[0] == "scroll":
+            step = self._page() if args[2] == "pages" else 1
+            self._scroll_to(self._top + int(args[1]) * step)
+
+    def _on_wheel(self, event):
+        if event.num == 4:
+            steps = -1
+        elif event.num == 5:
+            steps = 1
+        elif platform.system() == "Darwin":
+            steps = -event.delta
+        else:
+            steps = -round(event.delta / 120)
+        self._scroll_to(self._top + steps * self.WHEEL_ROWS)
+        return "break"
+
+    def _on_key(self, event):
+        # Arrows move inside the materialized rows as usual, the list scrolls at their edges
+        children = self.tree.get_children()
+        if not children:
+            return None
+        focus = self.tree.focus()
+        position = children.index(focus) if focus in children else 0
+        total, page = len(self.index.rows()), self._page()
+        step = {"Up": -1, "Down": 1, "Prior": -page, "Next": page, "Home": -total, "End": total}[event.keysym]
+        if event.keysym in ("Up", "Down") and 0 <= position + step < len(children):
+            return None
+
+        target = max(0, min(total - 1, self._top + position + step))
+        if target < self._top:
+            self._scroll_to(target)
+        elif target >= self._top + page:
+            self._scroll_to(target - page + 1)
+        children = self.tree.get_children()
+        iid = children[max(0, min(len(children) - 1, target - self._top))]
+        self.tree.focus(iid)
+        self.tree.selection_set(iid)
+        return "break"
+
+    def _on_click(self, event):
+        iid = self.tree.identify_row(event.y)
+        if iid and row_container(iid) is None:
+            self.index.toggle_group(iid[:-1])
+            self._render()
+
+    def _on_select(self, event):
+        selected = self.tree.selection()
+        if selected:
+            self._selected = selected[0]
+
+    def _on_filter_changed(self, *args):
+        if self.index.set_filter(self.filter_var.get()):
+            self._top = 0
+            self._render()
+
+    def _on_grouping_changed(self, event=None):
+        self.index.set_grouping(self.group_var.get())
+        self._top = 0
+        self._render()
@@ -0,0 +1,138 @@
+r"""
+\file gui/diagnostics_window.py
+
+\brief Window showing the latency histograms of the Docker operations
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+"""
+
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+
+from utils.instrumentation import INSTRUMENTATION
+
+class DiagnosticsWindow(tk.Toplevel):
+    r"""
+    \brief Window with the latency of every instrumented operation.
+
+    Shows count, errors, mean, p50/p95/p99 and max latency and payload of every
+    Docker API call, docker_ops/system_ops function and GUI span recorded by
+    utils.instrumentation, overall or for a single container.
+    The table is refreshed every REFRESH_MS and can be exported to JSON or CSV.
+
+    \param parent The parent Tkinter window.
+    \param controller The main application controller.
+    """
+
+    REFRESH_MS = 2000
+    COLUMNS = ("operation", "count", "errors", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms", "payload")
+    ALL = "All containers"
+
+    def __init__(self, parent, controller):
+        super().__init__(parent)
+        self.controller = controller
+
+        self.title("Diagnostics")
+        self.geometry("1100x600")
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        self._build_ui()
+        self.refresh()
+
+    def _build_ui(self):
+        toolbar = tk.Frame(self)
+        toolbar.pack(fill="x", padx=10, pady=5)
+        tk.Label(toolbar, text="Container:", font=("Arial", 12)).pack(side="left")
+        self.container_var = tk.StringVar(value=self.ALL)
+        self.container_combo = ttk.Combobox(toolbar, textvariable=self.container_var,
+            state="readonly", width=30, font=("Arial", 12))
+        self.container_combo.pack(side="left", padx=5)
+        self.container_combo.bind("<<ComboboxSelected>>", lambda e: self.refresh())
+        ttk.Button(toolbar, text="Export JSON", command=lambda: self.export(".json")).pack(side="right", padx=5)
+        ttk.Button(toolbar, text="Export CSV", command=lambda: self.export(".csv")).pack(side="right", padx=5)
+        ttk.Button(toolbar, text="Reset", command=self.reset).pack(side="right", padx=5)
+
+        ttk.Style().configure("Stats.Treeview", font=("Arial", 12), rowheight=24)
+        table_frame = tk.Frame(self)
+        table_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        self.table = ttk.Treeview(table_frame, columns=self.COLUMNS, show="headings", style="Stats.Treeview")
+        for column in self.COLUMNS:
+            self.table.heading(column, text=column)
+            self.table.column(column, width=320 if column == "operation" else 90,
+                              anchor="w" if column == "operation" else "e")
+        y_scroll = ttk.Scrollbar(table_frame, orient="vertical", command=self.table.yview)
+        self.table.configure(yscrollcommand=y_scroll.set)
+        y_scroll.pack(side="right", fill="y")
+        self.table.pack(fill="both", expand=True)
+
+    def refresh(self):
+        r"""
+        \brief Utility function to redraw the table from the current histograms.
+
+        \return None
+        """
+        self.container_combo.config(values=[self.ALL] + INSTRUMENTATION.containers())
+        container = self.container_var.get()
+        rows = INSTRUMENTATION.rows("" if container == self.ALL else container)
+
+        names = {row["operation"] for row in rows}
+        for iid in self.table.get_children():
+            if iid not in names:
+                self.table.delete(iid)
+        for row in rows:
+            values = tuple(row[column] for column in self.COLUMNS)
+            if self.table.exists(row["operation"]):
+                self.table.item(row["operation"], values=values)
+            else:
+                self.table.insert("", "end", iid=row["operation"], values=values)
+
+        self._refresh_job = self.after(self.REFRESH_MS, self.refresh)
+
+    def export(self, extension):
+        path = filedialog.asksaveasfilename(parent=self, defaultextension=extension,
+            filetypes=[("JSON", "*.json")] if extension == ".json" else [("CSV", "*.csv")])
+        if not path:
+            return
+        try:
+            INSTRUMENTATION.export(path)
+        except OSError as e:
+            messagebox.showerror("Export error", str(e), parent=self)
+
+    def reset(self):
+        INSTRUMENTATION.reset()
+        self.after_cancel(self._refresh_job)
+        self.refresh()
+
+    def _on_close(self):
+        self.after_cancel(self._refresh_job)
+        self.controller.main_window.diagnostics_window = None
+        self.destroy()
@@ -38,9 +38,18 @@ r"""
 import tkinter as tk
 from tkinter import ttk, messagebox
 import platform
-import threading
+from concurrent.futures import Future
 
-from core import docker_ops, system_ops
+from core import docker_ops, system_ops, config_manager, compose_graph
+from core.stats_monitor import format_bytes, sparkline
+from gui.connectivity_window import ConnectivityWindow
+from gui.container_view import ContainerView
+from gui.diagnostics_window import DiagnosticsWindow
+from utils.task_pool import when_all
+from utils.refresh_scheduler import RefreshScheduler
+
+# Samples drawn in each sparkline column
+SPARK_WIDTH = 12
 
 class MainWindow(ttk.Frame):
     r"""
@@ -54,19 +63,48 @@ class MainWindow(ttk.Frame):
     \param controller The main application controller (DTGApp instance).
     """
     
+    # Refresh requests arriving within this window are served by one query
+    REFRESH_DELAY_MS = 100
+    # Period of the check for closed terminals
+    TERMINAL_POLL_MS = 1000
+
     def __init__(self, parent, controller):
         super().__init__(parent)
         self.parent = parent
         self.controller = controller
         
         # UI State
+        self.view = None
         self.tree = None
         self.refresh_btn = None
         self.start_button = None
         self.stop_button = None
+        self.apply_saved_button = None
+        self.connectivity_button = None
+        self.connectivity_window = None
+        self.diagnostics_button = None
+        self.diagnostics_window = None
         self.context_menu = None
+
+        # Last known state of every container, kept up to date by the event watcher
+        self.container_states = {}
+        # Events applied so far, and number of the last event of each container:
+        # refresh results older than an event of their container are stale for it
+        self._event_count = 0
+        self._last_event = {}
+        # Stats version drawn in each row, unchanged rows are not redrawn
+        self._stats_drawn = {}
+        # ContainerSummary shown by each row, unchanged rows are not redrawn by refreshes
+        self._rows_drawn = {}
+        # Refresh requests are coalesced and queried off the Tk thread
+        self.refresher = RefreshScheduler(self, self.controller.task_pool, self._query_containers,
+                                          self._apply_refresh, delay_ms=self.REFRESH_DELAY_MS)
+        self.qdisc_summary_label = None
+        self._qdisc_summary_pending = False
         
         self._build_main_ui()
+        if self.controller.stats_monitor:
+            self.after(max(250, self.controller.settings["stats_refresh_ms"]), self._refresh_stats)
         
         self.pack(fill="both", expand=True)
 
@@ -74,12 +112,15 @@ class MainWindow(ttk.Frame):
         r"""
         \brief Utility function to build the main UI components.
 
-        This fuction builds the Treeview for displaying Docker containers,
-        the control buttons, and sets up the context menu for container actions.
+        This fuction builds the Treeview for displaying Docker containers (a virtualized
+        ContainerView with its filter box), the control buttons, and sets up the context
+        menu for container actions.
 
         \return None
         """
-        self.tree = ttk.Treeview(self, columns=("Status",), show="tree headings")
+        self.view = ContainerView(self, self.controller.icons, ("Status", "CPU", "Memory", "Network"),
+                                  group_by=self.controller.settings.get("group_by", "none"))
+        self.tree = self.view.tree
         self.tree.bind("<Double-1>", self.on_tree_select)
 
         if platform.system() == "Darwin":
@@ -99,100 +140,275 @@ class MainWindow(ttk.Frame):
         self.tree.heading("#0", text="Container")
         self.tree.heading("Status", text="Status")
         self.tree.column("Status", anchor="center")
-        self.tree.pack(fill="both", expand=True)
+        for column, width in (("CPU", 260), ("Memory", 300), ("Network", 300)):
+            self.tree.heading(column, text=column)
+            self.tree.column(column, anchor="w", width=width)
+        self.view.pack(fill="both", expand=True)
+
+        self.qdisc_summary_label = tk.Label(self, text="Emulators: no data yet", font=("Arial", 13))
+        self.qdisc_summary_label.pack(fill="x", padx=10, pady=(5, 0))
 
         buttons_frame = tk.Frame(self)
         buttons_frame.pack(pady=10)
 
         self.refresh_btn = ttk.Button(buttons_frame, text="Refresh", 
-            image=self.controller.refresh_icon,
+            image=self.controller.icons.refresh,
             compound=tk.LEFT, command=self.refresh_containers)
         self.refresh_btn.pack()
 
         self.start_button = ttk.Button(buttons_frame, text="Start All", 
-            image=self.controller.start_icon, compound=tk.LEFT, 
+            image=self.controller.icons.start, compound=tk.LEFT, 
             command=self.start_all_containers)
         self.start_button.pack(side=tk.LEFT, padx=10, pady= 5)
 
         self.stop_button = ttk.Button(buttons_frame, text="Stop All", 
-            image=self.controller.stop_icon, compound=tk.LEFT, 
-            command=self.stop_all_containers)
+            image=self.controller.icons.stop, compound=tk.LEFT, 
+            command=lambda: self.stop_all_containers(timeout=max(0, self.controller.settings["stop_all_timeout"])))
         self.stop_button.pack(side=tk.LEFT, padx=10)
 
+        self.apply_saved_button = ttk.Button(buttons_frame, text="Apply Saved tc", 
+            command=self.apply_saved_configs)
+        self.apply_saved_button.pack(side=tk.LEFT, padx=10)
+
+        self.connectivity_button = ttk.Button(buttons_frame, text="Connectivity", 
+            command=self.open_connectivity_window)
+        self.connectivity_button.pack(side=tk.LEFT, padx=10)
+
+        self.diagnostics_button = ttk.Button(buttons_frame, text="Diagnostics", 
+            command=self.open_diagnostics_window)
+        self.diagnostics_button.pack(side=tk.LEFT, padx=10)
+
         self.context_menu = tk.Menu(self.parent, tearoff=0)
 
     # Business logic methods needed for main window
     
-    def refresh_containers(self):
+    def refresh_containers(self, names=None):
         r"""
         \brief Utility function to refresh the list of Docker containers shown in the GUI.
 
-        This fuction queries Docker via docker_ops for the current status of containers related 
-        to the active project and updates the Treeview accordingly. 
+        This fuction asks (through the RefreshScheduler) Docker via docker_ops for the
+        current status of containers related to the active project and updates the
+        Treeview accordingly, redrawing only the rows that changed.
         It also handles closing any open windows or terminals for containers 
         that have been removed or stopped.
+        Requests made within REFRESH_DELAY_MS are coalesced into one query, which
+        runs in the task pool: the GUI stays responsive during mass operations.
+        Once the event watcher is running, a full refresh is only needed at startup
+        or after a reconnection: single state changes arrive through apply_container_event.
 
-        \return None
+        \param names Names of the containers to refresh, None for the whole project.
 
-        \throw DockerError if Docker is not reachable
+        \return None
         """
+        self.refresher.request(names)
+
+    def _query_containers(self, names):
+        # Runs in the task pool: one /containers/json request, filtered by id when targeted.
+        # Returned with the number of events applied before the request was sent
+        event_count = self._event_count
+        if names is not None:
+            states = [self.container_states.get(name) for name in names]
+            if all(states):
+                return event_count, docker_ops.list_project_containers(
+                    self.controller.client, self.controller.project_name, [s.id for s in states])
+        return event_count, docker_ops.list_project_containers(self.controller.client, self.controller.project_name)
+
+    def _apply_refresh(self, names, future):
         try:
-            docker_containers = docker_ops.get_project_containers(
-                self.controller.client, self.controller.project_name
-            )
-            docker_container_names = {c.name for c in docker_containers}
+            event_count, docker_containers = future.result()
         except Exception as e:
-            messagebox.showerror("Docker Error", f"Docker is unavailable at the moment!\n{e}")
-            return 
+            if names is None:
+                messagebox.showerror("Docker Error", f"Docker is unavailable at the moment!\n{e}")
+            else:
+                print(f"Refresh of {len(names)} containers failed: {e}")
+            return
 
-        tree_container_names = set(self.tree.get_children())
-        deleted_names = tree_container_names - docker_container_names
+        # Containers that got an event while the query was running keep the newer state of the event
+        stale = {name for name, count in self._last_event.items() if count > event_count}
+        docker_container_names = {c.name for c in docker_containers}
+        shown = set(self.view.names())
+        deleted_names = (shown if names is None else shown & set(names)) - docker_container_names - stale
         
         for name in deleted_names:
-            self.tree.delete(name)
-            if name in self.controller.open_windows:
-                try: self.controller.open_windows[name].force_close()
-                except (tk.TclError, KeyError): pass
-            if name in self.controller.open_terminals:
-                proc = self.controller.open_terminals.pop(name, None)
-                if proc and proc.poll() is None:
-                    try: proc.terminate() 
-                    except Exception: pass    
+            self.view.remove_container(name)
+            self.container_states.pop(name, None)
+            self._rows_drawn.pop(name, None)
+            self._close_container_windows(name)
 
         for c in docker_containers:
-            if c.status != "running":
-                if c.name in self.controller.open_windows:
-                    try: self.controller.open_windows[c.name].force_close()
-                    except (tk.TclError, KeyError): pass
-                if c.name in self.controller.open_terminals:
-                    processo = self.controller.open_terminals.pop(c.name, None)
-                    if processo and processo.poll() is None:
-                        try: processo.terminate()
-                        except Exception: pass
-        
-            if not self.controller.lock_manager.is_locked(c.id):
-                if c.status == "running":
-                    icon = self.controller.running_icon
-                elif c.status == "exited":
-                    icon = self.controller.exited_icon
-                else:
-                    icon = self.controller.other_icon
-
-                if self.tree.exists(c.name):
-                    self.tree.item(c.name, values=(c.status,), image=icon)
-                else:
-                    self.tree.insert("", "end", iid=c.name,
-                                     text=f"  {c.name}",
-                                     values=(c.status,), image=icon)
+            if c.name in stale:
+                continue
+            self.container_states[c.name] = c
+            if c.state != "running":
+                self._close_container_windows(c.name)
+            if self._rows_drawn.get(c.name) != c:
+                self._render_row(c.name)
+        self._sync_qdisc_poller()
+
+    def apply_container_event(self, event):
+        r"""
+        \brief Utility function to apply a single container state change to the Treeview.
+
+        Invoked (on the Tk thread) for every event pushed by the ContainerEventWatcher.
+        Only the row of the affected container is updated.
+
+        \param event (ContainerEvent) The state change to apply.
+
+        \return None
+        """
+        self._event_count += 1
+        self._last_event[event.name] = self._event_count
+
+        if event.state or event.action == "destroy":
+            # a new network namespace (or none at all): installed netem rules are gone
+            docker_ops.forget_container(event.name)
+
+        if event.action == "destroy":
+            self.container_states.pop(event.name, None)
+            self._rows_drawn.pop(event.name, None)
+            self._close_container_windows(event.name)
+            self.view.remove_container(event.name)
+            self._sync_qdisc_poller()
+            return
+
+        state = self.container_states.get(event.name)
+        if state is None:
+            state = docker_ops.ContainerSummary(event.name, event.id, "created", None, event.service)
+            # networks and labels are not part of the event
+            self.refresh_containers([event.name])
+        state = state._replace(id=event.id)
+        if event.state:
+            state = state._replace(state=event.state)
+            if event.state != "running":
+                state = state._replace(health=None)
+        if event.health:
+            state = state._replace(health=event.health)
+        self.container_states[event.name] = state
+
+        if state.state != "running":
+            self._close_container_windows(event.name)
+        self._render_row(event.name)
+        self._sync_qdisc_poller()
+
+    def _show_row_status(self, name, text, icon=None):
+        # Transient text of a row while an operation is queued or running on it
+        self._rows_drawn.pop(name, None)
+        self.view.set_status(name, text, icon)
+
+    def _render_row(self, name):
+        # Rows of locked containers keep their "starting..."/"exiting..." text
+        # until the operation finalizes and renders them again
+        state = self.container_states.get(name)
+        if state is None or self.controller.lock_manager.is_locked(state.id):
+            return
+
+        status = state.state
+        if status == "running":
+            icon = self.controller.icons.running
+        elif status == "exited":
+            icon = self.controller.icons.exited
+        else:
+            icon = self.controller.icons.other
+        if state.health:
+            status = f"{status} ({state.health})"
+
+        # the stats columns are cleared and redrawn by the next _refresh_stats
+        self._stats_drawn.pop(name, None)
+        self._rows_drawn[name] = state
+        # rows are kept sorted by name (and group) by the view
+        self.view.set_container(state, status, icon)
+
+    def _refresh_stats(self):
+        # Runs on its own timer: samples arrive in the monitor ring buffers at the
+        # daemon pace, here only visible rows with new samples are redrawn
+        monitor = self.controller.stats_monitor
+        running = {name: s.id for name, s in self.container_states.items() if s.state == "running"}
+        monitor.sync(running)
+        for name in [n for n in self._stats_drawn if n not in running]:
+            del self._stats_drawn[name]
+
+        updates = []
+        with monitor.lock:
+            for name in running:
+                stats = monitor.get(name)
+                if stats is None or not stats.version or self._stats_drawn.get(name) == stats.version:
+                    continue
+                if not self.view.is_visible(name):
+                    continue
+                self._stats_drawn[name] = stats.version
+                cpu = stats.cpu.values()[-SPARK_WIDTH:]
+                memory = stats.memory.values()[-SPARK_WIDTH:]
+                rx = stats.rx_rate.values()[-SPARK_WIDTH:]
+                tx = stats.tx_rate.values()[-SPARK_WIDTH:]
+                network = [r + t for r, t in zip(rx, tx)]
+                updates.append((name, (
+                    f"{sparkline(cpu, max(cpu + [100.0]))} {cpu[-1]:.0f}%",
+                    f"{sparkline(memory, stats.memory_limit or None)} {format_bytes(memory[-1])}",
+                    f"{sparkline(network)} {format_bytes(network[-1])}/s" if network else "",
+                )))
+
+        for name, cells in updates:
+            self.view.set_cells(name, cells)
+
+        self.after(max(250, self.controller.settings["stats_refresh_ms"]), self._refresh_stats)
+
+    def _sync_qdisc_poller(self):
+        running = {name: s.id for name, s in self.container_states.items() if s.state == "running"}
+        self.controller.qdisc_poller.sync(running)
+
+    def schedule_qdisc_summary(self):
+        r"""
+        \brief Utility function to refresh the aggregated emulator statistics, at most twice per second.
+
+        \return None
+        """
+        if not self._qdisc_summary_pending:
+            self._qdisc_summary_pending = True
+            self.after(500, self._update_qdisc_summary)
+
+    def _update_qdisc_summary(self):
+        self._qdisc_summary_pending = False
+        netem = [rates for per_iface in self.controller.qdisc_poller.all_latest().values()
+                 for rates in per_iface.values() if rates.kind == "netem"]
+        if not netem:
+            self.qdisc_summary_label.config(text="Emulators: no netem qdisc installed")
+            return
+        self.qdisc_summary_label.config(text=(
+            f"Emulators: {len(netem)} links  ·  "
+            f"{format_bytes(sum(r.byte_rate for r in netem))}/s  ·  "
+            f"{sum(r.packet_rate for r in netem):.0f} pkt/s  ·  "
+            f"{sum(r.drop_rate for r in netem):.1f} drops/s  ·  "
+            f"backlog {format_bytes(sum(r.backlog for r in netem))}"
+        ))
+
+    def _sync_rows(self, names):
+        # Render rows from the state pushed by the event watcher, a full
+        # refresh is only needed if the watcher is not connected
+        watcher = self.controller.event_watcher
+        if watcher is not None and watcher.connected:
+            for name in names:
+                self._render_row(name)
+        else:
+            self.refresh_containers(names)
+
+    def _close_container_windows(self, name):
+        if name in self.controller.open_windows:
+            try: self.controller.open_windows[name].force_close()
+            except (tk.TclError, KeyError): pass
+        if name in self.controller.open_terminals:
+            proc = self.controller.open_terminals.pop(name, None)
+            if proc and proc.poll() is None:
+                try: proc.terminate() 
+                except Exception: pass    
 
     def start_container(self, row_id):
         r"""
         \brief Utility function to start a Docker container from the GUI.
 
         This function attempts to start the specified Docker container via docker_ops. 
-        It checks if the container is already running or locked, 
-        and updates the GUI accordingly.
-        The starting operation is performed in a separate thread to keep the GUI responsive.
+        It checks if the container is already running and updates the GUI accordingly,
+        if another operation is in progress on it the start is queued right after it.
+        The starting operation is performed in the shared task pool to keep the GUI responsive.
 
         \param row_id The identifier of the container to start (container name).
 
@@ -204,42 +420,34 @@ class MainWindow(ttk.Frame):
             messagebox.showerror("Docker Error", str(e))
             return
 
-        if self.controller.lock_manager.is_locked(container.id):
-            messagebox.showwarning("Busy", "You can't do that right now!")
-            return
-
-        if container.status == "running":
+        busy = self.controller.lock_manager.is_locked(container.id)
+        if container.status == "running" and not busy:
             messagebox.showinfo("Notice", f"{container.name} is already running!") 
             return
-        
-        self.controller.lock_manager.lock(container.id, "start")
-        self.tree.item(container.name, values=("starting...",))
 
         def do_start_worker():
-            try:
-                docker_ops.start_container_by_id(self.controller.client, container.id)
-                self.parent.after(0, finalize_ui_success)
-            except Exception as e:
-                self.parent.after(0, finalize_ui_error, e)
-        
-        def finalize_ui_success():
-            self.controller.lock_manager.unlock(container.id)
-            self.refresh_containers()
-        def finalize_ui_error(e):
-            messagebox.showerror("Errore", f"Impossibile avviare {container.name}:\n{e}")
-            self.controller.lock_manager.unlock(container.id)
-            self.refresh_containers()
+            self.parent.after(0, self._show_row_status, container.name, "starting...")
+            docker_ops.start_container_by_id(self.controller.client, container.id)
+
+        def finalize_ui(future):
+            if future.exception() is not None:
+                messagebox.showerror("Errore", f"Impossibile avviare {container.name}:\n{future.exception()}")
+            self._sync_rows([container.name])
 
-        threading.Thread(target=do_start_worker, daemon=True).start()
+        # queued after the running operation of the container, if any
+        self._show_row_status(container.name, "start queued" if busy else "starting...")
+        future = self.controller.lock_manager.run(
+            container.id, "start", lambda: self.controller.task_pool.submit(do_start_worker))
+        future.add_done_callback(lambda f: self.parent.after(0, finalize_ui, f))
 
     def stop_container(self, row_id):
         r"""
         \brief Utility function to stop a Docker container from the GUI.
 
         This fuction attempts to stop the specified Docker container via docker_ops. 
-        It checks if the container is already stopped or locked, 
-        and updates the GUI accordingly.
-        The stopping operation is performed in a separate thread to keep the GUI responsive.
+        It checks if the container is already stopped and updates the GUI accordingly,
+        if another operation is in progress on it the stop is queued right after it.
+        The stopping operation is performed in the shared task pool to keep the GUI responsive.
 
         \param row_id The identifier of the container to start (container name).
         
@@ -253,16 +461,13 @@ class MainWindow(ttk.Frame):
             messagebox.showerror("Docker error", str(e))
             return
 
-        if self.controller.lock_manager.is_locked(container.id):
-            messagebox.showwarning("Busy", "You can't do that right now!")
-            return
-        if container.status == "exited":
+        busy = self.controller.lock_manager.is_locked(container.id)
+        if container.status == "exited" and not busy:
             messagebox.showinfo("Notice", f"{container.name} is not running!")
             return
         
-        self.controller.lock_manager.lock(container.id, "stop")
         self.set_buttons_state("disabled") 
-        self.tree.item(container.name, values=("exiting...",), image=self.controller.exited_icon)
+        self._show_row_status(container.name, "stop queued" if busy else "exiting...", self.controller.icons.exited)
 
         def close_window_if_open():
             if container.name in self.controller.open_windows:
@@ -271,31 +476,27 @@ class MainWindow(ttk.Frame):
         self.parent.after(0, close_window_if_open) 
 
         def do_stop_worker():
-            try:
-                docker_ops.stop_container_by_id(self.controller.client, container.id)
-                self.parent.after(0, finalize_ui_success)
-            except Exception as e:
-                self.parent.after(0, finalize_ui_error, e)
-
-        def finalize_ui_success():
-            self.controller.lock_manager.unlock(container.id)
-            self.refresh_containers() 
-            self.reset_operation_flag()
-        def finalize_ui_error(e):
-            messagebox.showerror("Error", f"Can't stop {container.name}:\n{e}")
-            self.controller.lock_manager.unlock(container.id)
-            self.refresh_containers()
+            self.parent.after(0, self._show_row_status, container.name, "exiting...", self.controller.icons.exited)
+            docker_ops.stop_container_by_id(self.controller.client, container.id)
+
+        def finalize_ui(future):
+            if future.exception() is not None:
+                messagebox.showerror("Error", f"Can't stop {container.name}:\n{future.exception()}")
+            self._sync_rows([container.name]) 
             self.reset_operation_flag()
             
-        threading.Thread(target=do_stop_worker, daemon=True).start()
+        future = self.controller.lock_manager.run(
+            container.id, "stop", lambda: self.controller.task_pool.submit(do_stop_worker))
+        future.add_done_callback(lambda f: self.parent.after(0, finalize_ui, f))
 
     def restart_container(self, row_id):
         r"""
         \brief Utility function to restart a Docker container from the GUI.
 
         This fuction attempts to restart the specified Docker container via docker_ops. 
-        It checks if the container is locked, and updates the GUI accordingly.
-        The restarting operation is performed in a separate thread to keep the GUI responsive.
+        The restart is queued after the operation in progress on the container, if any,
+        and the GUI is updated accordingly.
+        The restarting operation is performed in the shared task pool to keep the GUI responsive.
         
         \param row_id The identifier of the container to start (container name).
 
@@ -309,90 +510,254 @@ class MainWindow(ttk.Frame):
             messagebox.showerror("Docker Error", str(e))
             return
 
-        if self.controller.lock_manager.is_locked(container.id):
-            messagebox.showwarning("Busy", "You can't do that right now!")
-            return
-        if not self.controller.lock_manager.lock(container.id, "restart"):
-            return
-            
+        busy = self.controller.lock_manager.is_locked(container.id)
         self.set_buttons_state("disabled") 
-        self.tree.item(container.name, values=("restarting...",), image=self.controller.exited_icon)
+        self._show_row_status(container.name, "restart queued" if busy else "restarting...", self.controller.icons.exited)
         
         def do_restart_worker():
-            try:
-                docker_ops.restart_container_by_id(self.controller.client, container.id)
-                self.parent.after(0, finalize_ui_success)
-            except Exception as e:
-                self.parent.after(0, finalize_ui_error, e)
-
-        def finalize_ui_success():
-            self.controller.lock_manager.unlock(container.id)
-            self.refresh_containers()
-            self.reset_operation_flag()
-        def finalize_ui_error(e):
-            messagebox.showerror("Error", f"Can't restart {container.name}:\n{e}")
-            self.controller.lock_manager.unlock(container.id)
-            self.refresh_containers()
+            self.parent.after(0, self._show_row_status, container.name, "restarting...", self.controller.icons.exited)
+            docker_ops.restart_container_by_id(self.controller.client, container.id)
+
+        def finalize_ui(future):
+            if future.exception() is not None:
+                messagebox.showerror("Error", f"Can't restart {container.name}:\n{future.exception()}")
+            self._sync_rows([container.name])
             self.reset_operation_flag()
             
-        threading.Thread(target=do_restart_worker, daemon=True).start()
+        future = self.controller.lock_manager.run(
+            container.id, "restart", lambda: self.controller.task_pool.submit(do_restart_worker))
+        future.add_done_callback(lambda f: self.parent.after(0, finalize_ui, f))
 
     def start_all_containers(self):
+        r"""
+        \brief Utility function to start every stopped container of the project.
+
+        The compose file is parsed into a service dependency graph and each container
+        is started as soon as its own `depends_on` services are running (or healthy),
+        independent services start in parallel in the shared task pool.
+        Containers busy with another operation are queued through the OperationLock:
+        the start begins once every stopped container is free.
+
+        \return None
+        """
+        try:
+            graph = compose_graph.load_service_graph(self.controller.compose_file)
+        except compose_graph.ComposeGraphError as e:
+            messagebox.showerror("Compose Error", str(e))
+            return
         try:
-            containers = docker_ops.get_project_containers(
+            containers = docker_ops.list_project_containers(
                 self.controller.client, self.controller.project_name
             )
         except Exception as e:
             messagebox.showerror("Docker Error", f"Containers could not be listed\n{e}")
             return
-        for container in containers:
-            if container.status != "running":
-                self.start_container(container.name)
 
-    def stop_all_containers(self, on_done=None):
-        self.set_buttons_state("disabled") 
-        containers_to_stop = [] 
-        
-        for row_id in self.tree.get_children():
-            current_status = self.tree.item(row_id, "values")[0]
-            if "running" in current_status:
+        lock_manager = self.controller.lock_manager
+        held = {}  # name -> Future releasing the lock of the container
+        acquired = []
+        for container in containers:
+            if container.state == "running":
+                continue
+            release, ready = Future(), Future()
+            def hold(release=release, ready=ready):
+                # Our turn: the lock is kept until the container has been handled
+                ready.set_result(None)
+                return release
+            lock_manager.run(container.id, "start", hold)
+            held[container.name] = release
+            acquired.append(ready)
+            self._show_row_status(container.name, "starting..." if ready.done() else "queued...")
+        if not held:
+            return
+        queued = not all(ready.done() for ready in acquired)
+
+        def finalize_container(name, error):
+            held.pop(name).set_result(None)
+            self._sync_rows([name])
+
+        def show_failures(results):
+            failures = [f"{name}: {error}" for name, error in sorted(results.items()) if error]
+            if failures:
+                more = f"\n... and {len(failures) - 20} more" if len(failures) > 20 else ""
+                messagebox.showerror("Start All", "Some containers could not be started:\n\n"
+                                     + "\n".join(failures[:20]) + more)
+
+        def start_held():
+            current = containers
+            if queued:
+                # The operations we waited for may have started or removed containers
                 try:
-                    container = docker_ops.get_container(self.controller.client, row_id)
-                    container_id = container.id
-                    container_name = container.name
-                    self.controller.lock_manager.lock(container_id, "stop")
-                    containers_to_stop.append((container_name, container_id))
-                    self.tree.item(row_id, values=("exiting...",), image=self.controller.exited_icon)
-                    if row_id in self.controller.open_windows:
-                        try: self.controller.open_windows[row_id].force_close()
-                        except(tk.TclError, KeyError): pass
+                    current = docker_ops.list_project_containers(
+                        self.controller.client, self.controller.project_name
+                    )
                 except Exception as e:
-                    print(f"Errore in stop_all: {e}")
+                    for name in list(held):
+                        finalize_container(name, e)
+                    messagebox.showerror("Docker Error", f"Containers could not be listed\n{e}")
+                    return
+            to_start = [c.name for c in current if c.name in held and c.state != "running"]
+            for name in list(held):
+                if name not in to_start:
+                    finalize_container(name, None)
+            if not to_start:
+                return
+            for name in to_start:
+                self._show_row_status(name, "starting...")
+
+            starter = compose_graph.DependencyStarter(self.controller.client, graph, self.controller.task_pool)
+            starter.run(current, to_start,
+                        on_result=lambda name, error: self.parent.after(0, finalize_container, name, error),
+                        on_done=lambda results: self.parent.after(0, show_failures, results))
+
+        if queued:
+            when_all(acquired, lambda _: self.parent.after(0, start_held))
+        else:
+            start_held()
 
-        def parallel_stop_manager():
-            threads = []
-            def stop_worker(container_name, container_id):
-                try:
-                    docker_ops.stop_container_by_id(self.controller.client, container_name)
-                except Exception as e:
-                    print(f"Errore durante l'arresto di {container_name}: {e}")
-                finally:
-                    self.controller.lock_manager.unlock(container_id) 
+    def stop_all_containers(self, on_done=None, timeout=None, on_progress=None, pool=None):
+        r"""
+        \brief Utility function to stop every running container of the project.
+
+        The stops run in parallel, bounded by the given pool (or the async backend when enabled).
+        Docker sends SIGTERM and escalates to SIGKILL once the grace period expires.
 
-            for name, c_id in containers_to_stop:
-                thread = threading.Thread(target=stop_worker, args=(name, c_id), daemon=True)
-                threads.append(thread)
-                thread.start()
+        \param on_done Called on the Tk thread once every container has been stopped.
+        \param timeout Grace period in seconds before SIGKILL, None for the Docker default.
+        \param on_progress Called on the Tk thread as on_progress(stopped, total) after each stop.
+        \param pool TaskPool running the stops, defaults to the shared one.
 
-            for thread in threads:
-                thread.join()
+        \return None
+        """
+        self.set_buttons_state("disabled") 
+        containers_to_stop = [] 
 
+        try:
+            containers = docker_ops.list_project_containers(
+                self.controller.client, self.controller.project_name
+            )
+        except Exception as e:
+            print(f"Errore in stop_all: {e}")
+            containers = []
+        
+        lock_manager = self.controller.lock_manager
+        for container in containers:
+            # busy containers (e.g. still starting) are stopped right after their operation
+            if container.state == "running" or lock_manager.is_locked(container.id):
+                containers_to_stop.append((container.name, container.id))
+                self._show_row_status(container.name, "exiting...", self.controller.icons.exited)
+                if container.name in self.controller.open_windows:
+                    try: self.controller.open_windows[container.name].force_close()
+                    except(tk.TclError, KeyError): pass
+
+        total = len(containers_to_stop)
+        stopped = [0]
+        if on_progress:
+            on_progress(0, total)
+
+        def report_progress():
+            stopped[0] += 1
+            if on_progress:
+                on_progress(stopped[0], total)
+
+        def on_stopped(future, container_name):
+            if not future.cancelled() and future.exception():
+                print(f"Errore durante l'arresto di {container_name}: {future.exception()}")
+            self.parent.after(0, report_progress)
+
+        def on_all_stopped(futures):
             self.parent.after(0, self.reset_operation_flag)
-            self.parent.after(0, self.refresh_containers)
+            self.parent.after(0, self._sync_rows, [name for name, _ in containers_to_stop])
             if on_done:
                 self.parent.after(0, on_done)
 
-        threading.Thread(target=parallel_stop_manager, daemon=True).start()
+        backend = self.controller.async_docker
+        if backend is not None:
+            # One event loop thread, at most pool_size requests in flight
+            def start(name, c_id):
+                # As in stop_container_by_id: netem state and shell session do not survive the stop
+                docker_ops.forget_container(name)
+                return backend.submit(backend.client.stop(c_id, timeout=timeout))
+        else:
+            # Stops are bounded by the shared pool, no manager thread is needed
+            pool = pool or self.controller.task_pool
+            start = lambda name, c_id: pool.submit(docker_ops.stop_container_by_id, self.controller.client,
+                                                   name, timeout=timeout)
+
+        futures = []
+        for name, c_id in containers_to_stop:
+            future = lock_manager.run(c_id, "stop", lambda name=name, c_id=c_id: start(name, c_id))
+            future.add_done_callback(lambda f, name=name: on_stopped(f, name))
+            futures.append(future)
+        when_all(futures, on_all_stopped)
+
+    def apply_saved_configs(self):
+        r"""
+        \brief Utility function to apply the saved tc configs of every running container.
+
+        This fuction loads the configurations saved from the node windows and pushes
+        them to all running containers at once via docker_ops.submit_tc_bulk:
+        one `tc -batch` exec per container, executed in parallel in the shared task pool
+        (or on the event loop of the async backend, if enabled).
+        A per-link report is shown when every container is done.
+
+        \return None
+        """
+        saved = config_manager.load_project_configs(self.controller.project_name)
+        plan = {name: saved[name] for name, container in self.container_states.items()
+                if container.state == "running" and name in saved}
+
+        if not plan:
+            messagebox.showinfo("Notice", "There are no saved configs for the running containers.")
+            return
+
+        self.apply_saved_button.config(state="disabled")
+        futures = docker_ops.submit_tc_bulk(self.controller.client, plan, self.controller.task_pool,
+                                            backend=self.controller.async_docker)
+
+        def on_all_applied(_):
+            results = {name: future.result() for name, future in futures.items()}
+            self.parent.after(0, show_report, results)
+
+        def show_report(results):
+            self.apply_saved_button.config(state="normal")
+            failed = [f"{name} {r.interface}: {r.output}"
+                      for name, iface_results in results.items()
+                      for r in iface_results.values() if r.status == "failed"]
+            statuses = [r.status for iface_results in results.values() for r in iface_results.values()]
+            summary = (f"{len(statuses)} links on {len(results)} containers: "
+                       f"{statuses.count('applied')} applied, {statuses.count('unchanged')} unchanged, "
+                       f"{len(failed)} failed.")
+            if failed:
+                messagebox.showwarning("Apply Saved tc", summary + "\n\nFailed:\n" + "\n".join(failed[:10]))
+            else:
+                messagebox.showinfo("Apply Saved tc", summary)
+
+        when_all(futures.values(), on_all_applied)
+
+    def open_connectivity_window(self):
+        r"""
+        \brief Utility function to open (or raise) the connectivity matrix window.
+
+        \return None
+        """
+        if self.connectivity_window is not None:
+            self.connectivity_window.lift()
+            self.connectivity_window.focus_force()
+            return
+        self.connectivity_window = ConnectivityWindow(self.parent, self.controller)
+
+    def open_diagnostics_window(self):
+        r"""
+        \brief Utility function to open (or raise) the window with the operation latencies.
+
+        \return None
+        """
+        if self.diagnostics_window is not None:
+            self.diagnostics_window.lift()
+            self.diagnostics_window.focus_force()
+            return
+        self.diagnostics_window = DiagnosticsWindow(self.parent, self.controller)
 
     def open_terminal(self, row_id):
         r"""
@@ -400,7 +765,8 @@ class MainWindow(ttk.Frame):
 
         This fuction uses system_ops to open a terminal window attached 
         to the specified Docker container. 
-        It checks if the container is locked or already has an open terminal.
+        It checks if the container already has an open terminal, a busy container
+        gets its terminal once its operations are done.
 
         \param row_id The identifier of the container to open a terminal for (container name).
 
@@ -415,7 +781,9 @@ class MainWindow(ttk.Frame):
             return
 
         if self.controller.lock_manager.is_locked(container.id):
-            messagebox.showwarning("Busy", "You can't do that right now!")
+            # opened once the running (and queued) operations are done
+            self.controller.lock_manager.idle_future(container.id).add_done_callback(
+                lambda f: self.parent.after(0, self.open_terminal, row_id))
             return
         if container.status != "running":
             messagebox.showinfo("Notice", f"{container.name} is not running!") 
@@ -432,15 +800,31 @@ class MainWindow(ttk.Frame):
         try:
             proc = system_ops.open_terminal(container.name)
             self.controller.open_terminals[container.name] = proc
+            # tc may be changed by hand from the terminal: no cached state is trusted until it closes
+            docker_ops.TC_STATE.suspend(container.name)
+            self.after(self.TERMINAL_POLL_MS, self._watch_terminal, container.name, proc)
         except system_ops.TerminalError as e:
             messagebox.showerror("Error", str(e), parent=self.parent)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open terminal:\n{e}", parent=self.parent)
     
+    def _watch_terminal(self, name, proc):
+        if proc.poll() is None:
+            self.after(self.TERMINAL_POLL_MS, self._watch_terminal, name, proc)
+            return
+        current = self.controller.open_terminals.get(name)
+        if current is proc:
+            del self.controller.open_terminals[name]
+        elif current is not None and current.poll() is None:
+            return  # a newer terminal of the container is open
+        # whatever was changed by hand is read back before the next apply
+        docker_ops.TC_STATE.resume(name)
+
     def show_context_menu(self, event):
-            row_id = self.tree.identify_row(event.y)
-            self.tree.selection_set(row_id)
+            # group headers have no container and no menu
+            row_id = self.view.container_at(event.y)
             if row_id:
+                self.tree.selection_set(self.tree.identify_row(event.y))
                 self.context_menu.delete(0, tk.END)
                 self.context_menu.add_command(label="Channel Emulator", font=("Arial", 14), 
                     command=lambda: self.controller.open_container_window(row_id))
@@ -470,8 +854,7 @@ class MainWindow(ttk.Frame):
             self.set_buttons_state("normal")
 
     def on_tree_select(self, event):
-        selected = self.tree.selection()
-        if selected:
-            container_name = selected[0]
+        container_name = self.view.selected_container()
+        if container_name:
             # Open new window with controller
             self.controller.open_container_window(container_name)
\ No newline at end of file
@@ -37,11 +37,15 @@ r"""
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-import threading
 import ipaddress
+import queue
+import threading
 
 # Import of our modules
 from core import docker_ops, config_manager
+from core.stats_monitor import format_bytes
+from core.config_store import config_from_params
+from core.tc_state import normalize_params
 
 class NodeWindow(tk.Toplevel):
     r"""
@@ -56,6 +60,9 @@ class NodeWindow(tk.Toplevel):
     \param container_name The name of the Docker container associated with this window.
     """
     
+    # Console updates while a ping is running are batched at this rate
+    PING_REFRESH_MS = 100
+
     # Constructor
     def __init__(self, parent, controller, container_name):
         super().__init__(parent)
@@ -72,7 +79,7 @@ class NodeWindow(tk.Toplevel):
             self.container_name
         )
 
-        self.geometry("1150x700")
+        self.geometry("1150x820")
         self.wm_minsize(1150, 350)
         self.title(f"{self.container_name}")
         self.bind("<Button-1>", self._clear_focus)
@@ -82,9 +89,17 @@ class NodeWindow(tk.Toplevel):
         
         self.force_close = self._force_close
 
+        # Running ping, see do_ping
+        self._ping_exec = None
+        self._ping_stop_requested = False
+
         # Build UI
         self._build_ui()
 
+        # Counters are polled at the fast rate while this window is open
+        self.controller.qdisc_poller.watch(self.container_name)
+        self.show_qdisc_stats(self.controller.qdisc_poller.latest(self.container_name))
+
     # Widget creation
     def _build_ui(self):
         r"""
@@ -121,21 +136,19 @@ class NodeWindow(tk.Toplevel):
             messagebox.showerror("Error", f"Cannot find interfaces for {self.container_name}.\n{e}", parent=self)
             interfaces = []
             
+        # Combobox shows "eth0 - 10.0.0.2/24" labels, map them back to interface names
+        self.interfaces = {iface.label: iface for iface in interfaces}
         self.interface_var = tk.StringVar()
-        interface_combo = ttk.Combobox(tc_frame, textvariable=self.interface_var, values=interfaces, state="readonly", width=20, font=("Arial", 12))
+        interface_combo = ttk.Combobox(tc_frame, textvariable=self.interface_var, values=list(self.interfaces), state="readonly", width=20, font=("Arial", 12))
         
         if interfaces:
-            saved_iface_name = None
-            existing_saved_ifaces = [iface for iface in self.all_container_configs.keys() if iface in [i.split(" - ")[0] for i in interfaces]]
-            if existing_saved_ifaces: saved_iface_name = existing_saved_ifaces[0]
             target_index = 0
-            if saved_iface_name:
-                for i, iface_string in enumerate(interfaces):
-                    if iface_string.startswith(saved_iface_name):
-                        target_index = i
-                        break 
+            for i, iface in enumerate(interfaces):
+                if iface.name in self.all_container_configs:
+                    target_index = i
+                    break 
             interface_combo.current(target_index)
-            self.current_iface_tracker[0] = interfaces[target_index].split(" - ")[0]
+            self.current_iface_tracker[0] = interfaces[target_index].name
 
         interface_combo.grid(row=2, column=0, padx=10)
         interface_combo.bind("<<ComboboxSelected>>", self._update_spinboxes_for_interface)
@@ -183,6 +196,18 @@ class NodeWindow(tk.Toplevel):
         self.limit_spinbox.bind("<KeyRelease>", self._set_config_dirty)
         self.limit_spinbox.bind("<ButtonRelease>", self._set_config_dirty)
 
+        #  --  Emulator statistics section  --
+        stats_frame = ttk.LabelFrame(self, text=" Emulator Statistics ", padding=(10,10))
+        stats_frame.pack(pady=5, padx=10, fill="x")
+        ttk.Style().configure("Stats.Treeview", font=("Arial", 12), rowheight=24)
+        columns = ("Interface", "Qdisc", "Sent", "Packets/s", "Drops/s", "Overlimits/s", "Backlog", "Total drops")
+        self.qdisc_tree = ttk.Treeview(stats_frame, columns=columns, show="headings",
+                                       style="Stats.Treeview", height=max(1, min(len(interfaces), 4)))
+        for column in columns:
+            self.qdisc_tree.heading(column, text=column)
+            self.qdisc_tree.column(column, width=120, anchor="center")
+        self.qdisc_tree.pack(fill="x")
+
         #  --  Ping section  --
         ping_frame = ttk.LabelFrame(self, text=" Network Test ", padding=(10,10))
         ping_frame.pack(pady=10)
@@ -191,9 +216,23 @@ class NodeWindow(tk.Toplevel):
         self.ipaddr_entry.insert(0, "") 
         self.ipaddr_entry.grid(row=1, column=0, padx=10)
         
+        tk.Label(ping_frame, text="Count:", font=("Arial", 13)).grid(row=0, column=1, padx=10, pady=5)
+        self.ping_count_spinbox = ttk.Spinbox(ping_frame, from_=1, to=1000, increment=1, font=("Arial", 12), width=5)
+        self.ping_count_spinbox.set("4")
+        self.ping_count_spinbox.grid(row=1, column=1, padx=10)
+
+        tk.Label(ping_frame, text="Interval (s):", font=("Arial", 13)).grid(row=0, column=2, padx=10, pady=5)
+        self.ping_interval_spinbox = ttk.Spinbox(ping_frame, from_=0.2, to=60.0, increment=0.2, font=("Arial", 12), format="%.1f", width=5)
+        self.ping_interval_spinbox.set("1.0")
+        self.ping_interval_spinbox.grid(row=1, column=2, padx=10)
+        
         self.ping_btn = ttk.Button(ping_frame, text="Ping", style="Accent.TButton",
             command=self.do_ping)
-        self.ping_btn.grid(row=1, column=2, padx=10, pady=5)
+        self.ping_btn.grid(row=1, column=3, padx=10, pady=5)
+
+        self.stop_ping_btn = ttk.Button(ping_frame, text="Stop", state="disabled",
+            command=self.stop_ping)
+        self.stop_ping_btn.grid(row=1, column=4, padx=10, pady=5)
         
         # -- Console section --
         self.toggle_btn = ttk.Button(self, text="Hide Console", command=self._toggle_console)
@@ -226,18 +265,18 @@ class NodeWindow(tk.Toplevel):
 
         \return None
         """
-        new_iface_name = self.interface_var.get().split(" - ")[0]
+        new_iface_name = self._selected_interface_name()
         old_iface_name = self.current_iface_tracker[0]
         
         if old_iface_name and old_iface_name != new_iface_name:
-            current_values_in_spinbox = {
-                "delay": self.delay_spinbox.get(), "loss": self.loss_spinbox.get(),
-                "band": self.band_spinbox.get(), "limit": self.limit_spinbox.get()
-            }
+            current_values_in_spinbox = self._spinbox_values()
             stored_values_for_old_iface = self.all_container_configs.get(old_iface_name, {
                 "delay": "20", "loss": "0", "band": "1.0", "limit": "10"
             })
-            if current_values_in_spinbox != stored_values_for_old_iface:
+            # compared as numbers, "1" and "1.0" are the same bandwidth
+            if (current_values_in_spinbox != stored_values_for_old_iface and
+                    normalize_params(*current_values_in_spinbox.values()) !=
+                    normalize_params(*stored_values_for_old_iface.values())):
                 self.all_container_configs[old_iface_name] = current_values_in_spinbox
                 self._set_config_dirty()
         
@@ -254,6 +293,10 @@ class NodeWindow(tk.Toplevel):
             self.limit_spinbox.set("10")
         self.current_iface_tracker[0] = new_iface_name
 
+    def _selected_interface_name(self):
+        iface = self.interfaces.get(self.interface_var.get())
+        return iface.name if iface else None
+
     def _on_close(self):
         r"""
         \brief Utility function to notify unsaved changes on close.
@@ -266,6 +309,9 @@ class NodeWindow(tk.Toplevel):
             if not messagebox.askyesno("Unsaved Changes", "You have unsaved changes that will be lost.\nAre you sure you want to close?", parent=self):
                 return
         
+        self.stop_ping()
+        self.controller.qdisc_poller.unwatch(self.container_name)
+
         # remove this window from window tracker
         del self.controller.open_windows[self.container_name]
         self.destroy()
@@ -292,31 +338,87 @@ class NodeWindow(tk.Toplevel):
         \brief Utility function to save current configurations.
 
         This fuction saves the current traffic control configurations 
-        for the selected interface using config_manager.
+        for the selected interface using config_manager. The write happens
+        in background, the button shows "Saved" once it is on disk.
 
         \return None
         """
-        # Call core_function
-        config_manager.save_configs(
-            self.controller.project_name,
-            self.container_name, 
-            self.interface_var.get(), 
-            self.delay_spinbox, 
-            self.loss_spinbox, 
-            self.band_spinbox, 
-            self.limit_spinbox, 
-            self, # win is now self
-            self.config_status,
-            self.save_btn,
-            self.all_container_configs
-        )
+        interface = self._selected_interface_name()
+        if interface is None:
+            messagebox.showwarning("No interface", "Select an interface of the container first.", parent=self)
+            return
+        params = normalize_params(*self._spinbox_values().values())
+        try:
+            if params is None:
+                raise ValueError
+            # the rounded values, exactly as they are stored
+            config = config_from_params(params)
+        except ValueError:
+            messagebox.showerror("Invalid values", "Delay, loss, bandwidth and limit must be numbers.", parent=self)
+            return
+
+        self.all_container_configs[interface] = config
+        self.config_status[0] = True
+        self.save_btn.config(text="Saving...")
+
+        future = config_manager.save_link_config(self.controller.project_name, self.container_name, interface, params)
+        # the callback runs on the writer thread, the root outlives this window
+        future.add_done_callback(lambda f: self.controller.root.after(0, self._on_configs_saved, f))
+
+    def _on_configs_saved(self, future):
+        try:
+            if not self.save_btn.winfo_exists():
+                return
+        except tk.TclError:
+            return
+
+        if future.exception() is not None:
+            self.config_status[0] = False
+            self.save_btn.config(text="Save failed")
+            return
+        if self.config_status[0]:  # not modified again in the meantime
+            self.save_btn.config(text="Saved")
+            self.after(2000, self._revert_save_text)
+
+    def _revert_save_text(self):
+        if self.config_status[0]:
+            self.save_btn.config(text="Save configs")
+
+    def _spinbox_values(self):
+        return {
+            "delay": self.delay_spinbox.get(), "loss": self.loss_spinbox.get(),
+            "band": self.band_spinbox.get(), "limit": self.limit_spinbox.get()
+        }
+
+    def show_qdisc_stats(self, rates):
+        r"""
+        \brief Utility function to show the last qdisc counters deltas of every interface.
+
+        Invoked (on the Tk thread) for every poll of this container, see QdiscPoller.
+
+        \param rates Dictionary {interface: QdiscRates}
+
+        \return None
+        """
+        for eth in sorted(rates):
+            r = rates[eth]
+            values = (eth, r.kind, f"{format_bytes(r.byte_rate)}/s", f"{r.packet_rate:.1f}",
+                      f"{r.drop_rate:.1f}", f"{r.overlimit_rate:.1f}",
+                      f"{format_bytes(r.backlog)} / {r.qlen}p", str(r.drops))
+            if self.qdisc_tree.exists(eth):
+                self.qdisc_tree.item(eth, values=values)
+            else:
+                self.qdisc_tree.insert("", "end", iid=eth, values=values)
+        for eth in self.qdisc_tree.get_children():
+            if eth not in rates:
+                self.qdisc_tree.delete(eth)
 
     def _toggle_console(self):
         self.show_console = not self.show_console
         if self.show_console:
             self.console_frame.pack(expand=True, fill="both", padx=10, pady=5)
             self.toggle_btn.config(text="Hide Console")
-            self.geometry("1150x700")
+            self.geometry("1150x820")
         else:
             self.console_frame.pack_forget()
             self.toggle_btn.config(text="Show Console")
@@ -330,6 +432,12 @@ class NodeWindow(tk.Toplevel):
         except KeyError:
             pass
     
+    def _append_console(self, text):
+        self.output_box.config(state="normal")
+        self.output_box.insert(tk.END, text)
+        self.output_box.see(tk.END)
+        self.output_box.config(state="disabled")
+
     def clear_console(self):
         self.output_box.config(state="normal")
         self.output_box.delete("1.0", tk.END)
@@ -342,10 +450,15 @@ class NodeWindow(tk.Toplevel):
         This fuction retrieves the parameters from the spinboxes, validates them,
         and then applies the traffic control rules inside the Docker container using docker_ops.
         It also handles displaying the output or any errors in the console area.
-        Tc command is executed in a separate thread to keep the UI responsive.
+        Tc command is executed in the shared task pool to keep the UI responsive.
 
         \return None
         """
+        eth = self._selected_interface_name()
+        if eth is None:
+            messagebox.showwarning("No interface", "Select an interface of the container first.", parent=self)
+            return
+
         delay = self.delay_spinbox.get()
         loss = self.loss_spinbox.get()
         bandwidth = self.band_spinbox.get()
@@ -378,8 +491,7 @@ class NodeWindow(tk.Toplevel):
         if flag == False: 
             return
         
-        eth = self.interface_var.get().split(" - ")[0]
-        cmd_string_for_output = f"tc qdisc replace dev {eth} root netem delay {delay}ms loss {loss}% rate {bandwidth}Mbit limit {limit}"
+        cmd_string_for_output = docker_ops.tc_command(eth, delay, loss, bandwidth, limit)
 
         def do_tc_worker():
             try:
@@ -389,29 +501,33 @@ class NodeWindow(tk.Toplevel):
                     eth, delay, loss, bandwidth, limit
                 )
                 
-                self.after(0, _on_tc_done, cmd_string_for_output, result.output.decode())
+                if result.status == "unchanged":
+                    output_text = f"{eth}: parameters already installed, unchanged"
+                else:
+                    output_text = result.output
+                self.after(0, _on_tc_done, cmd_string_for_output, output_text)
             except Exception as e:
                 self.after(0, _on_tc_error, str(e))
         
         def _on_tc_done(cmd_text, output_text):
-            self.output_box.config(state="normal")
-            self.output_box.insert(tk.END, f"$ {cmd_text}\n{output_text}\n")
-            self.output_box.see(tk.END)
-            self.output_box.config(state="disabled")
+            self._append_console(f"$ {cmd_text}\n{output_text}\n")
         
         def _on_tc_error(error_message):
             messagebox.showerror("TC Error", f"Tc rules could not be applied:\n{error_message}", parent=self)
 
-        threading.Thread(target=do_tc_worker, daemon=True).start()
+        self.controller.task_pool.submit(do_tc_worker)
 
     def do_ping(self):
         r"""
         \brief Utility function to run ping command inside the container.
 
-        This fuction retrieves the parameters from the entry box, validates them,
+        This fuction retrieves the parameters from the entry boxes, validates them,
         and then performs the ping command inside the Docker container using docker_ops.
-        It also handles displaying the output or any errors in the console area.
-        Ping command is executed in a separate thread to keep the UI responsive.
+        Replies are streamed into the console while ping is running: the worker (a thread
+        of its own, a ping can last minutes and must not hold a worker of the shared
+        task pool) queues the output lines and _drain_ping_output moves them into
+        the console at most every PING_REFRESH_MS, whatever the ping rate.
+        The Stop button interrupts the ping.
 
         \return None
         """
@@ -425,29 +541,88 @@ class NodeWindow(tk.Toplevel):
             messagebox.showerror("Error", f'"{ipaddr}" is not a valid IP.', parent=self)
             return
 
+        count = self.ping_count_spinbox.get()
+        if not count.isdigit() or int(count) <= 0:
+            messagebox.showwarning("Input Error", "Count must be a positive integer.", parent=self)
+            return
+        try:
+            interval = float(self.ping_interval_spinbox.get())
+            if interval <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showwarning("Input Error", "Interval must be a positive number.", parent=self)
+            return
+
         self.ping_btn.config(text="Pinging...", state="disabled")
-        cmd_string_for_output = f"ping -c 4 {ipaddr}"
+        self.stop_ping_btn.config(state="normal")
+        self._ping_stop_requested = False
+        self._append_console(f"$ {docker_ops.ping_command(ipaddr, count, interval)}\n")
+
+        lines = queue.Queue()
 
         def do_ping_worker():
             try:
-                result = docker_ops.run_container_ping(
+                ping_exec = docker_ops.stream_container_ping(
                     self.controller.client,
                     self.container_name, 
-                    ipaddr
+                    ipaddr, int(count), interval
                 )
-                self.after(0, _on_ping_done, cmd_string_for_output, result.output.decode())
+                self._ping_exec = ping_exec
+                if self._ping_stop_requested:
+                    ping_exec.stop()
+                for line in ping_exec.lines():
+                    lines.put(line)
             except Exception as e:
-                self.after(0, _on_ping_error, str(e))
-        
-        def _on_ping_done(cmd_text, output_text):
-            self.output_box.config(state="normal")
-            self.output_box.insert(tk.END, f"$ {cmd_text}\n{output_text}\n")
-            self.output_box.see(tk.END)
-            self.output_box.config(state="disabled")
-            self.ping_btn.config(text="Ping", state="normal")
-        
-        def _on_ping_error(error_message):
-            messagebox.showerror("Errore Ping", f"Impossibile eseguire il ping:\n{error_message}", parent=self)
+                lines.put(e)
+            finally:
+                self._ping_exec = None
+                lines.put(None) # end of output
+
+        threading.Thread(target=do_ping_worker, name=f"ping-{self.container_name}", daemon=True).start()
+        self.after(self.PING_REFRESH_MS, self._drain_ping_output, lines)
+
+    def _drain_ping_output(self, lines):
+        try:
+            if not self.winfo_exists():
+                return
+        except tk.TclError:
+            return
+
+        text, error, done = [], None, False
+        while not done:
+            try:
+                item = lines.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                done = True
+            elif isinstance(item, Exception):
+                error = item
+            else:
+                text.append(item)
+
+        if text:
+            self._append_console("\n".join(text) + "\n")
+        if error:
+            messagebox.showerror("Errore Ping", f"Impossibile eseguire il ping:\n{error}", parent=self)
+
+        if done:
+            self._append_console("\n")
             self.ping_btn.config(text="Ping", state="normal")
+            self.stop_ping_btn.config(state="disabled")
+        else:
+            self.after(self.PING_REFRESH_MS, self._drain_ping_output, lines)
 
-        threading.Thread(target=do_ping_worker, daemon=True).start()
\ No newline at end of file
+    def stop_ping(self):
+        r"""
+        \brief Utility function to interrupt the running ping, if any.
+
+        \return None
+        """
+        self._ping_stop_requested = True
+        ping_exec = self._ping_exec
+        if ping_exec is not None:
+            self.stop_ping_btn.config(state="disabled")
+            # killing the ping is an exec itself, keep it off the Tk thread (and
+            # off the task pool, which may be full of queued operations)
+            threading.Thread(target=ping_exec.stop, name="ping-stop", daemon=True).start()
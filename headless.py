@@ -0,0 +1,114 @@
+r"""
+\file headless.py
+
+\brief Headless batch mode: apply the saved emulator configs without any GUI
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+"""
+
+import json, sys
+from pathlib import Path
+
+import docker
+
+# Only GUI-free modules: tkinter, PIL and sv_ttk are never imported here
+import core.config_manager as config_manager
+from core import docker_ops, system_ops
+
+def apply_saved(compose_file, max_workers=8, compose_up=True, as_json=False):
+    r"""
+    \brief Bring the project up and push every saved tc config to its container
+
+    Runs `compose up -d` (unless disabled), loads every `*_config.json` saved for the
+    project and applies all the rules in parallel, one `tc -batch` exec per container.
+    A per-link report is printed on stdout, as text or JSON.
+
+    \param compose_file (Path or str) Path of the project .yml/.yaml file
+
+    \param max_workers (int) Containers configured at the same time
+
+    \param compose_up (bool) Run `compose up -d` first
+
+    \param as_json (bool) Print the report as JSON
+
+    \return (int) Exit code: 0 success, 1 some link failed, 2 the project could not be set up
+    """
+    compose_file = Path(compose_file).resolve()
+    if not compose_file.is_file():
+        print(f"Error: {compose_file} does not exist", file=sys.stderr)
+        return 2
+    project_name = compose_file.parent.name.lower()
+
+    try:
+        if compose_up:
+            # compose progress goes to stderr, stdout only carries the report
+            system_ops.exec_compose(compose_file, on_line=lambda line: print(line, file=sys.stderr))
+        client = docker.from_env()
+        containers = {c.name: c for c in docker_ops.list_project_containers(client, project_name)}
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    saved = config_manager.load_project_configs(project_name)
+    plan, report = {}, []
+    for name, rules in saved.items():
+        container = containers.get(name)
+        if container is None or container.state != "running":
+            reason = "no such container" if container is None else f"container {container.state}"
+            report += [{"container": name, "interface": eth, "status": "skipped", "output": reason} for eth in rules]
+        else:
+            plan[name] = rules
+
+    results = docker_ops.apply_tc_bulk(client, plan, max_workers=max_workers) if plan else {}
+    for name, iface_results in results.items():
+        report += [{"container": name, "interface": r.interface, "status": r.status, "output": r.output.strip()}
+                   for r in iface_results.values()]
+    report.sort(key=lambda link: (link["container"], link["interface"]))
+
+    counts = {status: sum(1 for link in report if link["status"] == status)
+              for status in ("applied", "unchanged", "failed", "skipped")}
+    if as_json:
+        print(json.dumps({"project": project_name, "summary": counts, "links": report}, indent=2))
+    else:
+        if not saved:
+            print(f"No saved configs for project '{project_name}'")
+        width = max([len(link["container"]) for link in report] + [9])
+        for link in report:
+            line = f"{link['container']:<{width}}  {link['interface']:<8}  {link['status']}"
+            if link["status"] in ("failed", "skipped") and link["output"]:
+                line += f"  ({link['output']})"
+            print(line)
+        print(f"{len(report)} links on {len(saved)} containers: " +
+              ", ".join(f"{count} {status}" for status, count in counts.items()))
+
+    client.close()
+    return 1 if counts["failed"] else 0
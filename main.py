@@ -35,13 +35,40 @@ r"""
 | 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
 """
 
-import tkinter as tk
+import argparse
 import sys
 
- # Import application class
-from app import DTGApp
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="DTG (DTN Testbed GUI)")
+    parser.add_argument("--project", help="compose file of the project (.yml/.yaml)")
+    parser.add_argument("--apply-saved", action="store_true",
+                        help="headless: apply the saved tc configs of the project and exit")
+    parser.add_argument("--no-compose", action="store_true",
+                        help="headless: do not run 'compose up -d' first")
+    parser.add_argument("--workers", type=int, default=8,
+                        help="headless: containers configured at the same time")
+    parser.add_argument("--json", action="store_true", help="headless: print the report as JSON")
+    args = parser.parse_args(argv)
+    if args.apply_saved and not args.project:
+        parser.error("--apply-saved requires --project")
+    if args.project and not args.apply_saved:
+        parser.error("--project is only supported together with --apply-saved")
+    return args
 
 if __name__ == "__main__": # main entry point
+    args = parse_args(sys.argv[1:])
+
+    if args.apply_saved:
+        # Headless mode: no Tk, PIL or sv_ttk import at all
+        from headless import apply_saved
+        sys.exit(apply_saved(args.project, max_workers=max(1, args.workers),
+                             compose_up=not args.no_compose, as_json=args.json))
+
+    import tkinter as tk
+
+    # Import application class
+    from app import DTGApp
+
     try:
         root = tk.Tk()
         app = DTGApp(root) # CREATE app istance
@@ -54,4 +81,4 @@ if __name__ == "__main__": # main entry point
             tk.messagebox.showerror("Fatal Error", f"Application will close.\n\n{e}")
         except:
             pass
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
@@ -0,0 +1,268 @@
+r"""
+\file utils/instrumentation.py
+
+\brief Low overhead latency histograms of every Docker operation
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+"""
+
+import csv, functools, inspect, json, math, re, threading, time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+class Histogram:
+    r"""
+    \brief Log-bucketed latency histogram
+
+    Buckets grow by 10% starting from 10 µs, so any percentile is known within
+    10% with a few dozen integers per operation, whatever the number of samples.
+    """
+    BASE = 1e-5
+    RATIO = 1.1
+    __slots__ = ("count", "errors", "total", "min", "max", "payload", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.payload = 0
+        self.buckets: Dict[int, int] = {}
+
+    def add(self, seconds: float, ok: bool, size: int):
+        self.count += 1
+        self.errors += not ok
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        self.payload += size
+        index = int(math.log(seconds / self.BASE, self.RATIO)) if seconds > self.BASE else 0
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def percentile(self, q: float) -> float:
+        r"""
+        \brief Upper bound of the bucket holding the q-th percentile, in seconds (q in 0..100)
+        """
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * q / 100) or 1
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self.BASE * self.RATIO ** (index + 1), self.max)
+        return self.max
+
+class Instrumentation:
+    r"""
+    \brief Registry of the latency, outcome and payload size of every instrumented call
+
+    Each call is recorded twice: once under its operation and once under
+    (operation, container), so questions like "p99 of apply_tc_rules on node7"
+    are answered from memory. Recording costs two perf_counter calls and a dict
+    update under a lock.
+    """
+
+    def __init__(self):
+        self.enabled = True
+        self.started = time.time()
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, container: Optional[str], seconds: float, ok: bool = True, size: int = 0):
+        if not self.enabled:
+            return
+        with self._lock:
+            keys = ((operation, ""), (operation, container)) if container else ((operation, ""),)
+            for key in keys:
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = Histogram()
+                histogram.add(seconds, ok, size)
+
+    @contextmanager
+    def span(self, operation: str, container: Optional[str] = None):
+        r"""
+        \brief Record the duration of a block, e.g. `with INSTRUMENTATION.span("gui.open_node_window", name):`
+        """
+        start = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.record(operation, container, time.perf_counter() - start, ok)
+
+    def wrap(self, fn: Callable, operation: str) -> Callable:
+        r"""
+        \brief Instrumented version of `fn`
+
+        The container is taken from the `container_id`/`container_name` argument,
+        if the function has one.
+        """
+        params = list(inspect.signature(fn).parameters)
+        container_index = next((i for i, p in enumerate(params) if p in ("container_id", "container_name")), None)
+        container_param = params[container_index] if container_index is not None else None
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            container = None
+            if container_param is not None:
+                container = kwargs.get(container_param)
+                if container is None and len(args) > container_index:
+                    container = args[container_index]
+            start = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception:
+                self.record(operation, container, time.perf_counter() - start, False)
+                raise
+            # e.g. a TcResult reporting a failed tc command
+            ok = getattr(result, "status", None) != "failed"
+            self.record(operation, container, time.perf_counter() - start, ok, payload_size(result))
+            return result
+
+        wrapper.__wrapped_operation__ = operation
+        return wrapper
+
+    def instrument_module(self, module, prefix: str, extra: Tuple[str, ...] = (), exclude: Tuple[str, ...] = ()):
+        r"""
+        \brief Replace every public function of a module (plus `extra` private ones, minus `exclude`) with its instrumented version
+
+        Calls made through the module attribute (`docker_ops.apply_tc_rules(...)`),
+        including the ones between functions of the same module, are recorded.
+        """
+        for name, fn in list(vars(module).items()):
+            if not inspect.isfunction(fn) or fn.__module__ != module.__name__:
+                continue
+            if (name.startswith("_") and name not in extra) or name in exclude:
+                continue
+            if hasattr(fn, "__wrapped_operation__"):
+                continue
+            setattr(module, name, self.wrap(fn, f"{prefix}.{name.lstrip('_')}"))
+
+    def instrument_client(self, client):
+        r"""
+        \brief Record every HTTP request sent to the Docker daemon by a docker-py client
+
+        Requests are grouped by method and endpoint, ids being replaced by `{id}`,
+        e.g. "api.POST /containers/{id}/exec". The payload is the response Content-Length.
+        """
+        api = client.api
+        if getattr(api, "_instrumented", False):
+            return
+        send = api.request
+
+        @functools.wraps(send)
+        def request(method, url, *args, **kwargs):
+            endpoint = _ENDPOINT_ID.sub("/{id}", re.sub(r"^.*?/v[\d.]+", "", url.split("?")[0]))
+            start = time.perf_counter()
+            try:
+                response = send(method, url, *args, **kwargs)
+            except Exception:
+                self.record(f"api.{method} {endpoint}", None, time.perf_counter() - start, False)
+                raise
+            size = int(response.headers.get("Content-Length") or 0)
+            self.record(f"api.{method} {endpoint}", None, time.perf_counter() - start, response.status_code < 400, size)
+            return response
+
+        api.request = request
+        api._instrumented = True
+
+    def rows(self, container: str = "") -> List[dict]:
+        r"""
+        \brief Summary of every operation, overall (container "") or for one container
+
+        \return (list) One dict per operation, latencies in milliseconds
+        """
+        with self._lock:
+            items = [(op, c, h) for (op, c), h in self._histograms.items() if c == container]
+            return [{
+                "operation": op, "container": c or "*", "count": h.count, "errors": h.errors,
+                "mean_ms": round(h.total / h.count * 1000, 3),
+                "p50_ms": round(h.percentile(50) * 1000, 3), "p95_ms": round(h.percentile(95) * 1000, 3),
+                "p99_ms": round(h.percentile(99) * 1000, 3), "max_ms": round(h.max * 1000, 3),
+                "payload": h.payload,
+            } for op, c, h in sorted(items)]
+
+    def containers(self) -> List[str]:
+        with self._lock:
+            return sorted({c for _, c in self._histograms if c})
+
+    def percentile(self, operation: str, q: float, container: str = "") -> Optional[float]:
+        r"""
+        \brief q-th percentile of an operation in seconds, None if it was never recorded
+        """
+        with self._lock:
+            histogram = self._histograms.get((operation, container))
+            return histogram.percentile(q) if histogram else None
+
+    def export(self, path: str):
+        r"""
+        \brief Write every histogram summary (overall and per container) to a .json or .csv file
+        """
+        rows = [row for container in [""] + self.containers() for row in self.rows(container)]
+        if str(path).lower().endswith(".csv"):
+            with open(path, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=list(rows[0]) if rows else ["operation"])
+                writer.writeheader()
+                writer.writerows(rows)
+        else:
+            with open(path, "w") as f:
+                json.dump({"started": self.started, "exported": time.time(), "operations": rows}, f, indent=2)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self.started = time.time()
+
+def payload_size(result) -> int:
+    r"""
+    \brief Size of a call result: bytes of an output, number of items of a collection
+    """
+    if isinstance(result, (bytes, str)):
+        return len(result)
+    output = getattr(result, "output", None)
+    if isinstance(output, (bytes, str)):
+        return len(output)
+    if isinstance(result, tuple) and len(result) == 2 and isinstance(result[1], (bytes, str)):
+        return len(result[1])
+    if isinstance(result, (list, dict, set)):
+        return len(result)
+    return 0
+
+# Hex ids (containers, execs) and container names in API paths
+_ENDPOINT_ID = re.compile(r"/(?:[0-9a-f]{12,64}(?=/|$)|(?<=/containers/)[^/]+(?=/))")
+
+# Shared by the whole application
+INSTRUMENTATION = Instrumentation()
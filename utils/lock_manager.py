@@ -35,31 +35,186 @@ r"""
 | 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
 """
 
+import threading
+from collections import deque
+from concurrent.futures import CancelledError, Future
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
 class OperationLock:
     r"""
     \brief Manager used to handle concurrency and operation locks on containers
 
     The OperationLock prevents race conditions and conflictual action on containers
     by ensuring that only one operation (start, stop, restart) can be performed 
-    at a time on a specific container.
+    at a time on a specific container. It is safe to use from any thread.
+
+    Operations submitted through run() while the container is busy are queued and
+    started, in order, as soon as the running one completes: a stop requested
+    during a start runs right after it. Every operation has its own Future, and
+    idle_future()/wait_idle() tell when a container (or every container) has
+    nothing running nor queued, so sequences of operations need no polling.
     """
     
     def __init__(self):
-        self._locks = {}
+        self._cond = threading.Condition()
+        self._running: Dict[str, str] = {}  # container id -> running operation
+        self._queues: Dict[str, Deque[Tuple[str, Callable[[], Future], Future]]] = {}
+        self._idle_waiters: Dict[Optional[str], List[Future]] = {}  # None waits for every container
 
     def lock(self, container_id, op):
-        if self._locks.get(container_id, {}).get("running", False):
-            return False # already locked
-        
-        self._locks[container_id] = {"running": True, "operation": op}
-        return True
+        r"""
+        \brief Take the lock of a container for an operation run by the caller, without queueing
+
+        \return (bool) False if the container is busy (running or queued operations)
+        """
+        with self._cond:
+            if container_id in self._running or container_id in self._queues:
+                return False # already locked
+            self._running[container_id] = op
+            return True
 
     def unlock(self, container_id):
-        self._locks[container_id] = {"running": False, "operation": None}
+        r"""
+        \brief Release the lock of a container, starting its next queued operation if any
+        """
+        job = self._release(container_id)
+        if job is not None:
+            self._launch(container_id, *job)
+
+    def _release(self, container_id):
+        # Unlock and hand the lock to the next queued job, returned to the caller to be launched
+        with self._cond:
+            self._running.pop(container_id, None)
+            job = self._next_locked(container_id)
+            idle = self._idle_locked(container_id) if job is None else []
+            self._cond.notify_all()
+        for waiter in idle:
+            waiter.set_result(None)
+        return job
+
+    def run(self, container_id, op, start: Callable[[], Future]) -> Future:
+        r"""
+        \brief Run an operation on a container as soon as the container is free
+
+        \param container_id (str) Id of the container
+        \param op (str) Name of the operation, e.g. "stop"
+        \param start (callable) Called without arguments when it is the operation's turn, possibly
+        on another thread; it must launch the operation and return its Future (e.g. `lambda: pool.submit(fn)`)
+
+        \return (Future) Result of the operation, resolved once the lock is released.
+        Cancelling it while queued drops the operation.
+        """
+        future = Future()
+        with self._cond:
+            self._queues.setdefault(container_id, deque()).append((op, start, future))
+            job = self._next_locked(container_id) if container_id not in self._running else None
+        if job is not None:
+            self._launch(container_id, *job)
+        return future
+
+    def _next_locked(self, container_id):
+        queue = self._queues.get(container_id)
+        if not queue:
+            return None
+        op, start, future = queue.popleft()
+        if not queue:
+            del self._queues[container_id]
+        self._running[container_id] = op
+        return op, start, future
+
+    def _idle_locked(self, container_id):
+        waiters = self._idle_waiters.pop(container_id, [])
+        if not self._running and not self._queues:
+            waiters += self._idle_waiters.pop(None, [])
+        return waiters
+
+    def _launch(self, container_id, op, start, future):
+        # A loop, not a recursion: jobs cancelled while queued, failing to start or
+        # already done hand the lock over to the next one in place, however many there are
+        job = (op, start, future)
+        while job is not None:
+            op, start, future = job
+            if not future.set_running_or_notify_cancel():
+                job = self._release(container_id)  # cancelled while queued
+                continue
+            try:
+                inner = start()
+            except Exception as e:
+                job = self._release(container_id)
+                future.set_exception(e)
+                continue
+            if inner.done():
+                job = self._release(container_id)
+                self._resolve(future, inner)
+                continue
+            job = None
+
+            def on_done(inner, future=future):
+                self.unlock(container_id)
+                self._resolve(future, inner)
+            inner.add_done_callback(on_done)
+
+    @staticmethod
+    def _resolve(future, inner):
+        if inner.cancelled():
+            future.set_exception(CancelledError())
+        elif inner.exception() is not None:
+            future.set_exception(inner.exception())
+        else:
+            future.set_result(inner.result())
 
     def is_locked(self, container_id):
-        return self._locks.get(container_id, {}).get("running", False)
+        r"""
+        \brief True if an operation is running or queued on the container
+        """
+        with self._cond:
+            return container_id in self._running or container_id in self._queues
+
+    def operation(self, container_id) -> Optional[str]:
+        r"""
+        \brief Name of the operation running on the container, None if it is free
+        """
+        with self._cond:
+            return self._running.get(container_id)
+
+    def queued(self, container_id) -> List[str]:
+        r"""
+        \brief Names of the operations waiting for the container, in order
+        """
+        with self._cond:
+            return [op for op, _, _ in self._queues.get(container_id, ())]
     
     # return true if any lock is active
     def has_active_locks(self):
-        return any(v.get("running", False) for v in self._locks.values())
\ No newline at end of file
+        with self._cond:
+            return bool(self._running or self._queues)
+
+    def idle_future(self, container_id=None) -> Future:
+        r"""
+        \brief Future resolved once the container (None: every container) has nothing running nor queued
+
+        Already resolved if it is idle now.
+        """
+        future = Future()
+        with self._cond:
+            busy = (container_id in self._running or container_id in self._queues) if container_id is not None \
+                else bool(self._running or self._queues)
+            if busy:
+                self._idle_waiters.setdefault(container_id, []).append(future)
+        if not busy:
+            future.set_result(None)
+        return future
+
+    def wait_idle(self, container_id=None, timeout: float = None) -> bool:
+        r"""
+        \brief Block until the container (None: every container) has nothing running nor queued
+
+        Must not be called from the thread that would run the pending operations' callbacks (e.g. Tk).
+
+        \return (bool) False on timeout
+        """
+        with self._cond:
+            if container_id is None:
+                return self._cond.wait_for(lambda: not self._running and not self._queues, timeout)
+            return self._cond.wait_for(
+                lambda: container_id not in self._running and container_id not in self._queues, timeout)
@@ -0,0 +1,117 @@
+r"""
+\file utils/refresh_scheduler.py
+
+\brief Coalescing scheduler of the container list refreshes
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+"""
+
+from concurrent.futures import Future
+from typing import Callable, Iterable, Optional, Set
+
+class RefreshScheduler:
+    r"""
+    \brief Coalesces refresh requests of a Tk view and runs the query off the Tk thread
+
+    Requests arriving within `delay_ms` of the first one are merged into a single
+    query: a full request absorbs every targeted one, targeted requests are merged
+    into one set of names. The query runs in the task pool, its result is handed to
+    `apply` on the Tk thread. At most one query is in flight, requests arriving
+    meanwhile are merged into the next one, started when it completes.
+
+    Every method must be called on the Tk thread.
+
+    \param widget (tk.Misc) Any widget, used for its `after` timers
+    \param pool (TaskPool) Pool running the queries
+    \param query (callable) `query(names)` run in the pool, `names` is a set of names or None for everything
+    \param apply (callable) `apply(names, future)` run on the Tk thread with the same `names`
+    and the Future of the query (it may hold an exception)
+    \param delay_ms (int) Coalescing window in milliseconds
+    """
+
+    def __init__(self, widget, pool, query: Callable, apply: Callable, delay_ms: int = 100):
+        self.widget = widget
+        self.pool = pool
+        self.query = query
+        self.apply = apply
+        self.delay_ms = delay_ms
+
+        self._full = False
+        self._names: Set[str] = set()
+        self._timer = None
+        self._in_flight = False
+
+    @property
+    def busy(self) -> bool:
+        r"""
+        \brief True while a refresh is pending or running
+        """
+        return self._in_flight or self._timer is not None
+
+    def request(self, names: Optional[Iterable[str]] = None):
+        r"""
+        \brief Ask for a refresh of some containers (by name) or, with None, of the whole view
+        """
+        if names is None:
+            self._full = True
+        else:
+            self._names.update(names)
+        if self._timer is None and not self._in_flight:
+            self._timer = self.widget.after(self.delay_ms, self._fire)
+
+    def cancel(self):
+        r"""
+        \brief Drop the pending requests, a running query is still applied
+        """
+        if self._timer is not None:
+            self.widget.after_cancel(self._timer)
+            self._timer = None
+        self._full, self._names = False, set()
+
+    def _fire(self):
+        self._timer = None
+        if not self._full and not self._names:
+            return
+        names = None if self._full else self._names
+        self._full, self._names = False, set()
+
+        self._in_flight = True
+        future = self.pool.submit(self.query, names)
+        future.add_done_callback(lambda f: self.widget.after(0, self._done, names, f))
+
+    def _done(self, names, future: Future):
+        self._in_flight = False
+        try:
+            self.apply(names, future)
+        finally:
+            if (self._full or self._names) and self._timer is None:
+                self._timer = self.widget.after(self.delay_ms, self._fire)
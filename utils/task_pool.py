@@ -0,0 +1,149 @@
+r"""
+\file utils/task_pool.py
+
+\brief Bounded worker pool shared by all the asynchronous operations of DTG
+
+\copyright Copyright (c) 2025, Alma Mater Studiorum, University of Bologna, All rights reserved.
+	
+\par License
+
+    This file is part of DTG (DTN Testbed GUI).
+
+    DTG is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    DTG is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with DTG.  If not, see <http://www.gnu.org/licenses/>.
+
+\author Matteo Biancofiore <matteo.biancofiore2@studio.unibo.it>
+\date 13/11/2025
+
+\par Supervisor
+   Carlo Caini <carlo.caini@unibo.it>
+
+
+\par Revision History:
+| Date       |  Author         |   Description
+| ---------- | --------------- | -----------------------------------------------
+| 13/11/2025 | M. Biancofiore  |  Initial implementation for DTG project.
+"""
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, List
+
+class TaskPool:
+    r"""
+    \brief Bounded pool of worker threads used for every blocking Docker operation
+
+    All container operations (start, stop, restart, tc, ping...) are submitted
+    here instead of spawning one thread each, so that mass operations such as
+    "Start All" on hundreds of containers never issue more than `max_workers`
+    concurrent requests to the Docker daemon.
+
+    Every submission returns a `concurrent.futures.Future`: queued work can be
+    cancelled and shutdown can wait for running work to drain.
+
+    Workers are not daemon threads: the process exits only once the running
+    operations end. Only bounded Docker requests belong here. Streaming pings
+    and readiness waits run elsewhere, so a worker is never held for minutes.
+
+    \param max_workers (int) Maximum number of operations running at the same time
+    """
+
+    def __init__(self, max_workers: int = 8):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dtg-worker")
+        self._futures = set()
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        r"""
+        \brief Queue `fn(*args, **kwargs)` for execution
+
+        \return (Future) Future of the operation, can be cancelled while still queued
+
+        \throws RuntimeError If the pool has already been shut down
+        """
+        with self._lock:
+            future = self._executor.submit(fn, *args, **kwargs)
+            self._futures.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    def _discard(self, future):
+        with self._lock:
+            self._futures.discard(future)
+
+    def pending(self) -> List[Future]:
+        r"""
+        \brief Futures that are queued or running
+        """
+        with self._lock:
+            return list(self._futures)
+
+    def cancel_pending(self) -> int:
+        r"""
+        \brief Cancel every operation that has not started yet
+
+        \return (int) Number of cancelled operations
+        """
+        return sum(1 for future in self.pending() if future.cancel())
+
+    def wait_all(self, timeout: float = None) -> bool:
+        r"""
+        \brief Wait for every queued and running operation to complete
+
+        \param timeout (float) Maximum number of seconds to wait, None waits forever
+
+        \return (bool) True if everything completed, False on timeout
+        """
+        _, not_done = wait(self.pending(), timeout=timeout)
+        return not not_done
+
+    def shutdown(self, timeout: float = None, cancel_pending: bool = True) -> bool:
+        r"""
+        \brief Stop accepting work and wait for running operations to drain
+
+        \param timeout (float) Maximum number of seconds to wait, None waits forever
+        \param cancel_pending (bool) Cancel queued operations instead of running them
+
+        \return (bool) True if everything completed, False on timeout
+        """
+        if cancel_pending:
+            self.cancel_pending()
+        drained = self.wait_all(timeout)
+        self._executor.shutdown(wait=False, cancel_futures=cancel_pending)
+        return drained
+
+def when_all(futures: Iterable[Future], callback: Callable[[List[Future]], None]):
+    r"""
+    \brief Invoke `callback(futures)` once every future is done
+
+    The callback runs in the thread that completes the last future (or immediately
+    if there is nothing to wait for), so it must not touch Tk widgets directly.
+    No pool worker is blocked while waiting.
+    """
+    futures = list(futures)
+    if not futures:
+        callback(futures)
+        return
+
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def on_done(_):
+        with lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            callback(futures)
+
+    for future in futures:
+        future.add_done_callback(on_done)